@@ -5,82 +5,350 @@ This module provides a wrapper around the Binance API with proper authentication
 rate limiting, error handling, and retry logic.
 """
 
+import re
 import time
+import heapq
 import hmac
 import hashlib
+import threading
+from collections import deque, OrderedDict
+from itertools import islice
 import requests
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Any, Tuple, Type, Callable, Iterator
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urlencode
 import logging
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import asyncio
+import functools
+import copy
 
 from ..config.settings import Config
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    import json
+    _json_loads = json.loads
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed for AsyncBinanceClient
+    aiohttp = None
+
 
-@dataclass
 class APIError(Exception):
     """Custom exception for Binance API errors."""
-    code: int
-    message: str
+    
+    def __init__(self, code: int, message: str):
+        super().__init__(code, message)
+        self.code = code
+        self.message = message
     
     def __str__(self):
         return f"Binance API Error {self.code}: {self.message}"
 
 
-@dataclass
 class RateLimitError(APIError):
     """Exception for rate limit errors."""
-    retry_after: Optional[int] = None
+    
+    def __init__(self, code: int, message: str, retry_after: Optional[int] = None):
+        super().__init__(code, message)
+        self.retry_after = retry_after
 
 
-@dataclass
 class AuthenticationError(APIError):
     """Exception for authentication errors."""
     pass
 
 
-@dataclass
 class InsufficientPermissionsError(APIError):
     """Exception for insufficient API permissions."""
     pass
 
 
-@dataclass
 class NetworkError(APIError):
     """Exception for network-related errors."""
     pass
 
 
-@dataclass
 class ServerError(APIError):
     """Exception for server-side errors."""
     pass
 
 
-@dataclass
 class InvalidSymbolError(APIError):
     """Exception for invalid trading symbol errors."""
-    symbol: Optional[str] = None
+    
+    def __init__(self, code: int, message: str, symbol: Optional[str] = None):
+        super().__init__(code, message)
+        self.symbol = symbol
 
 
-@dataclass
 class InvalidParameterError(APIError):
     """Exception for invalid parameter errors."""
-    parameter: Optional[str] = None
+    
+    def __init__(self, code: int, message: str, parameter: Optional[str] = None):
+        super().__init__(code, message)
+        self.parameter = parameter
 
 
-@dataclass
 class OrderNotFoundError(APIError):
     """Exception for order not found errors."""
-    order_id: Optional[str] = None
+    
+    def __init__(self, code: int, message: str, order_id: Optional[str] = None):
+        super().__init__(code, message)
+        self.order_id = order_id
 
 
-@dataclass
 class InsufficientBalanceError(APIError):
     """Exception for insufficient balance errors."""
-    asset: Optional[str] = None
+    
+    def __init__(self, code: int, message: str, asset: Optional[str] = None):
+        super().__init__(code, message)
+        self.asset = asset
+
+
+# Binance error code -> (exception class, message prefix)
+_ERROR_TABLE: Dict[int, Tuple[Type[APIError], str]] = {
+    -1000: (ServerError, "Unknown error"),
+    -1001: (ServerError, "Internal error"),
+    -1002: (AuthenticationError, "Unauthorized"),
+    -1003: (RateLimitError, "Rate limit exceeded"),
+    -1006: (ServerError, "Unexpected response"),
+    -1007: (ServerError, "Timeout"),
+    -1013: (InvalidParameterError, "Invalid quantity"),
+    -1014: (InvalidSymbolError, "Unknown order composition"),
+    -1015: (RateLimitError, "Too many orders"),
+    -1016: (ServerError, "Service shutting down"),
+    -1020: (InvalidParameterError, "Unsupported operation"),
+    -1021: (AuthenticationError, "Timestamp outside recv window"),
+    -1022: (AuthenticationError, "Invalid signature"),
+    -1100: (InvalidParameterError, "Illegal characters"),
+    -1101: (InvalidParameterError, "Too many parameters"),
+    -1102: (InvalidParameterError, "Mandatory parameter missing"),
+    -1103: (InvalidParameterError, "Unknown parameter"),
+    -1104: (InvalidParameterError, "Duplicate parameters"),
+    -1105: (InvalidParameterError, "Invalid parameter"),
+    -1106: (InvalidParameterError, "Invalid parameter combination"),
+    -1111: (InvalidParameterError, "Invalid precision"),
+    -1112: (InvalidParameterError, "No orders on book"),
+    -1114: (InvalidParameterError, "Invalid time in force"),
+    -1115: (InvalidParameterError, "Invalid order type"),
+    -1116: (InvalidParameterError, "Invalid side"),
+    -1117: (InvalidParameterError, "Invalid new client order ID"),
+    -1118: (InvalidParameterError, "Invalid original client order ID"),
+    -1119: (InvalidParameterError, "Invalid interval"),
+    -1120: (InvalidSymbolError, "Invalid symbol"),
+    -1121: (InvalidSymbolError, "Invalid listen key"),
+    -1125: (InvalidParameterError, "Invalid listen key"),
+    -1127: (InvalidParameterError, "Invalid lookup interval"),
+    -1128: (InvalidParameterError, "Combination of optional parameters invalid"),
+    -1130: (InvalidParameterError, "Invalid data sent"),
+    -2010: (OrderNotFoundError, "Order not found"),
+    -2011: (InvalidParameterError, "Order cancelled"),
+    -2013: (OrderNotFoundError, "Order does not exist"),
+    -2014: (AuthenticationError, "API key format invalid"),
+    -2015: (InsufficientPermissionsError, "Invalid API key permissions"),
+    -2016: (ServerError, "No trading window"),
+    -2018: (InsufficientBalanceError, "Balance insufficient"),
+    -2019: (InvalidParameterError, "Margin insufficient"),
+    -2020: (InvalidParameterError, "Unable to fill"),
+    -2021: (InvalidParameterError, "Order would immediately trigger"),
+    -2022: (InvalidParameterError, "Reduce only order type not supported"),
+    -2023: (InvalidParameterError, "User in liquidation mode"),
+    -2024: (InvalidParameterError, "Position side does not match"),
+    -2025: (InvalidParameterError, "Reduce only conflict"),
+}
+
+# Error codes whose response may carry a Retry-After header
+_RETRY_AFTER_CODES = {-1003, -1015}
+
+# Minimum rate-limit wait worth sleeping for, in seconds
+_MIN_SLEEP = 1e-3
+
+# Binance request weight budget: 1200 weight per rolling minute
+_WEIGHT_LIMIT = 1200
+_WEIGHT_WINDOW = 60.0
+
+# Request weight per endpoint; unlisted endpoints cost 1
+_ENDPOINT_WEIGHTS: Dict[str, int] = {
+    '/api/v3/account': 20,
+    '/api/v3/myTrades': 20,
+    '/api/v3/exchangeInfo': 20,
+    '/sapi/v1/asset/assetDividend': 10,
+}
 
+# Response cache bounds; trade pages are only cached long enough to
+# deduplicate accidental double fetches
+_RESPONSE_CACHE_SIZE = 512
+_TRADES_CACHE_TTL = 5.0
+
+# Transaction types returned by get_all_transactions, in fetch order:
+# (result key, fetcher method, takes a limit, log description, failure label)
+_TRANSACTION_TYPES: Tuple[Tuple[str, str, bool, str, str], ...] = (
+    ('trades', 'get_trades', True, 'trades', 'trades'),
+    ('deposits', 'get_deposits', True, 'deposits', 'deposits'),
+    ('withdrawals', 'get_withdrawals', True, 'withdrawals', 'withdrawals'),
+    ('dust_conversions', 'get_dust_log', False, 'dust conversions', 'dust conversions'),
+    ('dividends', 'get_asset_dividend_record', True, 'dividend records', 'dividends'),
+    ('transfers', 'get_universal_transfer_history', True, 'transfer records', 'transfers'),
+)
+
+# get_all_transactions result cache; ranges that ended over an hour ago are
+# settled history and are kept longer than ranges still receiving transactions
+_TRANSACTIONS_CACHE_SIZE = 64
+_TRANSACTIONS_CACHE_TTL = 300.0
+_SETTLED_TRANSACTIONS_CACHE_TTL = 6 * 3600.0
+_SETTLED_AFTER_MS = 3600 * 1000
+
+# Shared pool for the per-type fetches of get_all_transactions. Kept apart
+# from each client's per-symbol pool, which get_trades submits to from here.
+_TRANSACTION_EXECUTOR = ThreadPoolExecutor(max_workers=len(_TRANSACTION_TYPES),
+                                           thread_name_prefix='binance-transactions')
+
+# Characters that urlencode leaves untouched, matched with fullmatch
+_SAFE_QUERY_VALUE = re.compile(r'[A-Za-z0-9_.-]+')
+
+
+def _build_query_string(params: Dict[str, Any]) -> str:
+    """
+    Build a query string, skipping urlencode when no escaping is needed.
+    
+    Binance parameters are almost always integers or plain symbols, which can
+    be joined directly; anything else falls back to urlencode.
+    
+    Args:
+        params: Query parameters
+        
+    Returns:
+        Encoded query string
+    """
+    for key, value in params.items():
+        if not _SAFE_QUERY_VALUE.fullmatch(key):
+            return urlencode(params)
+        if isinstance(value, int) or (isinstance(value, str) and _SAFE_QUERY_VALUE.fullmatch(value)):
+            continue
+        return urlencode(params)
+    return '&'.join(f'{key}={value}' for key, value in params.items())
+
+
+def _nonzero_balance(amount: str) -> bool:
+    """
+    Check whether a Binance balance string such as "0.00000000" is non-zero.
+    
+    Most balances on an account are zero dust entries; stripping the zero
+    and dot characters runs in C and avoids a float() parse for each of them.
+    
+    Args:
+        amount: Decimal amount as returned by the API
+        
+    Returns:
+        True if the amount contains a non-zero digit
+    """
+    return bool(amount.strip('0.'))
+
+
+class _PartialTrades(list):
+    """Trades merged while some symbols failed; never cached as a complete answer."""
+
+
+def _symbol_has_no_trades(error: Exception) -> bool:
+    """Check whether a per-symbol trade error only means there is nothing to fetch."""
+    return (isinstance(error, InvalidSymbolError)
+            or (isinstance(error, InvalidParameterError) and error.code == -1102))
+
+
+def _is_complete(transactions: Dict[str, List[Dict[str, Any]]], errors: List[Any]) -> bool:
+    """Check whether a get_all_transactions result may be cached."""
+    return not errors and not any(isinstance(records, _PartialTrades) for records in transactions.values())
+
+
+def _copy_trades(trades: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copy trade records served from the response cache; each record is a flat dict."""
+    return trades.__class__(dict(trade) for trade in trades)
+
+
+def _assets_with_balance(account_info: Dict[str, Any]) -> frozenset:
+    """
+    Get the assets with a non-zero free or locked balance.
+    
+    Args:
+        account_info: Account information payload
+        
+    Returns:
+        Frozenset of asset symbols
+    """
+    return frozenset(
+        balance['asset'] for balance in account_info.get('balances', [])
+        if _nonzero_balance(balance['free']) or _nonzero_balance(balance['locked'])
+    )
+
+
+def _next_offset(params: Dict[str, Any], page: List[Dict[str, Any]]) -> None:
+    """Advance an offset-paginated history query past the given page."""
+    params['offset'] = params.get('offset', 0) + len(page)
+
+
+def _next_current_page(params: Dict[str, Any], page: List[Dict[str, Any]]) -> None:
+    """Advance a page-number-paginated history query to the next page."""
+    params['current'] = params.get('current', 1) + 1
+
+
+class _DividendPager:
+    """
+    Walk a dividend query (returned newest first) back in time.
+    
+    One distribution credits many assets at the same divTime, so the next
+    page ends at the oldest time of the current one rather than before it,
+    and the records already yielded at that time are dropped from it.
+    """
+    
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        # Records of the last page at its oldest divTime
+        self._seen: List[Dict[str, Any]] = []
+    
+    def drop_seen(self, page: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Remove the records already yielded from a page."""
+        seen = self._seen
+        return [record for record in page if record not in seen] if seen else page
+    
+    def advance(self, params: Dict[str, Any], page: List[Dict[str, Any]]) -> None:
+        """Narrow the query to records at or before the oldest time of the page."""
+        oldest = min(record['divTime'] for record in page)
+        if params.get('endTime') == oldest and all(record['divTime'] == oldest for record in page):
+            # The same full page would come back; only stepping past its time makes progress
+            self.logger.warning("More than %d dividends at divTime %d, some may be missing", len(page), oldest)
+            params['endTime'] = oldest - 1
+            self._seen = []
+        else:
+            params['endTime'] = oldest
+            self._seen = [record for record in page if record['divTime'] == oldest]
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_milliseconds(value: datetime) -> int:
+    """
+    Convert a datetime to epoch milliseconds using integer arithmetic.
+    
+    Naive datetimes are taken as local time, like datetime.timestamp(), but
+    without the float round trip that can shift range bounds by a millisecond.
+    
+    Args:
+        value: Datetime to convert
+        
+    Returns:
+        Milliseconds since the Unix epoch
+    """
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - _EPOCH) // timedelta(milliseconds=1)
 
 class BinanceClient:
     """
@@ -99,6 +367,7 @@ class BinanceClient:
         self.timeout = config.api.timeout
         self.max_retries = config.api.max_retries
         self.rate_limit_delay = config.api.rate_limit_delay
+        self.max_concurrent = config.api.max_concurrent
         
         # Get API credentials
         try:
@@ -106,17 +375,54 @@ class BinanceClient:
         except ValueError as e:
             raise AuthenticationError(code=0, message=str(e))
         
+        # Keyed HMAC prototype, copied per request to skip the key setup
+        self._hmac_prototype = hmac.new(self.secret_key.encode('utf-8'), b'', hashlib.sha256)
+        
         # Initialize session
         self.session = requests.Session()
         self.session.headers.update({
             'X-MBX-APIKEY': self.api_key,
-            'Content-Type': 'application/json'
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
         })
         
-        # Rate limiting
+        # One keep-alive pool (the client only talks to base_url) sized for the
+        # concurrent workers; retries are handled by _make_request, so
+        # urllib3-level retries stay disabled
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_concurrent,
+            max_retries=Retry(total=0)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Rate limiting (last_request_time is on the monotonic clock)
         self.last_request_time = 0
         self.request_count = 0
         self.weight_used = 0
+        self._rate_limit_lock = threading.Lock()
+        self._weight_window: deque = deque()  # (monotonic slot, weight), oldest first
+        self._window_weight = 0
+        self._request_slots = threading.BoundedSemaphore(self.max_concurrent)
+        
+        # Worker pool for concurrent per-symbol requests
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent)
+        
+        # Response caches for the heavy symbol-discovery calls: (monotonic time, data)
+        self._exchange_info_ttl = 600
+        self._account_info_ttl = 30
+        self._exchange_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._account_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._relevant_symbols_cache: Dict[frozenset, List[str]] = {}
+        self._response_cache: Dict[tuple, Tuple[float, Any]] = {}  # key -> (monotonic expiry, data)
+        self._response_cache_lock = threading.Lock()
+        
+        # get_all_transactions results by (start_time, end_time, limit_per_type),
+        # least recently used first: key -> (monotonic expiry, transactions)
+        self._transactions_cache: OrderedDict = OrderedDict()
+        self._transactions_cache_hits = 0
+        self._transactions_cache_misses = 0
         
         # Logger
         self.logger = logging.getLogger(__name__)
@@ -131,23 +437,96 @@ class BinanceClient:
         Returns:
             HMAC signature
         """
-        return hmac.new(
-            self.secret_key.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        signer = self._hmac_prototype.copy()
+        signer.update(query_string.encode('utf-8'))
+        return signer.hexdigest()
+    
+    def _signed_url(self, endpoint: str, params: Optional[Dict] = None) -> str:
+        """
+        Build a signed request URL with a fresh timestamp.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (not modified)
+            
+        Returns:
+            Full URL including timestamp and signature
+        """
+        request_params = dict(params) if params else {}
+        request_params['timestamp'] = int(time.time() * 1000)
+        query_string = _build_query_string(request_params)
+        return f"{self.base_url}{endpoint}?{query_string}&signature={self._generate_signature(query_string)}"
+    
+    def _reserve_request_slot(self, weight: int = 1) -> float:
+        """
+        Reserve the next request slot under the rate limits.
+        
+        Requests are spaced by ``rate_limit_delay`` and must fit in the rolling
+        one-minute weight budget; when the budget is exhausted the slot is
+        pushed back until enough of the oldest weight has left the window.
+        
+        Thread-safe: the reservation is made under the lock, and the caller
+        waits outside of it so concurrent workers do not serialize on the wait.
+        
+        Args:
+            weight: Request weight of the endpoint being called
+            
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._rate_limit_lock:
+            current_time = time.monotonic()
+            window = self._weight_window
+            while window and window[0][0] <= current_time - _WEIGHT_WINDOW:
+                self._window_weight -= window.popleft()[1]
+            
+            next_slot = max(current_time, self.last_request_time + self.rate_limit_delay)
+            
+            # Wait for enough of the oldest weight to expire from the window
+            excess = self._window_weight + weight - _WEIGHT_LIMIT
+            for slot, slot_weight in window:
+                if excess <= 0:
+                    break
+                next_slot = max(next_slot, slot + _WEIGHT_WINDOW)
+                excess -= slot_weight
+            
+            window.append((next_slot, weight))
+            self._window_weight += weight
+            self.last_request_time = next_slot
+        
+        return next_slot - current_time
     
-    def _apply_rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _apply_rate_limit(self, weight: int = 1) -> None:
+        """
+        Apply rate limiting before a request.
         
-        if time_since_last < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last
-            self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+        Args:
+            weight: Request weight of the endpoint being called
+        """
+        sleep_time = self._reserve_request_slot(weight)
+        
+        # Waits below the sleep resolution are not worth a syscall
+        if sleep_time > _MIN_SLEEP:
+            self.logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
             time.sleep(sleep_time)
+    
+    def _reconcile_weight(self, reported_weight: int) -> None:
+        """
+        Account for weight reported by Binance but unknown to the local budget.
         
-        self.last_request_time = time.time()
+        Other clients sharing the IP consume the same budget; any excess in
+        the X-MBX-USED-WEIGHT-1M header is added to the window.
+        
+        Args:
+            reported_weight: Weight used in the last minute according to Binance
+        """
+        with self._rate_limit_lock:
+            drift = reported_weight - self._window_weight
+            if drift > 0:
+                window = self._weight_window
+                slot = max(time.monotonic(), window[-1][0]) if window else time.monotonic()
+                window.append((slot, drift))
+                self._window_weight += drift
     
     def _should_retry_error(self, error: Exception) -> bool:
         """
@@ -195,6 +574,27 @@ class BinanceClient:
         # Default to not retrying unknown errors
         return False
     
+    def _backoff_time(self, error: Exception, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying a failed request.
+        
+        Args:
+            error: The exception that occurred
+            attempt: Zero-based attempt number that failed
+            
+        Returns:
+            Wait time in seconds
+        """
+        # Exponential backoff with jitter
+        wait_time = (2 ** attempt) + (time.time() % 1)
+        
+        # Special handling for rate limit errors
+        if isinstance(error, RateLimitError) and error.retry_after:
+            wait_time = max(wait_time, error.retry_after)
+        
+        # Cap maximum wait time
+        return min(wait_time, 60)  # Max 60 seconds
+    
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
         Handle API response and raise appropriate exceptions.
@@ -208,210 +608,183 @@ class BinanceClient:
         Raises:
             APIError: For various API errors
         """
+        headers = response.headers
+        status_code = response.status_code
+        
         # Update rate limit tracking
-        if 'X-MBX-USED-WEIGHT-1M' in response.headers:
-            self.weight_used = int(response.headers['X-MBX-USED-WEIGHT-1M'])
+        used_weight = headers.get('X-MBX-USED-WEIGHT-1M')
+        if used_weight is not None:
+            self.weight_used = int(used_weight)
+            self._reconcile_weight(self.weight_used)
         
-        if response.status_code == 200:
-            return response.json()
+        if status_code == 200:
+            return _json_loads(response.content)
         
         # Handle error responses
         try:
-            error_data = response.json()
-            code = error_data.get('code', response.status_code)
+            error_data = _json_loads(response.content)
+            code = error_data.get('code', status_code)
             message = error_data.get('msg', response.text)
         except ValueError:
-            code = response.status_code
+            code = status_code
             message = response.text
         
         # Specific error handling based on HTTP status codes
-        if response.status_code == 401:
+        if status_code == 401:
             raise AuthenticationError(code=code, message=f"Authentication failed: {message}")
-        elif response.status_code == 403:
+        elif status_code == 403:
             raise InsufficientPermissionsError(code=code, message=f"Insufficient permissions: {message}")
-        elif response.status_code == 429:
-            retry_after = response.headers.get('Retry-After')
+        elif status_code == 429:
+            retry_after = headers.get('Retry-After')
             retry_after = int(retry_after) if retry_after else None
             raise RateLimitError(code=code, message=f"Rate limit exceeded: {message}", retry_after=retry_after)
-        elif response.status_code >= 500:
+        elif status_code >= 500:
             raise ServerError(code=code, message=f"Server error: {message}")
         
         # Specific error handling based on Binance error codes
         if isinstance(code, int):
-            if code == -1000:
-                raise ServerError(code=code, message=f"Unknown error: {message}")
-            elif code == -1001:
-                raise ServerError(code=code, message=f"Internal error: {message}")
-            elif code == -1002:
-                raise AuthenticationError(code=code, message=f"Unauthorized: {message}")
-            elif code == -1003:
-                retry_after = response.headers.get('Retry-After')
-                retry_after = int(retry_after) if retry_after else None
-                raise RateLimitError(code=code, message=f"Rate limit exceeded: {message}", retry_after=retry_after)
-            elif code == -1006:
-                raise ServerError(code=code, message=f"Unexpected response: {message}")
-            elif code == -1007:
-                raise ServerError(code=code, message=f"Timeout: {message}")
-            elif code == -1013:
-                raise InvalidParameterError(code=code, message=f"Invalid quantity: {message}")
-            elif code == -1014:
-                raise InvalidSymbolError(code=code, message=f"Unknown order composition: {message}")
-            elif code == -1015:
-                raise RateLimitError(code=code, message=f"Too many orders: {message}")
-            elif code == -1016:
-                raise ServerError(code=code, message=f"Service shutting down: {message}")
-            elif code == -1020:
-                raise InvalidParameterError(code=code, message=f"Unsupported operation: {message}")
-            elif code == -1021:
-                raise AuthenticationError(code=code, message=f"Timestamp outside recv window: {message}")
-            elif code == -1022:
-                raise AuthenticationError(code=code, message=f"Invalid signature: {message}")
-            elif code == -1100:
-                raise InvalidParameterError(code=code, message=f"Illegal characters: {message}")
-            elif code == -1101:
-                raise InvalidParameterError(code=code, message=f"Too many parameters: {message}")
-            elif code == -1102:
-                raise InvalidParameterError(code=code, message=f"Mandatory parameter missing: {message}")
-            elif code == -1103:
-                raise InvalidParameterError(code=code, message=f"Unknown parameter: {message}")
-            elif code == -1104:
-                raise InvalidParameterError(code=code, message=f"Duplicate parameters: {message}")
-            elif code == -1105:
-                raise InvalidParameterError(code=code, message=f"Invalid parameter: {message}")
-            elif code == -1106:
-                raise InvalidParameterError(code=code, message=f"Invalid parameter combination: {message}")
-            elif code == -1111:
-                raise InvalidParameterError(code=code, message=f"Invalid precision: {message}")
-            elif code == -1112:
-                raise InvalidParameterError(code=code, message=f"No orders on book: {message}")
-            elif code == -1114:
-                raise InvalidParameterError(code=code, message=f"Invalid time in force: {message}")
-            elif code == -1115:
-                raise InvalidParameterError(code=code, message=f"Invalid order type: {message}")
-            elif code == -1116:
-                raise InvalidParameterError(code=code, message=f"Invalid side: {message}")
-            elif code == -1117:
-                raise InvalidParameterError(code=code, message=f"Invalid new client order ID: {message}")
-            elif code == -1118:
-                raise InvalidParameterError(code=code, message=f"Invalid original client order ID: {message}")
-            elif code == -1119:
-                raise InvalidParameterError(code=code, message=f"Invalid interval: {message}")
-            elif code == -1120:
-                raise InvalidSymbolError(code=code, message=f"Invalid symbol: {message}")
-            elif code == -1121:
-                raise InvalidSymbolError(code=code, message=f"Invalid listen key: {message}")
-            elif code == -1125:
-                raise InvalidParameterError(code=code, message=f"Invalid listen key: {message}")
-            elif code == -1127:
-                raise InvalidParameterError(code=code, message=f"Invalid lookup interval: {message}")
-            elif code == -1128:
-                raise InvalidParameterError(code=code, message=f"Combination of optional parameters invalid: {message}")
-            elif code == -1130:
-                raise InvalidParameterError(code=code, message=f"Invalid data sent: {message}")
-            elif code == -2010:
-                raise OrderNotFoundError(code=code, message=f"Order not found: {message}")
-            elif code == -2011:
-                raise InvalidParameterError(code=code, message=f"Order cancelled: {message}")
-            elif code == -2013:
-                raise OrderNotFoundError(code=code, message=f"Order does not exist: {message}")
-            elif code == -2014:
-                raise AuthenticationError(code=code, message=f"API key format invalid: {message}")
-            elif code == -2015:
-                raise InsufficientPermissionsError(code=code, message=f"Invalid API key permissions: {message}")
-            elif code == -2016:
-                raise ServerError(code=code, message=f"No trading window: {message}")
-            elif code == -2018:
-                raise InsufficientBalanceError(code=code, message=f"Balance insufficient: {message}")
-            elif code == -2019:
-                raise InvalidParameterError(code=code, message=f"Margin insufficient: {message}")
-            elif code == -2020:
-                raise InvalidParameterError(code=code, message=f"Unable to fill: {message}")
-            elif code == -2021:
-                raise InvalidParameterError(code=code, message=f"Order would immediately trigger: {message}")
-            elif code == -2022:
-                raise InvalidParameterError(code=code, message=f"Reduce only order type not supported: {message}")
-            elif code == -2023:
-                raise InvalidParameterError(code=code, message=f"User in liquidation mode: {message}")
-            elif code == -2024:
-                raise InvalidParameterError(code=code, message=f"Position side does not match: {message}")
-            elif code == -2025:
-                raise InvalidParameterError(code=code, message=f"Reduce only conflict: {message}")
+            entry = _ERROR_TABLE.get(code)
+            if entry:
+                error_class, prefix = entry
+                if code in _RETRY_AFTER_CODES:
+                    retry_after = headers.get('Retry-After')
+                    retry_after = int(retry_after) if retry_after else None
+                    raise error_class(code=code, message=f"{prefix}: {message}", retry_after=retry_after)
+                raise error_class(code=code, message=f"{prefix}: {message}")
         
         # Generic error for unhandled cases
         raise APIError(code=code, message=message)
     
     def _make_request(self, method: str, endpoint: str, params: Optional[Dict] = None, 
-                     signed: bool = False, retries: int = 0) -> Dict[str, Any]:
+                     signed: bool = False) -> Dict[str, Any]:
         """
         Make HTTP request to Binance API with retry logic.
         
+        Signed requests get a fresh timestamp and signature on every attempt so
+        that long backoffs do not push them outside Binance's recvWindow.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
             params: Query parameters
             signed: Whether request requires signature
-            retries: Current retry count
             
         Returns:
             API response data
         """
-        if params is None:
-            params = {}
-        
-        # Add timestamp for signed requests
+        # Local aliases for names used on every attempt
+        base_url = self.base_url
+        max_retries = self.max_retries
+        timeout = self.timeout
+        send = self.session.request
+        logger = self.logger
+        weight = _ENDPOINT_WEIGHTS.get(endpoint, 1)
+        
+        # Unsigned URLs do not change between attempts; public endpoints
+        # without parameters skip query string encoding entirely
         if signed:
-            params['timestamp'] = int(time.time() * 1000)
-        
-        # Create query string
-        query_string = urlencode(params)
-        
-        # Add signature for signed requests
-        if signed:
-            signature = self._generate_signature(query_string)
-            query_string += f"&signature={signature}"
-        
-        # Build URL
-        url = f"{self.base_url}{endpoint}"
-        if query_string:
-            url += f"?{query_string}"
-        
-        # Apply rate limiting
-        self._apply_rate_limit()
+            url = None
+        elif params:
+            url = f"{base_url}{endpoint}?{_build_query_string(params)}"
+        else:
+            url = base_url + endpoint
         
-        try:
-            self.logger.debug(f"Making {method} request to {endpoint}")
-            response = self.session.request(method, url, timeout=self.timeout)
-            return self._handle_response(response)
+        for attempt in range(max_retries + 1):
+            # Signed requests get a fresh timestamp and signature per attempt
+            if signed:
+                url = self._signed_url(endpoint, params)
             
-        except (requests.exceptions.RequestException, RateLimitError, ServerError) as e:
-            if retries < self.max_retries:
-                # Determine if we should retry based on error type
-                should_retry = self._should_retry_error(e)
+            # Apply rate limiting
+            self._apply_rate_limit(weight)
+            
+            try:
+                logger.debug("Making %s request to %s", method, endpoint)
+                with self._request_slots:
+                    response = send(method, url, timeout=timeout)
+                return self._handle_response(response)
                 
-                if should_retry:
-                    # Exponential backoff with jitter
-                    wait_time = (2 ** retries) + (time.time() % 1)
-                    
-                    # Special handling for rate limit errors
-                    if isinstance(e, RateLimitError) and e.retry_after:
-                        wait_time = max(wait_time, e.retry_after)
-                    
-                    # Cap maximum wait time
-                    wait_time = min(wait_time, 60)  # Max 60 seconds
-                    
-                    self.logger.warning(f"Request failed ({type(e).__name__}), retrying in {wait_time:.2f}s (attempt {retries + 1}/{self.max_retries}): {e}")
-                    time.sleep(wait_time)
-                    return self._make_request(method, endpoint, params, signed, retries + 1)
-                else:
-                    self.logger.error(f"Non-retryable error: {e}")
+            except (requests.exceptions.RequestException, RateLimitError, ServerError) as e:
+                if attempt >= max_retries:
+                    logger.error("Request failed after %d retries: %s", max_retries, e)
                     raise
-            else:
-                self.logger.error(f"Request failed after {self.max_retries} retries: {e}")
+                
+                # Determine if we should retry based on error type
+                if not self._should_retry_error(e):
+                    logger.error("Non-retryable error: %s", e)
+                    raise
+                
+                wait_time = self._backoff_time(e, attempt)
+                logger.warning("Request failed (%s), retrying in %.2fs (attempt %d/%d): %s",
+                               type(e).__name__, wait_time, attempt + 1, max_retries, e)
+                time.sleep(wait_time)
+            except (AuthenticationError, InsufficientPermissionsError, InvalidParameterError, InvalidSymbolError) as e:
+                # Don't retry these errors as they won't succeed on retry
+                logger.error("Non-retryable error: %s", e)
                 raise
-        except (AuthenticationError, InsufficientPermissionsError, InvalidParameterError, InvalidSymbolError) as e:
-            # Don't retry these errors as they won't succeed on retry
-            self.logger.error(f"Non-retryable error: {e}")
-            raise
+    
+    @staticmethod
+    def _response_cache_key(method: str, endpoint: str, params: Optional[Dict] = None) -> tuple:
+        """Build a response cache key; signed requests are keyed before the timestamp is added."""
+        return (method, endpoint, frozenset(params.items()) if params else frozenset())
+    
+    def _get_cached_response(self, key: tuple) -> Optional[Any]:
+        """
+        Look up a cached response body.
+        
+        Args:
+            key: Key from _response_cache_key
+            
+        Returns:
+            Cached data, or None if missing or expired
+        """
+        entry = self._response_cache.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+    
+    def _cache_response(self, key: tuple, data: Any, ttl: float) -> None:
+        """
+        Store a response body, evicting expired then oldest entries when full.
+        
+        Args:
+            key: Key from _response_cache_key
+            data: Parsed response data
+            ttl: Time to live in seconds
+        """
+        with self._response_cache_lock:
+            cache = self._response_cache
+            cache.pop(key, None)
+            if len(cache) >= _RESPONSE_CACHE_SIZE:
+                now = time.monotonic()
+                for stale_key in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                    del cache[stale_key]
+                while len(cache) >= _RESPONSE_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+            cache[key] = (time.monotonic() + ttl, data)
+    
+    def _make_request_cached(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                             signed: bool = False, ttl: float = _TRADES_CACHE_TTL) -> Any:
+        """
+        Make an idempotent request, reusing a recent identical response.
+        
+        Args:
+            method: HTTP method (GET only in practice)
+            endpoint: API endpoint
+            params: Query parameters
+            signed: Whether request requires signature
+            ttl: How long the response may be reused, in seconds
+            
+        Returns:
+            API response data (shared with other callers; do not mutate)
+        """
+        key = self._response_cache_key(method, endpoint, params)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+        
+        data = self._make_request(method, endpoint, params=params, signed=signed)
+        self._cache_response(key, data, ttl)
+        return data
     
     def authenticate(self) -> Dict[str, Any]:
         """
@@ -437,10 +810,20 @@ class BinanceClient:
         """
         Get account information.
         
+        The response is cached for a short TTL since symbol discovery calls
+        this on every extraction.
+        
         Returns:
             Account information including balances
         """
-        return self._make_request('GET', '/api/v3/account', signed=True)
+        if self._account_info_cache:
+            cached_at, account_info = self._account_info_cache
+            if time.monotonic() - cached_at < self._account_info_ttl:
+                return account_info
+        
+        account_info = self._make_request('GET', '/api/v3/account', signed=True)
+        self._account_info_cache = (time.monotonic(), account_info)
+        return account_info
     
     def verify_permissions(self) -> Tuple[bool, List[str]]:
         """
@@ -502,10 +885,22 @@ class BinanceClient:
         """
         Get exchange information including trading rules and symbol information.
         
+        The payload is several MB with a request weight of 20, so it is cached
+        for ``_exchange_info_ttl`` seconds. The cached object is shared between
+        callers and must not be mutated.
+        
         Returns:
             Exchange information
         """
-        return self._make_request('GET', '/api/v3/exchangeInfo')
+        if self._exchange_info_cache:
+            cached_at, exchange_info = self._exchange_info_cache
+            if time.monotonic() - cached_at < self._exchange_info_ttl:
+                return exchange_info
+        
+        exchange_info = self._make_request('GET', '/api/v3/exchangeInfo')
+        self._exchange_info_cache = (time.monotonic(), exchange_info)
+        self._relevant_symbols_cache = {}
+        return exchange_info
     
     def get_rate_limit_status(self) -> Dict[str, Any]:
         """
@@ -514,15 +909,22 @@ class BinanceClient:
         Returns:
             Dictionary with rate limit information
         """
+        # Report the last request slot on the wall clock
+        last_request_time = 0
+        if self.last_request_time:
+            last_request_time = time.time() - (time.monotonic() - self.last_request_time)
+        
         return {
             'weight_used': self.weight_used,
+            'weight_budget_remaining': max(_WEIGHT_LIMIT - self._window_weight, 0),
             'request_count': self.request_count,
-            'last_request_time': self.last_request_time,
+            'last_request_time': last_request_time,
             'rate_limit_delay': self.rate_limit_delay
         }
     
     def close(self) -> None:
-        """Close the HTTP session."""
+        """Close the worker pool and the HTTP session."""
+        self._executor.shutdown(wait=True)
         if self.session:
             self.session.close()
             self.logger.debug("Binance client session closed")
@@ -549,16 +951,16 @@ class BinanceClient:
             limit: Number of records to return (max 1000)
             
         Returns:
-            List of trade records
+            List of trade records, the caller's own copies of any cached responses
         """
         if symbol:
-            return self._get_trades_for_symbol(symbol, start_time, end_time, limit)
+            return _copy_trades(self._get_trades_for_symbol(symbol, start_time, end_time, limit))
         else:
-            return self._get_all_trades(start_time, end_time, limit)
+            return _copy_trades(self._get_all_trades(start_time, end_time, limit))
     
-    def _get_trades_for_symbol(self, symbol: str, start_time: Optional[int] = None,
-                              end_time: Optional[int] = None, limit: int = 1000) -> List[Dict[str, Any]]:
-        """Get trades for a specific symbol."""
+    def _trade_params(self, symbol: str, start_time: Optional[int] = None,
+                      end_time: Optional[int] = None, limit: int = 1000) -> Dict[str, Any]:
+        """Build myTrades query parameters for a symbol."""
         params = {
             'symbol': symbol,
             'limit': min(limit, 1000)  # Binance max is 1000
@@ -569,62 +971,185 @@ class BinanceClient:
         if end_time:
             params['endTime'] = end_time
         
-        return self._make_request('GET', '/api/v3/myTrades', params=params, signed=True)
+        return params
+    
+    def _get_trades_for_symbol(self, symbol: str, start_time: Optional[int] = None,
+                              end_time: Optional[int] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Get trades for a specific symbol."""
+        params = self._trade_params(symbol, start_time, end_time, limit)
+        return self._make_request_cached('GET', '/api/v3/myTrades', params=params, signed=True)
     
     def _get_all_trades(self, start_time: Optional[int] = None,
                        end_time: Optional[int] = None, limit: int = 1000) -> List[Dict[str, Any]]:
         """Get trades for all symbols."""
-        all_trades = []
+        # Find trading pairs on assets held in the account
+        relevant_symbols = self._relevant_symbols(
+            self.get_exchange_info(), _assets_with_balance(self.get_account_info())
+        )
+        
+        # Get trades for each relevant symbol concurrently
+        futures = {
+            self._executor.submit(self._get_trades_for_symbol, symbol, start_time, end_time, limit): symbol
+            for symbol in relevant_symbols
+        }
+        trades_by_symbol = {}
+        complete = True
         
-        # First get account info to find symbols with balances
-        account_info = self.get_account_info()
-        symbols_with_balance = set()
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                symbol_trades = future.result()
+            except Exception as e:
+                self._log_symbol_trades_error(symbol, e)
+                complete = complete and _symbol_has_no_trades(e)
+                continue
+            if symbol_trades:
+                trades_by_symbol[symbol] = symbol_trades
+                self.logger.debug("Retrieved %d trades for %s", len(symbol_trades), symbol)
+        
+        trades = self._merge_symbol_trades(relevant_symbols, trades_by_symbol, limit)
+        return trades if complete else _PartialTrades(trades)
+    
+    def _log_symbol_trades_error(self, symbol: str, error: Exception) -> None:
+        """Log a per-symbol trade retrieval failure at the appropriate level."""
+        if isinstance(error, InvalidSymbolError):
+            self.logger.debug("Symbol %s not valid for trading: %s", symbol, error)
+        elif isinstance(error, InvalidParameterError):
+            if error.code == -1102:  # Mandatory parameter missing
+                self.logger.debug("No trades available for %s", symbol)
+            else:
+                self.logger.warning("Parameter error for %s: %s", symbol, error)
+        elif isinstance(error, APIError):
+            self.logger.warning("Failed to get trades for %s: %s", symbol, error)
+        else:
+            self.logger.error("Unexpected error getting trades for %s: %s", symbol, error)
+    
+    @staticmethod
+    def _merge_symbol_trades(relevant_symbols: List[str], trades_by_symbol: Dict[str, List[Dict[str, Any]]],
+                             limit: int) -> List[Dict[str, Any]]:
+        """
+        Merge per-symbol trade lists into one time-ordered list.
         
-        for balance in account_info.get('balances', []):
-            if float(balance['free']) > 0 or float(balance['locked']) > 0:
-                symbols_with_balance.add(balance['asset'])
+        Binance returns each symbol's trades in time order, so a k-way merge
+        (in symbol order, for stable ties) replaces a full sort and lets the
+        limit stop the merge early.
+        """
+        merged = heapq.merge(
+            *(trades_by_symbol[symbol] for symbol in relevant_symbols if symbol in trades_by_symbol),
+            key=lambda trade: trade['time']
+        )
+        return list(islice(merged, limit)) if limit else list(merged)
+    
+    def _relevant_symbols(self, exchange_info: Dict[str, Any], assets: frozenset) -> List[str]:
+        """
+        Get the trading pairs worth querying for the given balance assets.
         
-        # Get exchange info to find all trading pairs
-        exchange_info = self.get_exchange_info()
-        relevant_symbols = []
+        Memoized per exchange info generation; the memo is reset whenever
+        get_exchange_info fetches a fresh payload.
         
-        for symbol_info in exchange_info.get('symbols', []):
-            symbol = symbol_info['symbol']
-            base_asset = symbol_info['baseAsset']
-            quote_asset = symbol_info['quoteAsset']
+        Args:
+            exchange_info: Exchange information payload
+            assets: Assets with a non-zero balance
             
-            # Only get trades for symbols where we have/had balances
-            if (base_asset in symbols_with_balance or 
-                quote_asset in symbols_with_balance or
-                symbol_info['status'] == 'TRADING'):
-                relevant_symbols.append(symbol)
+        Returns:
+            List of relevant trading pair symbols
+        """
+        if assets in self._relevant_symbols_cache:
+            return self._relevant_symbols_cache[assets]
+        
+        # Only get trades for trading pairs on an asset we hold
+        relevant_symbols = [
+            symbol_info['symbol'] for symbol_info in exchange_info.get('symbols', [])
+            if symbol_info['status'] == 'TRADING' and (
+                symbol_info['baseAsset'] in assets or symbol_info['quoteAsset'] in assets)
+        ]
+        
+        self._relevant_symbols_cache[assets] = relevant_symbols
+        return relevant_symbols
+    
+    def _iter_history(self, endpoint: str, params: Dict[str, Any], page_size: int,
+                      records_key: str, advance: Callable[[Dict[str, Any], List[Dict[str, Any]]], None],
+                      prefetch: bool = True,
+                      drop_seen: Optional[Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]] = None
+                      ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream records from a paginated history endpoint.
         
-        # Get trades for each relevant symbol
-        for symbol in relevant_symbols:
-            try:
-                symbol_trades = self._get_trades_for_symbol(symbol, start_time, end_time, limit)
-                if symbol_trades:
-                    all_trades.extend(symbol_trades)
-                    self.logger.debug(f"Retrieved {len(symbol_trades)} trades for {symbol}")
-            except InvalidSymbolError as e:
-                self.logger.debug(f"Symbol {symbol} not valid for trading: {e}")
-                continue
-            except InvalidParameterError as e:
-                if e.code == -1102:  # Mandatory parameter missing
-                    self.logger.debug(f"No trades available for {symbol}")
+        With prefetch, the request for the next page is issued on the worker
+        pool before the current page is yielded, so the consumer's processing
+        overlaps the network round trip; at most two pages are held at a time.
+        
+        Args:
+            endpoint: Signed API endpoint
+            params: Query parameters for the first page (not modified)
+            page_size: Records per page requested in params
+            records_key: Key holding the records when the response is not a list
+            advance: Updates params in place to request the page after the given one
+            prefetch: Request the next page while the current one is consumed
+            drop_seen: Removes records a page repeats from the previous one
+            
+        Yields:
+            Individual history records
+        """
+        params = dict(params)
+        
+        def fetch_page() -> List[Dict[str, Any]]:
+            response = self._make_request('GET', endpoint, params=dict(params), signed=True)
+            return response if isinstance(response, list) else response.get(records_key, [])
+        
+        pending = None
+        try:
+            page = fetch_page()
+            while True:
+                # A short page is the last one
+                last_page = not page or len(page) < page_size
+                records = page if drop_seen is None else drop_seen(page)
+                if not last_page:
+                    advance(params, page)
+                    if prefetch:
+                        pending = self._executor.submit(fetch_page)
+                
+                yield from records
+                
+                if last_page:
+                    return
+                if pending is not None:
+                    page, pending = pending.result(), None
                 else:
-                    self.logger.warning(f"Parameter error for {symbol}: {e}")
-                continue
-            except APIError as e:
-                self.logger.warning(f"Failed to get trades for {symbol}: {e}")
-                continue
-            except Exception as e:
-                self.logger.error(f"Unexpected error getting trades for {symbol}: {e}")
-                continue
+                    page = fetch_page()
+        finally:
+            if pending is not None:
+                pending.cancel()
+    
+    def iter_deposits(self, coin: Optional[str] = None, start_time: Optional[int] = None,
+                      end_time: Optional[int] = None, page_size: int = 1000,
+                      prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the full deposit history.
         
-        # Sort by time and limit results
-        all_trades.sort(key=lambda x: x['time'])
-        return all_trades[:limit] if limit else all_trades
+        Args:
+            coin: Coin symbol (e.g., 'BTC'). If None, gets all coins
+            start_time: Start time in milliseconds
+            end_time: End time in milliseconds
+            page_size: Records per request (max 1000)
+            prefetch: Request the next page while the current one is consumed
+            
+        Yields:
+            Deposit records
+        """
+        page_size = min(page_size, 1000)
+        params = {
+            'limit': page_size
+        }
+        
+        if coin:
+            params['coin'] = coin
+        if start_time:
+            params['startTime'] = start_time
+        if end_time:
+            params['endTime'] = end_time
+        
+        return self._iter_history('/sapi/v1/capital/deposit/hisrec', params, page_size, 'data', _next_offset, prefetch)
     
     def get_deposits(self, coin: Optional[str] = None, start_time: Optional[int] = None,
                     end_time: Optional[int] = None, limit: int = 1000) -> List[Dict[str, Any]]:
@@ -640,8 +1165,28 @@ class BinanceClient:
         Returns:
             List of deposit records
         """
+        limit = min(limit, 1000)
+        return list(islice(self.iter_deposits(coin, start_time, end_time, page_size=limit, prefetch=False), limit))
+    
+    def iter_withdrawals(self, coin: Optional[str] = None, start_time: Optional[int] = None,
+                         end_time: Optional[int] = None, page_size: int = 1000,
+                         prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the full withdrawal history.
+        
+        Args:
+            coin: Coin symbol (e.g., 'BTC'). If None, gets all coins
+            start_time: Start time in milliseconds
+            end_time: End time in milliseconds
+            page_size: Records per request (max 1000)
+            prefetch: Request the next page while the current one is consumed
+            
+        Yields:
+            Withdrawal records
+        """
+        page_size = min(page_size, 1000)
         params = {
-            'limit': min(limit, 1000)
+            'limit': page_size
         }
         
         if coin:
@@ -651,8 +1196,7 @@ class BinanceClient:
         if end_time:
             params['endTime'] = end_time
         
-        response = self._make_request('GET', '/sapi/v1/capital/deposit/hisrec', params=params, signed=True)
-        return response if isinstance(response, list) else response.get('data', [])
+        return self._iter_history('/sapi/v1/capital/withdraw/history', params, page_size, 'data', _next_offset, prefetch)
     
     def get_withdrawals(self, coin: Optional[str] = None, start_time: Optional[int] = None,
                        end_time: Optional[int] = None, limit: int = 1000) -> List[Dict[str, Any]]:
@@ -668,19 +1212,8 @@ class BinanceClient:
         Returns:
             List of withdrawal records
         """
-        params = {
-            'limit': min(limit, 1000)
-        }
-        
-        if coin:
-            params['coin'] = coin
-        if start_time:
-            params['startTime'] = start_time
-        if end_time:
-            params['endTime'] = end_time
-        
-        response = self._make_request('GET', '/sapi/v1/capital/withdraw/history', params=params, signed=True)
-        return response if isinstance(response, list) else response.get('data', [])
+        limit = min(limit, 1000)
+        return list(islice(self.iter_withdrawals(coin, start_time, end_time, page_size=limit, prefetch=False), limit))
     
     def get_dust_log(self, start_time: Optional[int] = None, end_time: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -703,6 +1236,38 @@ class BinanceClient:
         response = self._make_request('GET', '/sapi/v1/asset/dribblet', params=params, signed=True)
         return response.get('userAssetDribblets', [])
     
+    def iter_asset_dividend_record(self, asset: Optional[str] = None, start_time: Optional[int] = None,
+                                   end_time: Optional[int] = None, page_size: int = 500,
+                                   prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the full asset dividend history (staking rewards, etc.).
+        
+        Args:
+            asset: Asset symbol (e.g., 'BTC')
+            start_time: Start time in milliseconds
+            end_time: End time in milliseconds
+            page_size: Records per request (max 500)
+            prefetch: Request the next page while the current one is consumed
+            
+        Yields:
+            Dividend records
+        """
+        page_size = min(page_size, 500)
+        params = {
+            'limit': page_size
+        }
+        
+        if asset:
+            params['asset'] = asset
+        if start_time:
+            params['startTime'] = start_time
+        if end_time:
+            params['endTime'] = end_time
+        
+        pager = _DividendPager(self.logger)
+        return self._iter_history('/sapi/v1/asset/assetDividend', params, page_size, 'rows', pager.advance, prefetch,
+                                  pager.drop_seen)
+    
     def get_asset_dividend_record(self, asset: Optional[str] = None, start_time: Optional[int] = None,
                                  end_time: Optional[int] = None, limit: int = 500) -> List[Dict[str, Any]]:
         """
@@ -717,19 +1282,39 @@ class BinanceClient:
         Returns:
             List of dividend records
         """
+        limit = min(limit, 500)
+        return list(islice(self.iter_asset_dividend_record(asset, start_time, end_time, page_size=limit, prefetch=False), limit))
+    
+    def iter_universal_transfer_history(self, transfer_type: str = 'MAIN_SPOT',
+                                        start_time: Optional[int] = None,
+                                        end_time: Optional[int] = None,
+                                        page_size: int = 100,
+                                        prefetch: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the full universal transfer history.
+        
+        Args:
+            transfer_type: Type of transfer (MAIN_SPOT, SPOT_MAIN, etc.)
+            start_time: Start time in milliseconds
+            end_time: End time in milliseconds
+            page_size: Records per request (max 100)
+            prefetch: Request the next page while the current one is consumed
+            
+        Yields:
+            Transfer records
+        """
+        page_size = min(page_size, 100)
         params = {
-            'limit': min(limit, 500)
+            'type': transfer_type,
+            'size': page_size
         }
         
-        if asset:
-            params['asset'] = asset
         if start_time:
             params['startTime'] = start_time
         if end_time:
             params['endTime'] = end_time
         
-        response = self._make_request('GET', '/sapi/v1/asset/assetDividend', params=params, signed=True)
-        return response.get('rows', [])
+        return self._iter_history('/sapi/v1/asset/transfer', params, page_size, 'rows', _next_current_page, prefetch)
     
     def get_universal_transfer_history(self, transfer_type: str = 'MAIN_SPOT', 
                                      start_time: Optional[int] = None,
@@ -747,24 +1332,17 @@ class BinanceClient:
         Returns:
             List of transfer records
         """
-        params = {
-            'type': transfer_type,
-            'size': min(limit, 100)
-        }
-        
-        if start_time:
-            params['startTime'] = start_time
-        if end_time:
-            params['endTime'] = end_time
-        
-        response = self._make_request('GET', '/sapi/v1/asset/transfer', params=params, signed=True)
-        return response.get('rows', [])
+        limit = min(limit, 100)
+        return list(islice(self.iter_universal_transfer_history(transfer_type, start_time, end_time, page_size=limit, prefetch=False), limit))
     
     def get_all_transactions(self, start_time: Optional[int] = None, end_time: Optional[int] = None,
                            limit_per_type: int = 1000) -> Dict[str, List[Dict[str, Any]]]:
         """
         Get all transaction types within date range.
         
+        The transaction types are fetched concurrently on a shared thread pool,
+        so the total latency is that of the slowest type.
+        
         Args:
             start_time: Start time in milliseconds
             end_time: End time in milliseconds
@@ -773,100 +1351,203 @@ class BinanceClient:
         Returns:
             Dictionary with transaction types as keys and lists of transactions as values
         """
+        if start_time is not None and end_time is not None and end_time < start_time:
+            return self._empty_transactions(start_time, end_time)
+        
+        key = (start_time, end_time, limit_per_type)
+        cached = self._get_cached_transactions(key)
+        if cached is not None:
+            return cached
+        
         self.logger.info("Retrieving all transaction types...")
         
-        transactions = {
-            'trades': [],
-            'deposits': [],
-            'withdrawals': [],
-            'dust_conversions': [],
-            'dividends': [],
-            'transfers': []
+        futures = {
+            _TRANSACTION_EXECUTOR.submit(fetch, **kwargs): name
+            for name, fetch, kwargs in self._transaction_fetches(start_time, end_time, limit_per_type)
         }
+        results = {}
         
-        errors = []
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = e
         
-        # Get trades
-        try:
-            self.logger.debug("Retrieving trades...")
-            transactions['trades'] = self.get_trades(start_time=start_time, end_time=end_time, limit=limit_per_type)
-            self.logger.info(f"Retrieved {len(transactions['trades'])} trades")
-        except Exception as e:
-            error_msg = f"Failed to retrieve trades: {e}"
-            self.logger.error(error_msg)
-            errors.append(error_msg)
-            transactions['trades'] = []
+        transactions, errors = self._collect_transactions([results[name] for name, *_ in _TRANSACTION_TYPES])
+        if _is_complete(transactions, errors):
+            self._cache_transactions(key, transactions)
+        return transactions
+    
+    async def get_all_transactions_async(self, start_time: Optional[int] = None, end_time: Optional[int] = None,
+                                         limit_per_type: int = 1000) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get all transaction types within date range, fetching the types concurrently.
         
-        # Get deposits
-        try:
-            self.logger.debug("Retrieving deposits...")
-            transactions['deposits'] = self.get_deposits(start_time=start_time, end_time=end_time, limit=limit_per_type)
-            self.logger.info(f"Retrieved {len(transactions['deposits'])} deposits")
-        except Exception as e:
-            error_msg = f"Failed to retrieve deposits: {e}"
-            self.logger.error(error_msg)
-            errors.append(error_msg)
-            transactions['deposits'] = []
+        The blocking fetchers run in the event loop's default executor, so the
+        total latency is that of the slowest transaction type.
         
-        # Get withdrawals
-        try:
-            self.logger.debug("Retrieving withdrawals...")
-            transactions['withdrawals'] = self.get_withdrawals(start_time=start_time, end_time=end_time, limit=limit_per_type)
-            self.logger.info(f"Retrieved {len(transactions['withdrawals'])} withdrawals")
-        except Exception as e:
-            error_msg = f"Failed to retrieve withdrawals: {e}"
-            self.logger.error(error_msg)
-            errors.append(error_msg)
-            transactions['withdrawals'] = []
+        Args:
+            start_time: Start time in milliseconds
+            end_time: End time in milliseconds
+            limit_per_type: Limit per transaction type
+            
+        Returns:
+            Dictionary with transaction types as keys and lists of transactions as values
+        """
+        if start_time is not None and end_time is not None and end_time < start_time:
+            return self._empty_transactions(start_time, end_time)
         
-        # Get dust conversions
-        try:
-            self.logger.debug("Retrieving dust conversions...")
-            transactions['dust_conversions'] = self.get_dust_log(start_time=start_time, end_time=end_time)
-            self.logger.info(f"Retrieved {len(transactions['dust_conversions'])} dust conversions")
-        except Exception as e:
-            error_msg = f"Failed to retrieve dust conversions: {e}"
-            self.logger.error(error_msg)
-            errors.append(error_msg)
-            transactions['dust_conversions'] = []
+        key = (start_time, end_time, limit_per_type)
+        cached = self._get_cached_transactions(key)
+        if cached is not None:
+            return cached
         
-        # Get dividends/rewards
-        try:
-            self.logger.debug("Retrieving dividends...")
-            transactions['dividends'] = self.get_asset_dividend_record(start_time=start_time, end_time=end_time, limit=limit_per_type)
-            self.logger.info(f"Retrieved {len(transactions['dividends'])} dividend records")
-        except Exception as e:
-            error_msg = f"Failed to retrieve dividends: {e}"
-            self.logger.error(error_msg)
-            errors.append(error_msg)
-            transactions['dividends'] = []
+        self.logger.info("Retrieving all transaction types...")
+        loop = asyncio.get_running_loop()
         
-        # Get transfers
-        try:
-            self.logger.debug("Retrieving transfers...")
-            transactions['transfers'] = self.get_universal_transfer_history(start_time=start_time, end_time=end_time, limit=limit_per_type)
-            self.logger.info(f"Retrieved {len(transactions['transfers'])} transfer records")
-        except Exception as e:
-            error_msg = f"Failed to retrieve transfers: {e}"
-            self.logger.error(error_msg)
-            errors.append(error_msg)
-            transactions['transfers'] = []
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, functools.partial(fetch, **kwargs))
+              for _, fetch, kwargs in self._transaction_fetches(start_time, end_time, limit_per_type)),
+            return_exceptions=True
+        )
+        
+        transactions, errors = self._collect_transactions(results)
+        if _is_complete(transactions, errors):
+            self._cache_transactions(key, transactions)
+        return transactions
+    
+    def _empty_transactions(self, start_time: int, end_time: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the result for an empty date range without querying the API."""
+        self.logger.info("Empty range %s-%s, skipping fetch", start_time, end_time)
+        return {name: [] for name, *_ in _TRANSACTION_TYPES}
+    
+    def _transaction_fetches(self, start_time: Optional[int], end_time: Optional[int],
+                             limit_per_type: int) -> List[Tuple[str, Callable[..., List[Dict[str, Any]]], Dict[str, Any]]]:
+        """
+        Build the per-type fetch calls of get_all_transactions.
+        
+        Args:
+            start_time: Start time in milliseconds
+            end_time: End time in milliseconds
+            limit_per_type: Limit per transaction type
+            
+        Returns:
+            List of (result key, bound fetcher, keyword arguments) in _TRANSACTION_TYPES order
+        """
+        fetches = []
+        for name, method_name, takes_limit, _, _ in _TRANSACTION_TYPES:
+            kwargs = {'start_time': start_time, 'end_time': end_time}
+            if takes_limit:
+                kwargs['limit'] = limit_per_type
+            fetches.append((name, getattr(self, method_name), kwargs))
+        return fetches
+    
+    def _get_cached_transactions(self, key: tuple) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Look up a cached get_all_transactions result.
+        
+        Args:
+            key: (start_time, end_time, limit_per_type)
+            
+        Returns:
+            A private copy of the cached transactions, or None on a miss
+        """
+        with self._response_cache_lock:
+            entry = self._transactions_cache.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                self._transactions_cache_misses += 1
+                return None
+            self._transactions_cache.move_to_end(key)
+            self._transactions_cache_hits += 1
+        
+        self.logger.debug("Using cached transactions for range %s-%s", key[0], key[1])
+        return copy.deepcopy(entry[1])
+    
+    def _cache_transactions(self, key: tuple, transactions: Dict[str, List[Dict[str, Any]]]) -> None:
+        """
+        Cache a complete get_all_transactions result (no failed type or symbol).
+        
+        Args:
+            key: (start_time, end_time, limit_per_type)
+            transactions: Result to cache (copied, so callers may mutate theirs)
+        """
+        end_time = key[1]
+        if end_time is not None and end_time < time.time() * 1000 - _SETTLED_AFTER_MS:
+            ttl = _SETTLED_TRANSACTIONS_CACHE_TTL
+        else:
+            ttl = _TRANSACTIONS_CACHE_TTL
+        entry = (time.monotonic() + ttl, copy.deepcopy(transactions))
+        
+        with self._response_cache_lock:
+            cache = self._transactions_cache
+            cache[key] = entry
+            cache.move_to_end(key)
+            while len(cache) > _TRANSACTIONS_CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get transaction cache statistics.
+        
+        Returns:
+            Dictionary with cache statistics
+        """
+        return {
+            'cached_ranges': len(self._transactions_cache),
+            'hits': self._transactions_cache_hits,
+            'misses': self._transactions_cache_misses
+        }
+    
+    def _collect_transactions(self, results: List[Any]
+                              ) -> Tuple[Dict[str, List[Dict[str, Any]]], List[Tuple[str, Optional[int], str]]]:
+        """
+        Assemble per-type fetch results into the get_all_transactions payload.
+        
+        Binance API errors are reported with their error code; any other
+        exception is unexpected and logged with its traceback.
+        
+        Args:
+            results: Transaction list or raised exception per type, in _TRANSACTION_TYPES order
+            
+        Returns:
+            Tuple of (transactions by type, (type, API error code or None, message) per failed type)
+            
+        Raises:
+            APIError: If every transaction type failed
+        """
+        transactions = {}
+        errors = []
+        
+        for (key, _, _, description, failure_label), result in zip(_TRANSACTION_TYPES, results):
+            if isinstance(result, APIError):
+                self.logger.error("Failed to retrieve %s: %s", failure_label, result)
+                errors.append((failure_label, result.code, result.message))
+                transactions[key] = []
+            elif isinstance(result, Exception):
+                self.logger.error("Failed to retrieve %s: %s", failure_label, result, exc_info=result)
+                errors.append((failure_label, None, str(result)))
+                transactions[key] = []
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                transactions[key] = result
+                self.logger.info("Retrieved %d %s", len(result), description)
         
         # Log summary of errors if any
         if errors:
-            self.logger.warning(f"Encountered {len(errors)} errors during transaction retrieval:")
-            for error in errors:
-                self.logger.warning(f"  - {error}")
+            self.logger.warning("Encountered %d errors during transaction retrieval:", len(errors))
+            for failure_label, code, message in errors:
+                self.logger.warning("  - %s: %s (code %s)", failure_label, message, code)
         
         # If all transaction types failed, raise an exception
-        total_transactions = sum(len(tx_list) for tx_list in transactions.values())
+        total_transactions = sum(map(len, transactions.values()))
         if total_transactions == 0 and errors:
-            raise APIError(code=-1000, message=f"Failed to retrieve any transactions. Errors: {'; '.join(errors)}")
+            summary = '; '.join(f"Failed to retrieve {failure_label}: {message}" for failure_label, _, message in errors)
+            raise APIError(code=-1000, message=f"Failed to retrieve any transactions. Errors: {summary}")
         
-        total_transactions = sum(len(tx_list) for tx_list in transactions.values())
-        self.logger.info(f"Retrieved {total_transactions} total transactions")
+        self.logger.info("Retrieved %d total transactions", total_transactions)
         
-        return transactions
+        return transactions, errors
     
     def get_transactions_by_date_range(self, start_date: datetime, end_date: datetime,
                                      limit_per_type: int = 1000) -> Dict[str, List[Dict[str, Any]]]:
@@ -882,9 +1563,243 @@ class BinanceClient:
             Dictionary with transaction types and their data
         """
         # Convert dates to milliseconds
-        start_time = int(start_date.timestamp() * 1000)
-        end_time = int(end_date.timestamp() * 1000)
+        start_time = _to_milliseconds(start_date)
+        end_time = _to_milliseconds(end_date)
         
         self.logger.info(f"Retrieving transactions from {start_date.date()} to {end_date.date()}")
         
-        return self.get_all_transactions(start_time=start_time, end_time=end_time, limit_per_type=limit_per_type)
\ No newline at end of file
+        return self.get_all_transactions(start_time=start_time, end_time=end_time, limit_per_type=limit_per_type)
+
+
+class _BufferedResponse:
+    """Fully read aiohttp response exposing the attributes _handle_response uses."""
+    
+    __slots__ = ('status_code', 'headers', 'content')
+    
+    def __init__(self, status_code: int, headers: Any, content: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+    
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+
+class AsyncBinanceClient(BinanceClient):
+    """
+    asyncio variant of the Binance client backed by aiohttp.
+    
+    Per-symbol trade requests run as coroutines on a single event loop instead
+    of worker threads, so fan-out is bounded by ``max_concurrent`` and the
+    shared rate limiter rather than by thread count. Authentication, rate
+    limiting, response handling and caches are shared with BinanceClient, and
+    the synchronous methods remain available.
+    
+    Requires the optional ``aiohttp`` package.
+    """
+    
+    def __init__(self, config: Config):
+        """
+        Initialize async Binance client.
+        
+        Args:
+            config: Application configuration containing API credentials
+            
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for AsyncBinanceClient (pip install aiohttp)")
+        
+        super().__init__(config)
+        
+        # Created lazily so it binds to the running event loop
+        self._async_session: Optional['aiohttp.ClientSession'] = None
+    
+    def _get_async_session(self) -> 'aiohttp.ClientSession':
+        """Get the aiohttp session, creating it on first use."""
+        if self._async_session is None or self._async_session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrent, limit_per_host=self.max_concurrent)
+            self._async_session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'X-MBX-APIKEY': self.api_key},
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._async_session
+    
+    def _should_retry_error(self, error: Exception) -> bool:
+        """Also retry aiohttp transport errors and timeouts."""
+        if isinstance(error, (aiohttp.ClientError, asyncio.TimeoutError)):
+            return True
+        return super()._should_retry_error(error)
+    
+    async def _make_request_async(self, method: str, endpoint: str, params: Optional[Dict] = None,
+                                  signed: bool = False) -> Dict[str, Any]:
+        """
+        Make HTTP request to Binance API with retry logic, without blocking the event loop.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint
+            params: Query parameters
+            signed: Whether request requires signature
+            
+        Returns:
+            API response data
+        """
+        session = self._get_async_session()
+        max_retries = self.max_retries
+        logger = self.logger
+        weight = _ENDPOINT_WEIGHTS.get(endpoint, 1)
+        
+        if signed:
+            url = None
+        elif params:
+            url = f"{self.base_url}{endpoint}?{_build_query_string(params)}"
+        else:
+            url = self.base_url + endpoint
+        
+        for attempt in range(max_retries + 1):
+            if signed:
+                url = self._signed_url(endpoint, params)
+            
+            # The reservation never blocks, so the threading lock is safe here
+            sleep_time = self._reserve_request_slot(weight)
+            if sleep_time > _MIN_SLEEP:
+                logger.debug("Rate limiting: sleeping for %.2f seconds", sleep_time)
+                await asyncio.sleep(sleep_time)
+            
+            try:
+                logger.debug("Making async %s request to %s", method, endpoint)
+                async with session.request(method, url) as response:
+                    buffered = _BufferedResponse(response.status, response.headers, await response.read())
+                return self._handle_response(buffered)
+                
+            except (aiohttp.ClientError, asyncio.TimeoutError, RateLimitError, ServerError) as e:
+                if attempt >= max_retries:
+                    logger.error("Request failed after %d retries: %s", max_retries, e)
+                    raise
+                
+                if not self._should_retry_error(e):
+                    logger.error("Non-retryable error: %s", e)
+                    raise
+                
+                wait_time = self._backoff_time(e, attempt)
+                logger.warning("Request failed (%s), retrying in %.2fs (attempt %d/%d): %s",
+                               type(e).__name__, wait_time, attempt + 1, max_retries, e)
+                await asyncio.sleep(wait_time)
+            except (AuthenticationError, InsufficientPermissionsError, InvalidParameterError, InvalidSymbolError) as e:
+                logger.error("Non-retryable error: %s", e)
+                raise
+    
+    async def get_account_info_async(self) -> Dict[str, Any]:
+        """
+        Get account information (shares the cache of get_account_info).
+        
+        Returns:
+            Account information including balances
+        """
+        if self._account_info_cache:
+            cached_at, account_info = self._account_info_cache
+            if time.monotonic() - cached_at < self._account_info_ttl:
+                return account_info
+        
+        account_info = await self._make_request_async('GET', '/api/v3/account', signed=True)
+        self._account_info_cache = (time.monotonic(), account_info)
+        return account_info
+    
+    async def get_exchange_info_async(self) -> Dict[str, Any]:
+        """
+        Get exchange information (shares the cache of get_exchange_info).
+        
+        Returns:
+            Exchange information
+        """
+        if self._exchange_info_cache:
+            cached_at, exchange_info = self._exchange_info_cache
+            if time.monotonic() - cached_at < self._exchange_info_ttl:
+                return exchange_info
+        
+        exchange_info = await self._make_request_async('GET', '/api/v3/exchangeInfo')
+        self._exchange_info_cache = (time.monotonic(), exchange_info)
+        self._relevant_symbols_cache = {}
+        return exchange_info
+    
+    async def get_trades_async(self, symbol: Optional[str] = None, start_time: Optional[int] = None,
+                               end_time: Optional[int] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Get spot trading history.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT'). If None, gets all symbols
+            start_time: Start time in milliseconds
+            end_time: End time in milliseconds
+            limit: Number of records to return (max 1000)
+            
+        Returns:
+            List of trade records, the caller's own copies of any cached responses
+        """
+        if symbol:
+            return _copy_trades(await self._get_trades_for_symbol_async(symbol, start_time, end_time, limit))
+        else:
+            return _copy_trades(await self._get_all_trades_async(start_time, end_time, limit))
+    
+    async def _get_trades_for_symbol_async(self, symbol: str, start_time: Optional[int] = None,
+                                           end_time: Optional[int] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Get trades for a specific symbol."""
+        params = self._trade_params(symbol, start_time, end_time, limit)
+        key = self._response_cache_key('GET', '/api/v3/myTrades', params)
+        cached = self._get_cached_response(key)
+        if cached is not None:
+            return cached
+        
+        trades = await self._make_request_async('GET', '/api/v3/myTrades', params=params, signed=True)
+        self._cache_response(key, trades, _TRADES_CACHE_TTL)
+        return trades
+    
+    async def _get_all_trades_async(self, start_time: Optional[int] = None,
+                                    end_time: Optional[int] = None, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Get trades for all symbols concurrently."""
+        exchange_info, account_info = await asyncio.gather(
+            self.get_exchange_info_async(), self.get_account_info_async()
+        )
+        relevant_symbols = self._relevant_symbols(exchange_info, _assets_with_balance(account_info))
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+        
+        async def fetch(symbol: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self._get_trades_for_symbol_async(symbol, start_time, end_time, limit)
+        
+        results = await asyncio.gather(*(fetch(symbol) for symbol in relevant_symbols), return_exceptions=True)
+        trades_by_symbol = {}
+        complete = True
+        
+        for symbol, result in zip(relevant_symbols, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                self._log_symbol_trades_error(symbol, result)
+                complete = complete and _symbol_has_no_trades(result)
+            elif result:
+                trades_by_symbol[symbol] = result
+                self.logger.debug("Retrieved %d trades for %s", len(result), symbol)
+        
+        trades = self._merge_symbol_trades(relevant_symbols, trades_by_symbol, limit)
+        return trades if complete else _PartialTrades(trades)
+    
+    async def close_async(self) -> None:
+        """Close the aiohttp session along with the synchronous resources."""
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self.close()
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close_async()
\ No newline at end of file
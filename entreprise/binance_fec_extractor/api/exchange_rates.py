@@ -6,50 +6,327 @@ caching, and fallback mechanisms for reliable USD/EUR conversion.
 """
 
 import time
-import json
+import atexit
+import heapq
+import weakref
+import sqlite3
+import threading
 import requests
-from typing import Dict, List, Optional, Any, Tuple
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Any, Tuple, Iterator, Callable, Sequence, Deque
 from datetime import datetime, timedelta, date
-from dataclasses import dataclass
 from pathlib import Path
+from io import BytesIO
 import logging
-import xml.etree.ElementTree as ET
 from urllib.parse import urljoin
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
 from ..config.settings import Config
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    import json
+    _json_loads = json.loads
+
+try:
+    from lxml import etree as ET
+    # ECB responses never need entity expansion or network access
+    _ITERPARSE_OPTIONS = {'resolve_entities': False, 'no_network': True}
+    _XMLParseError = ET.XMLSyntaxError
+except ImportError:  # lxml is an optional speedup
+    import xml.etree.ElementTree as ET
+    _ITERPARSE_OPTIONS = {}
+    _XMLParseError = ET.ParseError
+
+# SDMX generic data tags, in Clark notation
+_NS_GENERIC = '{http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic}'
+_OBS_TAG = _NS_GENERIC + 'Obs'
+_OBS_DIMENSION_TAG = _NS_GENERIC + 'ObsDimension'
+_OBS_VALUE_TAG = _NS_GENERIC + 'ObsValue'
+
+_USER_AGENT = 'Binance-FEC-Extractor/1.0'
+
+# Shared by the closest-rate scans, which fan out one request per candidate date
+_ECB_SCAN_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ecb-closest-rate')
+
+# How long a source is not asked again for a date it had no rate for
+_NEGATIVE_CACHE_TTL = 3600.0
+
+# Fallback sources failing this many times in a row are skipped for a while
+_BREAKER_THRESHOLD = 3
+_BREAKER_COOLDOWN = 300.0
+
+# Dates looked up concurrently by preload_rates_for_date_range
+_PRELOAD_WORKERS = 16
+
+# Latest-dated rates indexed per currency pair for validate_rate_reasonableness,
+# one more than the rates it averages so the rate being checked can be skipped
+_LATEST_RATES = 4
+
+# New rates are written to the cache database in batches of this size
+_FLUSH_EVERY = 50
+
+# Rate cache database. Dates are stored as ordinals and times as epoch seconds,
+# so rows load without any text parsing. Caches with another layout version
+# are dropped on open.
+_CACHE_SCHEMA_VERSION = 1
+_CACHE_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS rates ("
+    "key TEXT PRIMARY KEY, date INTEGER, rate REAL, source TEXT, pair TEXT, ts REAL, expires REAL)",
+    "CREATE TABLE IF NOT EXISTS misses (key TEXT PRIMARY KEY, expires REAL)",
+)
+_INSERT_RATE = "INSERT OR REPLACE INTO rates VALUES (?, ?, ?, ?, ?, ?, ?)"
+_INSERT_MISS = "INSERT OR REPLACE INTO misses VALUES (?, ?)"
+
+# Common symbols mapped to CoinGecko IDs
+_COINGECKO_IDS = {
+    'BTC': 'bitcoin',
+    'ETH': 'ethereum',
+    'BNB': 'binancecoin',
+    'ADA': 'cardano',
+    'DOT': 'polkadot',
+    'LINK': 'chainlink',
+    'LTC': 'litecoin',
+    'XRP': 'ripple',
+    'SOL': 'solana',
+    'MATIC': 'matic-network',
+    'AVAX': 'avalanche-2',
+    'ATOM': 'cosmos',
+    'UNI': 'uniswap',
+    'AAVE': 'aave'
+}
+
+# Stablecoins assumed to trade 1:1 with USD
+_STABLECOINS = frozenset({'USDT', 'USDC', 'BUSD', 'DAI', 'TUSD', 'FDUSD', 'USDP'})
+
+_APPROXIMATE_USD_PRICES = {
+    'BTC': 50000.0,   # Approximate BTC price (will be updated with real data)
+    'ETH': 3000.0,    # Approximate ETH price
+    'BNB': 300.0,     # Approximate BNB price
+}
+
+
+@lru_cache(maxsize=4096)
+def _usd_eur_key(rate_date: date) -> str:
+    """Build the rate cache key for a USD/EUR rate date."""
+    return f"USD/EUR_{rate_date.isoformat()}"
+
+
+def _miss_row(key: Tuple[str, date], expiry: float) -> Tuple[str, float]:
+    """Build the misses table row for a (source, date) miss."""
+    source, miss_date = key
+    return f"{source}:{miss_date.isoformat()}", expiry
+
+
+def _miss_key(row_key: str) -> Tuple[str, date]:
+    """Parse a misses table key back into (source, date)."""
+    source, _, miss_date = row_key.rpartition(':')
+    return source, date.fromisoformat(miss_date)
+
+
+def _supports_date(client: Any, target_date: date) -> bool:
+    """Check a fallback client prices target_date, per its optional max_age_days."""
+    max_age_days = getattr(client, 'max_age_days', None)
+    return max_age_days is None or (date.today() - target_date).days <= max_age_days
+
+
+def _create_session() -> requests.Session:
+    """
+    Create an HTTP session with a pooled, retrying connection adapter.
+    
+    Returns:
+        Session to share between the exchange rate clients
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': _USER_AGENT})
+    return session
+
+
+def _close_at_exit(service_ref: 'weakref.ref[ExchangeRateService]') -> None:
+    """Close a service still alive at interpreter exit, saving its unsaved rates."""
+    service = service_ref()
+    if service is not None:
+        service.close()
+
+
+def _no_usd_price(crypto_symbol: str, transaction_date: date) -> Optional[float]:
+    """Default missing price resolver: no price."""
+    return None
+
+
+def prompt_for_usd_price(crypto_symbol: str, transaction_date: date) -> Optional[float]:
+    """
+    Missing price resolver asking the user for the price on the console.
+    
+    Args:
+        crypto_symbol: Cryptocurrency symbol
+        transaction_date: Date of transaction
+        
+    Returns:
+        Price entered in USD, or None if skipped or invalid
+    """
+    try:
+        price_input = input(f"Please enter USD price for {crypto_symbol} on {transaction_date}: ").strip()
+        if price_input:
+            price = float(price_input)
+            logging.getLogger(__name__).info(f"Manual price entered for {crypto_symbol}: ${price}")
+            return price
+    except (ValueError, KeyboardInterrupt):
+        pass
+    return None
+
+
+def _iter_ecb_observations(xml_content: bytes) -> Iterator[Tuple[Optional[str], Optional[str]]]:
+    """
+    Stream (TIME_PERIOD, value) pairs from an SDMX generic data document.
+    
+    Observations are cleared once consumed so memory stays flat, and callers
+    may stop early without the rest of the document being parsed.
+    
+    Args:
+        xml_content: Raw XML response body
+        
+    Yields:
+        Tuple of (observation date string, rate string); either may be None
+        
+    Raises:
+        XML parse errors of the active backend
+    """
+    for _, obs in ET.iterparse(BytesIO(xml_content), events=('end',), **_ITERPARSE_OPTIONS):
+        if obs.tag != _OBS_TAG:
+            continue
+        
+        # Scan the observation's children by tag rather than
+        # evaluating namespaced paths for each observation
+        obs_date_str = rate_str = None
+        for child in obs:
+            if child.tag == _OBS_DIMENSION_TAG:
+                if child.get('id') == 'TIME_PERIOD':
+                    obs_date_str = child.get('value')
+            elif child.tag == _OBS_VALUE_TAG:
+                rate_str = child.get('value')
+        
+        yield obs_date_str, rate_str
+        
+        # Drop parsed observations to keep memory flat
+        obs.clear()
+
+
+def _iter_ecb_rates(xml_content: bytes) -> Iterator['ExchangeRate']:
+    """
+    Stream the USD/EUR rates of an SDMX generic data document.
+    
+    Args:
+        xml_content: Raw XML response body
+        
+    Yields:
+        ExchangeRate for each observation with a valid date and value
+        
+    Raises:
+        XML parse errors of the active backend
+    """
+    timestamp = datetime.now()
+    for obs_date_str, rate_str in _iter_ecb_observations(xml_content):
+        try:
+            obs_date = date.fromisoformat(obs_date_str)
+            rate_value = float(rate_str)
+        except (TypeError, ValueError):
+            continue
+        
+        yield ExchangeRate(
+            date=obs_date,
+            rate=rate_value,
+            source="ECB",
+            currency_pair="USD/EUR",
+            timestamp=timestamp
+        )
+
 
-@dataclass
 class ExchangeRateError(Exception):
     """Base exception for exchange rate errors."""
-    message: str
-    source: Optional[str] = None
+    
+    __slots__ = ('message', 'source')
+    
+    def __init__(self, message: str, source: Optional[str] = None):
+        super().__init__(message, source)
+        self.message = message
+        self.source = source
     
     def __str__(self):
         return f"Exchange Rate Error ({self.source}): {self.message}"
+    
+    def __repr__(self):
+        fields = (name for cls in reversed(type(self).__mro__) for name in cls.__dict__.get('__slots__', ()))
+        return f"{type(self).__name__}({', '.join(f'{name}={getattr(self, name)!r}' for name in fields)})"
 
 
-@dataclass
 class ECBAPIError(ExchangeRateError):
     """Exception for ECB API errors."""
-    pass
+    __slots__ = ()
 
 
-@dataclass
 class RateNotFoundError(ExchangeRateError):
     """Exception when exchange rate is not found."""
-    date: Optional[str] = None
-    currency_pair: Optional[str] = None
+    
+    __slots__ = ('date', 'currency_pair')
+    
+    def __init__(self, message: str, source: Optional[str] = None,
+                 date: Optional[str] = None, currency_pair: Optional[str] = None):
+        super().__init__(message, source)
+        # Keep every field in args so the error survives pickling
+        self.args = (message, source, date, currency_pair)
+        self.date = date
+        self.currency_pair = currency_pair
 
 
-@dataclass
 class ExchangeRate:
     """Exchange rate data structure."""
-    date: date
-    rate: float
-    source: str
-    currency_pair: str
-    timestamp: datetime
+    
+    __slots__ = ('date', 'rate', 'source', 'currency_pair', '_timestamp', '_epoch')
+    
+    def __init__(self, date: date, rate: float, source: str, currency_pair: str,
+                 timestamp: datetime):
+        self.date = date
+        self.rate = rate
+        self.source = source
+        self.currency_pair = currency_pair
+        self.timestamp = timestamp
+    
+    @property
+    def timestamp(self) -> datetime:
+        return self._timestamp
+    
+    @timestamp.setter
+    def timestamp(self, value: datetime) -> None:
+        # Kept as epoch seconds too, so cache expiry is a float comparison
+        self._timestamp = value
+        self._epoch = value.timestamp()
+    
+    def _fields(self) -> Tuple[Any, ...]:
+        return (self.date, self.rate, self.source, self.currency_pair, self.timestamp)
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return (f"ExchangeRate(date={self.date!r}, rate={self.rate!r}, source={self.source!r}, "
+                f"currency_pair={self.currency_pair!r}, timestamp={self.timestamp!r})")
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -65,31 +342,29 @@ class ExchangeRate:
     def from_dict(cls, data: Dict[str, Any]) -> 'ExchangeRate':
         """Create from dictionary."""
         return cls(
-            date=datetime.fromisoformat(data['date']).date(),
-            rate=float(data['rate']),
-            source=data['source'],
-            currency_pair=data['currency_pair'],
-            timestamp=datetime.fromisoformat(data['timestamp'])
+            date.fromisoformat(data['date']),
+            float(data['rate']),
+            data['source'],
+            data['currency_pair'],
+            datetime.fromisoformat(data['timestamp'])
         )
 
 
 class ECBClient:
     """European Central Bank API client for official USD/EUR exchange rates."""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, session: Optional[requests.Session] = None):
         """
         Initialize ECB client.
         
         Args:
             timeout: Request timeout in seconds
+            session: HTTP session to use (a new one is created if not given)
         """
         self.base_url = "https://sdw-wsrest.ecb.europa.eu/service/data/"
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Accept': 'application/vnd.sdmx.data+xml;version=2.1',
-            'User-Agent': 'Binance-FEC-Extractor/1.0'
-        })
+        self.session = session or _create_session()
+        self.headers = {'Accept': 'application/vnd.sdmx.data+xml;version=2.1'}
         self.logger = logging.getLogger(__name__)
     
     def get_usd_eur_rate(self, target_date: date) -> Optional[ExchangeRate]:
@@ -105,28 +380,32 @@ class ECBClient:
         Raises:
             ECBAPIError: If API request fails
         """
+        # ECB publishes no rates on weekends
+        if target_date.weekday() >= 5:
+            return None
+        
         try:
             # Format date for ECB API (YYYY-MM-DD)
-            date_str = target_date.strftime('%Y-%m-%d')
+            date_str = target_date.isoformat()
             
             # ECB API endpoint for USD/EUR daily rates
             # EXR = Exchange Rates, D = Daily, USD = US Dollar, EUR = Euro, SP00 = Spot, A = Average
             endpoint = f"EXR/D.USD.EUR.SP00.A?startPeriod={date_str}&endPeriod={date_str}"
             url = urljoin(self.base_url, endpoint)
             
-            self.logger.debug(f"Requesting ECB rate for {date_str}: {url}")
+            self.logger.debug("Requesting ECB rate for %s: %s", date_str, url)
             
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, headers=self.headers, timeout=self.timeout)
             response.raise_for_status()
             
             # Parse XML response
-            rate = self._parse_ecb_xml_response(response.text, target_date)
+            rate = self._parse_ecb_xml_response(response.content, target_date)
             
             if rate:
-                self.logger.debug(f"Retrieved ECB rate for {date_str}: {rate.rate}")
+                self.logger.debug("Retrieved ECB rate for %s: %s", date_str, rate.rate)
                 return rate
             else:
-                self.logger.debug(f"No ECB rate found for {date_str}")
+                self.logger.debug("No ECB rate found for %s", date_str)
                 return None
                 
         except requests.exceptions.RequestException as e:
@@ -134,75 +413,77 @@ class ECBClient:
         except Exception as e:
             raise ECBAPIError(f"Error parsing ECB response: {e}", source="ECB")
     
-    def _parse_ecb_xml_response(self, xml_content: str, target_date: date) -> Optional[ExchangeRate]:
+    def _parse_ecb_xml_response(self, xml_content: bytes, target_date: date) -> Optional[ExchangeRate]:
         """
         Parse ECB XML response to extract exchange rate.
         
         Args:
-            xml_content: XML response content
+            xml_content: Raw XML response body (bytes, so the parser handles the encoding)
             target_date: Target date for the rate
             
         Returns:
             ExchangeRate object or None if not found
         """
+        target = target_date.isoformat()
+        
+        # Stream observations and stop at the target date instead of building the tree
+        observations = _iter_ecb_observations(xml_content)
         try:
-            root = ET.fromstring(xml_content)
-            
-            # Define namespaces used in ECB XML
-            namespaces = {
-                'message': 'http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message',
-                'generic': 'http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic'
-            }
-            
-            # Find observation data
-            observations = root.findall('.//generic:Obs', namespaces)
-            
-            for obs in observations:
-                # Get time period
-                time_elem = obs.find('.//generic:ObsDimension[@id="TIME_PERIOD"]', namespaces)
-                if time_elem is None:
-                    continue
-                
-                obs_date_str = time_elem.get('value')
-                if not obs_date_str:
-                    continue
-                
-                # Parse date
-                try:
-                    obs_date = datetime.strptime(obs_date_str, '%Y-%m-%d').date()
-                except ValueError:
-                    continue
-                
-                # Check if this is the date we want
-                if obs_date != target_date:
-                    continue
-                
-                # Get exchange rate value
-                value_elem = obs.find('.//generic:ObsValue', namespaces)
-                if value_elem is None:
-                    continue
-                
-                rate_str = value_elem.get('value')
-                if not rate_str:
-                    continue
-                
-                try:
-                    rate_value = float(rate_str)
-                    return ExchangeRate(
-                        date=target_date,
-                        rate=rate_value,
-                        source="ECB",
-                        currency_pair="USD/EUR",
-                        timestamp=datetime.now()
-                    )
-                except ValueError:
-                    continue
+            for obs_date_str, rate_str in observations:
+                # ECB daily periods are ISO dates, so compare the strings directly
+                if obs_date_str == target and rate_str:
+                    try:
+                        return ExchangeRate(
+                            date=target_date,
+                            rate=float(rate_str),
+                            source="ECB",
+                            currency_pair="USD/EUR",
+                            timestamp=datetime.now()
+                        )
+                    except ValueError:
+                        pass
             
             return None
             
-        except ET.ParseError as e:
+        except _XMLParseError as e:
             self.logger.error(f"Failed to parse ECB XML response: {e}")
             return None
+        finally:
+            # Stop the parser now rather than when the generator is collected
+            observations.close()
+    
+    def get_usd_eur_rates_range(self, start_date: date, end_date: date) -> Dict[date, ExchangeRate]:
+        """
+        Get all USD/EUR exchange rates published by ECB in a date range, in one request.
+        
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+            
+        Returns:
+            Dictionary mapping each business day with a rate to its ExchangeRate
+            
+        Raises:
+            ECBAPIError: If API request fails
+        """
+        try:
+            endpoint = f"EXR/D.USD.EUR.SP00.A?startPeriod={start_date.isoformat()}&endPeriod={end_date.isoformat()}"
+            url = urljoin(self.base_url, endpoint)
+            
+            self.logger.debug("Requesting ECB rates from %s to %s: %s", start_date, end_date, url)
+            
+            response = self.session.get(url, headers=self.headers, timeout=self.timeout)
+            response.raise_for_status()
+            
+            rates = {rate.date: rate for rate in _iter_ecb_rates(response.content)}
+            
+            self.logger.debug("Retrieved %d ECB rates from %s to %s", len(rates), start_date, end_date)
+            return rates
+            
+        except requests.exceptions.RequestException as e:
+            raise ECBAPIError(f"ECB API request failed: {e}", source="ECB")
+        except Exception as e:
+            raise ECBAPIError(f"Error parsing ECB response: {e}", source="ECB")
     
     def get_latest_usd_eur_rate(self) -> Optional[ExchangeRate]:
         """
@@ -234,19 +515,17 @@ class ECBClient:
 class ExchangeRateAPIClient:
     """Free ExchangeRate-API client with no request limits."""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, session: Optional[requests.Session] = None):
         """
         Initialize ExchangeRate-API client.
         
         Args:
             timeout: Request timeout in seconds
+            session: HTTP session to use (a new one is created if not given)
         """
         self.base_url = "https://api.exchangerate-api.com/v4/"
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Binance-FEC-Extractor/1.0'
-        })
+        self.session = session or _create_session()
         self.logger = logging.getLogger(__name__)
     
     def get_usd_eur_rate(self, target_date: date) -> Optional[ExchangeRate]:
@@ -261,16 +540,16 @@ class ExchangeRateAPIClient:
         """
         try:
             # For historical data, use the historical endpoint
-            date_str = target_date.strftime('%Y-%m-%d')
+            date_str = target_date.isoformat()
             endpoint = f"history/USD/{date_str}"
             url = urljoin(self.base_url, endpoint)
             
-            self.logger.debug(f"Requesting ExchangeRate-API rate for {date_str}")
+            self.logger.debug("Requesting ExchangeRate-API rate for %s", date_str)
             
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             rates = data.get('rates', {})
             eur_rate = rates.get('EUR')
             
@@ -306,7 +585,7 @@ class ExchangeRateAPIClient:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             rates = data.get('rates', {})
             eur_rate = rates.get('EUR')
             
@@ -331,19 +610,17 @@ class ExchangeRateAPIClient:
 class FreeCurrencyAPIClient:
     """Free FreeCurrencyAPI client with no request limits."""
     
-    def __init__(self, timeout: int = 30):
+    def __init__(self, timeout: int = 30, session: Optional[requests.Session] = None):
         """
         Initialize FreeCurrencyAPI client.
         
         Args:
             timeout: Request timeout in seconds
+            session: HTTP session to use (a new one is created if not given)
         """
         self.base_url = "https://api.freecurrencyapi.com/v1/"
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Binance-FEC-Extractor/1.0'
-        })
+        self.session = session or _create_session()
         self.logger = logging.getLogger(__name__)
     
     def get_usd_eur_rate(self, target_date: date) -> Optional[ExchangeRate]:
@@ -358,16 +635,16 @@ class FreeCurrencyAPIClient:
         """
         try:
             # FreeCurrencyAPI historical endpoint
-            date_str = target_date.strftime('%Y-%m-%d')
+            date_str = target_date.isoformat()
             endpoint = f"historical?apikey=fca_live_free&date={date_str}&base_currency=USD&currencies=EUR"
             url = urljoin(self.base_url, endpoint)
             
-            self.logger.debug(f"Requesting FreeCurrencyAPI rate for {date_str}")
+            self.logger.debug("Requesting FreeCurrencyAPI rate for %s", date_str)
             
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             rates = data.get('data', {}).get(date_str, {})
             eur_rate = rates.get('EUR')
             
@@ -393,19 +670,21 @@ class FreeCurrencyAPIClient:
 class CoinbaseClient:
     """Coinbase API client for exchange rates (no rate limits on public endpoints)."""
     
-    def __init__(self, timeout: int = 30):
+    # Oldest date, in days before today, the client prices; older dates are
+    # refused without a request
+    max_age_days = 7
+    
+    def __init__(self, timeout: int = 30, session: Optional[requests.Session] = None):
         """
         Initialize Coinbase client.
         
         Args:
             timeout: Request timeout in seconds
+            session: HTTP session to use (a new one is created if not given)
         """
         self.base_url = "https://api.coinbase.com/v2/"
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Binance-FEC-Extractor/1.0'
-        })
+        self.session = session or _create_session()
         self.logger = logging.getLogger(__name__)
     
     def get_usd_eur_rate(self, target_date: date) -> Optional[ExchangeRate]:
@@ -421,7 +700,7 @@ class CoinbaseClient:
         try:
             # Coinbase doesn't have historical data for fiat pairs in free API
             # Use current rate as approximation for recent dates
-            if (date.today() - target_date).days > 7:
+            if (date.today() - target_date).days > self.max_age_days:
                 return None
             
             endpoint = "exchange-rates?currency=USD"
@@ -430,7 +709,7 @@ class CoinbaseClient:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             rates = data.get('data', {}).get('rates', {})
             eur_rate = rates.get('EUR')
             
@@ -456,19 +735,21 @@ class CoinbaseClient:
 class CoinGeckoClient:
     """CoinGecko API client for cryptocurrency prices (used sparingly as last resort)."""
     
-    def __init__(self, timeout: int = 30):
+    # Oldest date, in days before today, the client prices; older dates are
+    # refused without a request
+    max_age_days = 3
+    
+    def __init__(self, timeout: int = 30, session: Optional[requests.Session] = None):
         """
         Initialize CoinGecko client.
         
         Args:
             timeout: Request timeout in seconds
+            session: HTTP session to use (a new one is created if not given)
         """
         self.base_url = "https://api.coingecko.com/api/v3/"
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Binance-FEC-Extractor/1.0'
-        })
+        self.session = session or _create_session()
         self.logger = logging.getLogger(__name__)
     
     def get_usd_eur_rate(self, target_date: date) -> Optional[ExchangeRate]:
@@ -482,7 +763,7 @@ class CoinGeckoClient:
             ExchangeRate object or None if not found
         """
         # Only use CoinGecko for very recent dates to minimize API usage
-        if (date.today() - target_date).days > 3:
+        if (date.today() - target_date).days > self.max_age_days:
             return None
             
         try:
@@ -493,7 +774,7 @@ class CoinGeckoClient:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             tether_data = data.get('tether', {})
             
             usd_price = tether_data.get('usd', 1.0)
@@ -528,25 +809,7 @@ class CoinGeckoClient:
             Price in USD or None if not found
         """
         try:
-            # Map common symbols to CoinGecko IDs
-            symbol_map = {
-                'BTC': 'bitcoin',
-                'ETH': 'ethereum',
-                'BNB': 'binancecoin',
-                'ADA': 'cardano',
-                'DOT': 'polkadot',
-                'LINK': 'chainlink',
-                'LTC': 'litecoin',
-                'XRP': 'ripple',
-                'SOL': 'solana',
-                'MATIC': 'matic-network',
-                'AVAX': 'avalanche-2',
-                'ATOM': 'cosmos',
-                'UNI': 'uniswap',
-                'AAVE': 'aave'
-            }
-            
-            coin_id = symbol_map.get(symbol.upper(), symbol.lower())
+            coin_id = _COINGECKO_IDS.get(symbol.upper(), symbol.lower())
             date_str = target_date.strftime('%d-%m-%Y')
             
             endpoint = f"coins/{coin_id}/history?date={date_str}"
@@ -555,7 +818,7 @@ class CoinGeckoClient:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             market_data = data.get('market_data', {})
             current_price = market_data.get('current_price', {})
             
@@ -566,6 +829,140 @@ class CoinGeckoClient:
             return None
 
 
+class _RateCache(dict):
+    """
+    Rate cache dict that indexes entry expiries in a min-heap.
+    
+    Expired entries are found by popping the heap instead of scanning every
+    rate. Heap items left behind by replaced or deleted entries are skipped.
+    
+    Entries keyed "PAIR_YYYY-MM-DD" are also indexed per pair by date, so
+    lookups need no key formatting, and by recency: the _LATEST_RATES
+    latest-dated entries, with no cached date missing between them, so the
+    rates preceding a recent date are read without lookups.
+    """
+    
+    def __init__(self, duration: float):
+        super().__init__()
+        self.duration = duration
+        # (expiry epoch, key), smallest expiry first
+        self._expiries: List[Tuple[float, str]] = []
+        # Currency pair -> key date -> rate
+        self._dated: Dict[str, Dict[date, 'ExchangeRate']] = {}
+        # Currency pair -> (key date, rate) of its latest entries, oldest first
+        self._latest: Dict[str, Deque[Tuple[date, 'ExchangeRate']]] = {}
+        self._max_date: Dict[str, date] = {}
+    
+    def __setitem__(self, key: str, rate: 'ExchangeRate') -> None:
+        super().__setitem__(key, rate)
+        heapq.heappush(self._expiries, (rate._epoch + self.duration, key))
+        self._index(key, rate)
+    
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        pair, _, day = key.rpartition('_')
+        dated = self._dated.get(pair)
+        if dated:
+            try:
+                dated.pop(date.fromisoformat(day), None)
+            except ValueError:
+                pass
+        # The latest rates must not have gaps, so rebuild them from later entries
+        self._latest.pop(pair, None)
+    
+    def _index(self, key: str, rate: 'ExchangeRate') -> None:
+        pair, _, day = key.rpartition('_')
+        try:
+            key_date = date.fromisoformat(day)
+        except ValueError:
+            return
+        
+        dated = self._dated.get(pair)
+        if dated is None:
+            dated = self._dated[pair] = {}
+        dated[key_date] = rate
+        
+        latest = self._latest.get(pair)
+        if latest is None:
+            latest = self._latest[pair] = deque(maxlen=_LATEST_RATES)
+        
+        max_date = self._max_date.get(pair)
+        if max_date is None or key_date > max_date:
+            latest.append((key_date, rate))
+            self._max_date[pair] = key_date
+            return
+        
+        for i, (entry_date, _) in enumerate(latest):
+            if entry_date == key_date:
+                latest[i] = (key_date, rate)
+                return
+        if latest and key_date > latest[0][0]:
+            # A date between indexed ones would leave a gap; start over
+            latest.clear()
+    
+    def get_dated(self, pair: str, key_date: date) -> Optional['ExchangeRate']:
+        """Get the rate of a currency pair cached under a date, if any."""
+        dated = self._dated.get(pair)
+        return dated.get(key_date) if dated else None
+    
+    def latest_before(self, pair: str, before: date) -> List[Tuple[date, 'ExchangeRate']]:
+        """
+        Get indexed entries of a currency pair dated before a date.
+        
+        No cached date between the first returned entry and the given date
+        is missing from the result.
+        
+        Args:
+            pair: Currency pair
+            before: Exclusive upper date bound
+            
+        Returns:
+            (key date, rate) tuples, oldest first
+        """
+        return [entry for entry in self._latest.get(pair, ()) if entry[0] < before]
+    
+    def update(self, *args, **kwargs) -> None:
+        for key, rate in dict(*args, **kwargs).items():
+            self[key] = rate
+    
+    def clear(self) -> None:
+        super().clear()
+        self._expiries.clear()
+        self._dated.clear()
+        self._latest.clear()
+        self._max_date.clear()
+    
+    def expired_keys(self, now: float, evict: bool = False) -> List[str]:
+        """
+        Find the entries that expired by now.
+        
+        Args:
+            now: Epoch to compare expiries against
+            evict: Also remove the expired entries
+            
+        Returns:
+            Keys of the expired entries
+        """
+        heap = self._expiries
+        stale = []
+        while heap and heap[0][0] <= now:
+            stale.append(heapq.heappop(heap))
+        
+        expired = {}
+        for expiry, key in stale:
+            rate = self.get(key)
+            # Skip items for entries since replaced or deleted
+            if rate is None or rate._epoch + self.duration != expiry or key in expired:
+                continue
+            expired[key] = None
+            if evict:
+                del self[key]
+        if not evict:
+            for expiry, key in stale:
+                heapq.heappush(heap, (expiry, key))
+        return list(expired)
+
+
 class ExchangeRateService:
     """
     Main exchange rate service with ECB primary source and fallback mechanisms.
@@ -582,19 +979,58 @@ class ExchangeRateService:
         self.cache_duration = config.exchange_rates.cache_duration
         self.max_rate_age_days = getattr(config.exchange_rates, 'max_rate_age_days', 5)
         
-        # Initialize clients
-        self.ecb_client = ECBClient(timeout=config.api.timeout)
-        self.exchangerate_api_client = ExchangeRateAPIClient(timeout=config.api.timeout)
-        self.freecurrency_api_client = FreeCurrencyAPIClient(timeout=config.api.timeout)
-        self.coinbase_client = CoinbaseClient(timeout=config.api.timeout)
-        self.coingecko_client = CoinGeckoClient(timeout=config.api.timeout)  # Last resort
+        # Initialize clients, sharing one connection pool
+        self.session = _create_session()
+        timeout = config.api.timeout
+        self.ecb_client = ECBClient(timeout=timeout, session=self.session)
+        self.exchangerate_api_client = ExchangeRateAPIClient(timeout=timeout, session=self.session)
+        self.freecurrency_api_client = FreeCurrencyAPIClient(timeout=timeout, session=self.session)
+        self.coinbase_client = CoinbaseClient(timeout=timeout, session=self.session)
+        self.coingecko_client = CoinGeckoClient(timeout=timeout, session=self.session)  # Last resort
         
-        # Cache setup
-        self.cache_file = Path(config.output.directory) / "exchange_rate_cache.json"
-        self.rate_cache: Dict[str, ExchangeRate] = {}
-        self.load_cache()
+        # Free fallback sources (no rate limits), in the order they are tried
+        self._free_sources = [
+            ('exchangerate-api', self.exchangerate_api_client),
+            ('freecurrency-api', self.freecurrency_api_client),
+            ('coinbase', self.coinbase_client),
+        ]
+        # Fallback source -> (consecutive failures, disabled until epoch)
+        self._breaker: Dict[str, Tuple[int, float]] = {}
+        
+        # Configured fallback sources, resolved once by lowercase name
+        self._fallback_map = {
+            'exchangerate-api': self.exchangerate_api_client,
+            'freecurrency-api': self.freecurrency_api_client,
+            'coinbase': self.coinbase_client,
+            'coingecko': self.coingecko_client,
+        }
+        self._fallback_sources = [
+            (source, source.lower()) for source in config.exchange_rates.fallback_sources
+        ]
         
         self.logger = logging.getLogger(__name__)
+        
+        # Supplies crypto USD prices no source has; install prompt_for_usd_price
+        # or a batch lookup. The default resolves nothing.
+        self.missing_price_resolver: Callable[[str, date], Optional[float]] = _no_usd_price
+        
+        # Cache setup
+        self.cache_file = Path(config.output.directory) / "exchange_rate_cache.db"
+        self._db: Optional[sqlite3.Connection] = None
+        self.rate_cache: Dict[str, ExchangeRate] = _RateCache(self.cache_duration)
+        # (source, date) -> epoch after which the source may be asked again
+        self._negative_cache: Dict[Tuple[str, date], float] = {}
+        # Entries cached since the last flush
+        self._unsaved: Dict[str, ExchangeRate] = {}
+        self._unsaved_misses: Dict[Tuple[str, date], float] = {}
+        # Guards rate_cache against a background prefetch
+        self._cache_lock = threading.RLock()
+        # (start, end, done) of the latest prefetch_range_async call
+        self._pending_prefetch: Optional[Tuple[date, date, threading.Event]] = None
+        self.load_cache()
+        # Saves unflushed rates if the service is never closed
+        self._exit_hook = partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._exit_hook)
     
     def get_usd_eur_rate(self, target_date: date) -> ExchangeRate:
         """
@@ -609,28 +1045,31 @@ class ExchangeRateService:
         Raises:
             RateNotFoundError: If no rate can be found
         """
-        cache_key = f"USD/EUR_{target_date.isoformat()}"
+        # Check cache first, once a background prefetch covering the date is done
+        self._wait_for_prefetch(target_date)
+        self._evict_expired()
+        cached_rate = self._cached_usd_eur_rate(target_date)
+        if cached_rate:
+            self.logger.debug("Using cached USD/EUR rate for %s", target_date)
+            return cached_rate
         
-        # Check cache first
-        if cache_key in self.rate_cache:
-            cached_rate = self.rate_cache[cache_key]
-            if self._is_cache_valid(cached_rate):
-                self.logger.debug(f"Using cached USD/EUR rate for {target_date}")
-                return cached_rate
+        cache_key = _usd_eur_key(target_date)
         
-        # Try ECB first (primary source)
-        try:
-            rate = self.ecb_client.get_usd_eur_rate(target_date)
-            if rate:
-                self._cache_rate(cache_key, rate)
-                return rate
-        except ECBAPIError as e:
-            self.logger.warning(f"ECB API failed for {target_date}: {e}")
+        # Try ECB first (primary source); weekends go straight to the closest rate
+        if target_date.weekday() < 5 and not self._is_known_miss('ecb', target_date):
+            try:
+                rate = self.ecb_client.get_usd_eur_rate(target_date)
+                if rate:
+                    self._cache_rate(cache_key, rate)
+                    return rate
+            except ECBAPIError as e:
+                self.logger.warning("ECB API failed for %s: %s", target_date, e)
+            self._remember_miss('ecb', target_date)
         
         # Try to find closest ECB rate within max_rate_age_days
         closest_rate = self._find_closest_ecb_rate(target_date)
         if closest_rate:
-            self.logger.info(f"Using closest ECB rate from {closest_rate.date} for {target_date}")
+            self.logger.info("Using closest ECB rate from %s for %s", closest_rate.date, target_date)
             # Cache with original date for future lookups
             self._cache_rate(cache_key, ExchangeRate(
                 date=target_date,
@@ -642,47 +1081,45 @@ class ExchangeRateService:
             return closest_rate
         
         # Try free fallback sources (no rate limits)
-        free_sources = [
-            ('exchangerate-api', self.exchangerate_api_client),
-            ('freecurrency-api', self.freecurrency_api_client),
-            ('coinbase', self.coinbase_client),
-        ]
-        
-        for source_name, client in free_sources:
+        for source_name, client in self._free_sources:
+            # A refused date is a miss that made no request, so the breaker ignores it
+            if (not _supports_date(client, target_date) or self._is_known_miss(source_name, target_date)
+                    or self._breaker_open(source_name)):
+                continue
             try:
                 rate = client.get_usd_eur_rate(target_date)
                 if rate:
-                    self.logger.info(f"Using free fallback source {source_name} for {target_date}")
+                    self._record_fallback_result(source_name, True)
+                    self.logger.info("Using free fallback source %s for %s", source_name, target_date)
                     self._cache_rate(cache_key, rate)
                     return rate
             except Exception as e:
-                self.logger.warning(f"Free fallback source {source_name} failed for {target_date}: {e}")
+                self.logger.warning("Free fallback source %s failed for %s: %s", source_name, target_date, e)
+            self._record_fallback_result(source_name, False)
+            self._remember_miss(source_name, target_date)
         
         # Try configured fallback sources
-        for source in self.config.exchange_rates.fallback_sources:
+        for source, source_key in self._fallback_sources:
+            client = self._fallback_map.get(source_key)
+            if client is None:
+                self.logger.warning("Unknown fallback source: %s", source)
+                continue
+            if (not _supports_date(client, target_date) or self._is_known_miss(source_key, target_date)
+                    or self._breaker_open(source_key)):
+                continue
+            
             try:
-                rate = None
-                
-                if source.lower() == 'exchangerate-api':
-                    rate = self.exchangerate_api_client.get_usd_eur_rate(target_date)
-                elif source.lower() == 'freecurrency-api':
-                    rate = self.freecurrency_api_client.get_usd_eur_rate(target_date)
-                elif source.lower() == 'coinbase':
-                    rate = self.coinbase_client.get_usd_eur_rate(target_date)
-                elif source.lower() == 'coingecko':
-                    # Use CoinGecko sparingly as last resort
-                    rate = self.coingecko_client.get_usd_eur_rate(target_date)
-                else:
-                    self.logger.warning(f"Unknown fallback source: {source}")
-                    continue
-                
+                rate = client.get_usd_eur_rate(target_date)
                 if rate:
-                    self.logger.info(f"Using configured fallback source {source} for {target_date}")
+                    self._record_fallback_result(source_key, True)
+                    self.logger.info("Using configured fallback source %s for %s", source, target_date)
                     self._cache_rate(cache_key, rate)
                     return rate
                     
             except Exception as e:
-                self.logger.warning(f"Configured fallback source {source} failed for {target_date}: {e}")
+                self.logger.warning("Configured fallback source %s failed for %s: %s", source, target_date, e)
+            self._record_fallback_result(source_key, False)
+            self._remember_miss(source_key, target_date)
         
         # If all else fails, raise error
         raise RateNotFoundError(
@@ -701,28 +1138,132 @@ class ExchangeRateService:
         Returns:
             Closest ExchangeRate or None
         """
-        # Try dates before and after the target date
+        # Candidate dates, nearest first and earlier before later
+        today = date.today()
+        candidates = []
         for days_offset in range(1, self.max_rate_age_days + 1):
-            # Try earlier dates first (more recent rates are preferred)
-            for date_offset in [-days_offset, days_offset]:
+            for date_offset in (-days_offset, days_offset):
                 check_date = target_date + timedelta(days=date_offset)
                 
-                # Don't check future dates beyond today
-                if check_date > date.today():
-                    continue
-                
-                # Skip weekends for ECB
-                if check_date.weekday() >= 5:
-                    continue
-                
-                try:
-                    rate = self.ecb_client.get_usd_eur_rate(check_date)
-                    if rate:
-                        return rate
-                except ECBAPIError:
+                # Don't check future dates beyond today, nor weekends for ECB
+                if check_date > today or check_date.weekday() >= 5:
                     continue
+                candidates.append(check_date)
         
-        return None
+        # Use rates already fetched, e.g. by prefetch(); only dates nearer
+        # than the nearest cached one are worth a request
+        cached_rate = None
+        to_fetch = []
+        now = time.time()
+        for check_date in candidates:
+            rate = self._cached_usd_eur_rate(check_date, now)
+            if rate and rate.source == "ECB":
+                cached_rate = rate
+                break
+            if not self._is_known_miss('ecb', check_date):
+                to_fetch.append(check_date)
+        
+        fetched = self._fetch_ecb_rates(to_fetch)
+        closest_rate = None
+        for check_date, rate in zip(to_fetch, fetched):
+            if rate is None:
+                self._remember_miss('ecb', check_date)
+            elif closest_rate is None:
+                closest_rate = rate
+        
+        return closest_rate or cached_rate
+    
+    def _fetch_ecb_rates(self, dates: List[date]) -> List[Optional[ExchangeRate]]:
+        """
+        Get the ECB rates for several dates, in as few round trips as possible.
+        
+        One range request covers all the dates; if it fails, the dates are
+        requested individually and concurrently.
+        
+        Args:
+            dates: Dates to look up
+            
+        Returns:
+            Rate or None for each date, in the same order
+        """
+        if len(dates) > 1:
+            try:
+                rates = self.ecb_client.get_usd_eur_rates_range(min(dates), max(dates))
+            except ECBAPIError as e:
+                self.logger.debug("ECB range request failed, requesting dates one by one: %s", e)
+            else:
+                # Keep the whole series, neighbouring lookups will need it
+                self._cache_usd_eur_rates(rates)
+                return [rates.get(check_date) for check_date in dates]
+        
+        # The lookups are independent, so issue them concurrently
+        return list(_ECB_SCAN_EXECUTOR.map(self._get_ecb_rate_or_none, dates))
+    
+    def _get_ecb_rate_or_none(self, target_date: date) -> Optional[ExchangeRate]:
+        """Get the ECB rate for a date, treating API errors as no rate."""
+        try:
+            return self.ecb_client.get_usd_eur_rate(target_date)
+        except ECBAPIError:
+            return None
+    
+    def prefetch(self, start_date: date, end_date: date) -> Dict[date, ExchangeRate]:
+        """
+        Fetch and cache the ECB rates for a whole date range in a single request.
+        
+        Later get_usd_eur_rate calls for dates in the range are then served
+        from the cache instead of issuing one request per date.
+        
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+            
+        Returns:
+            Dictionary of the rates fetched, by date (empty if ECB is unavailable)
+        """
+        try:
+            rates = self.ecb_client.get_usd_eur_rates_range(start_date, end_date)
+        except ECBAPIError as e:
+            self.logger.warning("ECB range request failed for %s to %s: %s", start_date, end_date, e)
+            return {}
+        
+        self._cache_usd_eur_rates(rates)
+        return rates
+    
+    def prefetch_range_async(self, start_date: date, end_date: date) -> threading.Thread:
+        """
+        Start prefetching the ECB rates for a date range in the background.
+        
+        This lets the range request overlap with other work, e.g. reading the
+        transactions. get_usd_eur_rate calls for dates in the range wait for
+        the prefetch to finish instead of issuing their own requests.
+        
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+            
+        Returns:
+            The started daemon thread
+        """
+        done = threading.Event()
+        self._pending_prefetch = (start_date, end_date, done)
+        
+        def run():
+            try:
+                self.prefetch(start_date, end_date)
+            except Exception as e:
+                self.logger.error("Background prefetch failed for %s to %s: %s", start_date, end_date, e)
+            finally:
+                done.set()
+        
+        thread = threading.Thread(target=run, name='ecb-prefetch', daemon=True)
+        thread.start()
+        return thread
+    
+    def _wait_for_prefetch(self, target_date: date) -> None:
+        """Block until a background prefetch covering target_date has finished."""
+        pending = self._pending_prefetch
+        if pending is not None and pending[0] <= target_date <= pending[1]:
+            pending[2].wait()
     
     def convert_crypto_to_usd(self, amount: float, crypto_symbol: str, 
                             transaction_date: date) -> Tuple[float, float]:
@@ -740,26 +1281,21 @@ class ExchangeRateService:
         Raises:
             RateNotFoundError: If crypto price cannot be found
         """
+        symbol = crypto_symbol.upper()
+        
         # For stablecoins, assume 1:1 with USD
-        stablecoins = {'USDT', 'USDC', 'BUSD', 'DAI', 'TUSD', 'FDUSD', 'USDP'}
-        if crypto_symbol.upper() in stablecoins:
+        if symbol in _STABLECOINS:
             return amount, 1.0
         
         # Try to get crypto price from free sources first
         crypto_usd_price = None
         
-        # For major cryptocurrencies, try to use the USD/EUR rate as approximation
+        # For major cryptocurrencies, use an approximate price
         # This is a simplified approach for free solution
-        major_cryptos = {
-            'BTC': 50000.0,   # Approximate BTC price (will be updated with real data)
-            'ETH': 3000.0,    # Approximate ETH price
-            'BNB': 300.0,     # Approximate BNB price
-        }
-        
-        if crypto_symbol.upper() in major_cryptos:
+        if symbol in _APPROXIMATE_USD_PRICES:
             # Use approximate price - in a real implementation, you'd want to
             # get this from Binance API or cache recent prices
-            crypto_usd_price = major_cryptos[crypto_symbol.upper()]
+            crypto_usd_price = _APPROXIMATE_USD_PRICES[symbol]
             self.logger.warning(f"Using approximate price for {crypto_symbol}: ${crypto_usd_price}")
         else:
             # For other cryptos, try CoinGecko as last resort
@@ -769,15 +1305,9 @@ class ExchangeRateService:
                 self.logger.error(f"Failed to get {crypto_symbol} price from CoinGecko: {e}")
         
         if crypto_usd_price is None:
-            # Fallback: ask for manual input
+            # Fallback: let the installed resolver supply a price
             self.logger.warning(f"No automatic price found for {crypto_symbol} on {transaction_date}")
-            try:
-                price_input = input(f"Please enter USD price for {crypto_symbol} on {transaction_date}: ").strip()
-                if price_input:
-                    crypto_usd_price = float(price_input)
-                    self.logger.info(f"Manual price entered for {crypto_symbol}: ${crypto_usd_price}")
-            except (ValueError, KeyboardInterrupt):
-                pass
+            crypto_usd_price = self.missing_price_resolver(crypto_symbol, transaction_date)
         
         if crypto_usd_price is None:
             raise RateNotFoundError(
@@ -825,64 +1355,261 @@ class ExchangeRateService:
         
         return eur_amount, usd_amount, exchange_rate
     
-    def _is_cache_valid(self, rate: ExchangeRate) -> bool:
-        """Check if cached rate is still valid."""
-        age = datetime.now() - rate.timestamp
-        return age.total_seconds() < self.cache_duration
+    def convert_crypto_to_eur_batch(self, amounts: Sequence[float], crypto_symbols: Sequence[str],
+                                    transaction_dates: Sequence[date]) -> Tuple[List[float], List[float], List[ExchangeRate]]:
+        """
+        Convert many cryptocurrency amounts to EUR via USD.
+        
+        The ECB rates for all the dates are fetched in a single range request,
+        then each distinct date's rate and each distinct (symbol, date) price
+        is resolved once, however many rows share it.
+        
+        Args:
+            amounts: Amounts in cryptocurrency
+            crypto_symbols: Cryptocurrency symbol of each amount
+            transaction_dates: Transaction date of each amount
+            
+        Returns:
+            Tuple of (eur_amounts, usd_amounts, exchange_rates), one entry per row
+            
+        Raises:
+            RateNotFoundError: If a crypto price or exchange rate cannot be found
+        """
+        rows = list(zip(amounts, crypto_symbols, transaction_dates))
+        if not rows:
+            return [], [], []
+        
+        # One ECB request for every date not already cached
+        dates = {row_date for _, _, row_date in rows}
+        now = time.time()
+        uncached = [
+            row_date for row_date in dates
+            if not self._cached_usd_eur_rate(row_date, now)
+        ]
+        if uncached:
+            self.prefetch(min(uncached), max(uncached))
+        
+        prices = {
+            (symbol, row_date): self.convert_crypto_to_usd(1.0, symbol, row_date)[1]
+            for symbol, row_date in {(symbol, row_date) for _, symbol, row_date in rows}
+        }
+        rates = {row_date: self.get_usd_eur_rate(row_date) for row_date in dates}
+        
+        usd_amounts = [amount * prices[symbol, row_date] for amount, symbol, row_date in rows]
+        exchange_rates = [rates[row_date] for _, _, row_date in rows]
+        eur_amounts = [usd_amount * rate.rate for usd_amount, rate in zip(usd_amounts, exchange_rates)]
+        
+        self.flush()
+        return eur_amounts, usd_amounts, exchange_rates
+    
+    def _is_cache_valid(self, rate: ExchangeRate, now: Optional[float] = None) -> bool:
+        """
+        Check if cached rate is still valid.
+        
+        Args:
+            rate: Cached rate
+            now: Current epoch, taken once by callers checking many rates
+        """
+        if now is None:
+            now = time.time()
+        return rate._epoch + self.cache_duration > now
+    
+    def _evict_expired(self) -> int:
+        """Drop expired rates from the in-memory cache, returning how many."""
+        with self._cache_lock:
+            return len(self.rate_cache.expired_keys(time.time(), evict=True))
+    
+    def _cached_usd_eur_rate(self, target_date: date, now: Optional[float] = None) -> Optional[ExchangeRate]:
+        """Get the valid cached USD/EUR rate for a date, if any."""
+        rate = self.rate_cache.get_dated("USD/EUR", target_date)
+        if rate is not None and self._is_cache_valid(rate, now):
+            return rate
+        return None
     
     def _cache_rate(self, key: str, rate: ExchangeRate) -> None:
-        """Cache exchange rate."""
-        self.rate_cache[key] = rate
-        self.save_cache()
+        """Cache exchange rate; it is persisted by the next flush."""
+        with self._cache_lock:
+            self.rate_cache[key] = rate
+            self._unsaved[key] = rate
+            if len(self._unsaved) >= _FLUSH_EVERY:
+                self.flush()
+    
+    def flush(self) -> None:
+        """
+        Persist the rates and misses cached since the last flush.
+        
+        Single lookups are only written every _FLUSH_EVERY new rates;
+        close() and interpreter exit flush the rest.
+        """
+        with self._cache_lock:
+            rates = list(self._unsaved.items())
+            misses = list(self._unsaved_misses.items())
+            self._unsaved.clear()
+            self._unsaved_misses.clear()
+            self._store(rates, misses)
+    
+    def close(self) -> None:
+        """Flush unsaved cache entries and close the cache database and HTTP session."""
+        atexit.unregister(self._exit_hook)
+        with self._cache_lock:
+            self.flush()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        self.session.close()
+        self.logger.debug("Exchange rate service closed")
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    def _cache_usd_eur_rates(self, rates: Dict[date, ExchangeRate]) -> None:
+        """Cache a series of USD/EUR rates under their dates."""
+        with self._cache_lock:
+            items = [(_usd_eur_key(rate_date), rate) for rate_date, rate in rates.items()]
+            self.rate_cache.update(items)
+            self._store(items)
+    
+    def _is_known_miss(self, source: str, target_date: date) -> bool:
+        """Check whether a source recently had no rate for a date."""
+        return self._negative_cache.get((source, target_date), 0) > time.time()
+    
+    def _remember_miss(self, source: str, target_date: date) -> None:
+        """Skip a source for a date it had no rate for, until the miss expires."""
+        key = (source, target_date)
+        with self._cache_lock:
+            self._negative_cache[key] = self._unsaved_misses[key] = time.time() + _NEGATIVE_CACHE_TTL
+    
+    def _get_db(self) -> sqlite3.Connection:
+        """Open the cache database, creating it on first use."""
+        if self._db is None:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Also used by background prefetches, always under _cache_lock
+            self._db = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+            if self._db.execute("PRAGMA user_version").fetchone()[0] != _CACHE_SCHEMA_VERSION:
+                self._db.executescript("DROP TABLE IF EXISTS rates; DROP TABLE IF EXISTS misses;")
+                self._db.execute(f"PRAGMA user_version = {_CACHE_SCHEMA_VERSION}")
+            for statement in _CACHE_SCHEMA:
+                self._db.execute(statement)
+        return self._db
+    
+    def _rate_row(self, key: str, rate: ExchangeRate) -> Tuple[Any, ...]:
+        """Build the rates table row for a cached rate."""
+        ts = rate._epoch
+        return (key, rate.date.toordinal(), rate.rate, rate.source, rate.currency_pair,
+                ts, ts + self.cache_duration)
+    
+    def _store(self, rates: List[Tuple[str, ExchangeRate]],
+               misses: List[Tuple[Tuple[str, date], float]] = ()) -> None:
+        """Insert or replace rates and misses in the cache database, in one transaction."""
+        if not rates and not misses:
+            return
+        try:
+            with self._cache_lock:
+                db = self._get_db()
+                with db:
+                    db.executemany(_INSERT_RATE, [self._rate_row(key, rate) for key, rate in rates])
+                    db.executemany(_INSERT_MISS, [_miss_row(key, expiry) for key, expiry in misses])
+        except Exception as e:
+            self.logger.error("Failed to save exchange rate cache: %s", e)
+    
+    def _breaker_open(self, source: str) -> bool:
+        """Check whether a fallback source is disabled after repeated failures."""
+        return self._breaker.get(source, (0, 0.0))[1] > time.time()
+    
+    def _record_fallback_result(self, source: str, success: bool) -> None:
+        """
+        Track consecutive fallback source failures.
+        
+        After _BREAKER_THRESHOLD failures in a row the source is skipped for
+        _BREAKER_COOLDOWN seconds; one more failure after that disables it again.
+        
+        Args:
+            source: Fallback source name
+            success: Whether the source returned a rate
+        """
+        with self._cache_lock:
+            if success:
+                self._breaker.pop(source, None)
+                return
+            
+            failures = self._breaker.get(source, (0, 0.0))[0] + 1
+            tripped = failures >= _BREAKER_THRESHOLD
+            self._breaker[source] = (failures, time.time() + _BREAKER_COOLDOWN if tripped else 0.0)
+        
+        if tripped:
+            self.logger.warning("Disabling fallback source %s for %.0fs after %d failures", source, _BREAKER_COOLDOWN, failures)
     
     def load_cache(self) -> None:
-        """Load exchange rate cache from file."""
+        """Load unexpired exchange rates and misses from the cache database."""
         try:
             if self.cache_file.exists():
-                with open(self.cache_file, 'r') as f:
-                    cache_data = json.load(f)
+                db = self._get_db()
+                now = time.time()
                 
-                for key, rate_data in cache_data.items():
-                    try:
-                        self.rate_cache[key] = ExchangeRate.from_dict(rate_data)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to load cached rate {key}: {e}")
+                rows = db.execute(
+                    "SELECT key, date, rate, source, pair, ts FROM rates WHERE expires > ?", (now,)
+                )
+                for key, ordinal, rate, source, pair, ts in rows:
+                    self.rate_cache[key] = ExchangeRate(
+                        date.fromordinal(ordinal), rate, source, pair, datetime.fromtimestamp(ts)
+                    )
+                
+                self._negative_cache = {
+                    _miss_key(key): expiry
+                    for key, expiry in db.execute("SELECT key, expires FROM misses WHERE expires > ?", (now,))
+                }
                 
-                self.logger.debug(f"Loaded {len(self.rate_cache)} cached exchange rates")
+                self.logger.debug("Loaded %d cached exchange rates", len(self.rate_cache))
         except Exception as e:
-            self.logger.warning(f"Failed to load exchange rate cache: {e}")
-            self.rate_cache = {}
+            self.logger.warning("Failed to load exchange rate cache: %s", e)
+            self.rate_cache.clear()
+            self._negative_cache = {}
     
     def save_cache(self) -> None:
-        """Save exchange rate cache to file."""
+        """Replace the cache database contents with the valid in-memory entries."""
         try:
-            # Ensure output directory exists
-            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Convert cache to serializable format
-            cache_data = {
-                key: rate.to_dict() 
-                for key, rate in self.rate_cache.items()
-                if self._is_cache_valid(rate)  # Only save valid cache entries
-            }
-            
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
-            
-            self.logger.debug(f"Saved {len(cache_data)} exchange rates to cache")
+            with self._cache_lock:
+                now = time.time()
+                # Only save valid cache entries: drop the expired ones first
+                self.rate_cache.expired_keys(now, evict=True)
+                rates = [self._rate_row(key, rate) for key, rate in self.rate_cache.items()]
+                misses = [_miss_row(key, expiry) for key, expiry in self._negative_cache.items() if expiry > now]
+                self._unsaved.clear()
+                self._unsaved_misses.clear()
+                
+                db = self._get_db()
+                with db:
+                    db.execute("DELETE FROM rates")
+                    db.executemany(_INSERT_RATE, rates)
+                    db.execute("DELETE FROM misses")
+                    db.executemany(_INSERT_MISS, misses)
+            
+            self.logger.debug("Saved %d exchange rates and %d misses to cache", len(rates), len(misses))
         except Exception as e:
-            self.logger.error(f"Failed to save exchange rate cache: {e}")
+            self.logger.error("Failed to save exchange rate cache: %s", e)
     
     def clear_cache(self) -> None:
         """Clear exchange rate cache."""
-        self.rate_cache.clear()
-        if self.cache_file.exists():
-            self.cache_file.unlink()
+        with self._cache_lock:
+            self.rate_cache.clear()
+            self._negative_cache.clear()
+            self._unsaved.clear()
+            self._unsaved_misses.clear()
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            self.cache_file.unlink(missing_ok=True)
         self.logger.info("Exchange rate cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        valid_entries = sum(1 for rate in self.rate_cache.values() if self._is_cache_valid(rate))
+        with self._cache_lock:
+            expired_entries = len(self.rate_cache.expired_keys(time.time()))
         
         # Calculate cache hit statistics
         cache_sources = {}
@@ -890,14 +1617,19 @@ class ExchangeRateService:
             source = rate.source
             cache_sources[source] = cache_sources.get(source, 0) + 1
         
+        try:
+            cache_file_size = self.cache_file.stat().st_size
+        except FileNotFoundError:
+            cache_file_size = 0
+        
         return {
             'total_entries': len(self.rate_cache),
-            'valid_entries': valid_entries,
-            'expired_entries': len(self.rate_cache) - valid_entries,
+            'valid_entries': len(self.rate_cache) - expired_entries,
+            'expired_entries': expired_entries,
             'cache_file': str(self.cache_file),
             'cache_duration': self.cache_duration,
             'sources': cache_sources,
-            'cache_file_size': self.cache_file.stat().st_size if self.cache_file.exists() else 0
+            'cache_file_size': cache_file_size
         }
     
     def cleanup_expired_cache(self) -> int:
@@ -907,32 +1639,28 @@ class ExchangeRateService:
         Returns:
             Number of entries removed
         """
-        expired_keys = [
-            key for key, rate in self.rate_cache.items()
-            if not self._is_cache_valid(rate)
-        ]
-        
-        for key in expired_keys:
-            del self.rate_cache[key]
+        removed = self._evict_expired()
         
-        if expired_keys:
+        if removed:
             self.save_cache()
-            self.logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
+            self.logger.info("Cleaned up %d expired cache entries", removed)
         
-        return len(expired_keys)
+        return removed
     
-    def preload_rates_for_date_range(self, start_date: date, end_date: date) -> Dict[str, Any]:
+    def preload_rates_for_date_range(self, start_date: date, end_date: date,
+                                     max_workers: int = _PRELOAD_WORKERS) -> Dict[str, Any]:
         """
         Preload exchange rates for a date range to improve performance.
         
         Args:
             start_date: Start date for preloading
             end_date: End date for preloading
+            max_workers: Number of dates looked up concurrently
             
         Returns:
             Dictionary with preloading statistics
         """
-        self.logger.info(f"Preloading exchange rates from {start_date} to {end_date}")
+        self.logger.info("Preloading exchange rates from %s to %s", start_date, end_date)
         
         stats = {
             'requested_dates': 0,
@@ -943,36 +1671,50 @@ class ExchangeRateService:
             'errors': []
         }
         
-        current_date = start_date
-        while current_date <= end_date:
-            stats['requested_dates'] += 1
-            
-            try:
-                cache_key = f"USD/EUR_{current_date.isoformat()}"
+        # Fetch the ECB series for the whole range in one request
+        prefetched = self.prefetch(start_date, end_date)
+        
+        dates = [date.fromordinal(ordinal) for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1)]
+        stats['requested_dates'] = len(dates)
+        
+        pending = []
+        now = time.time()
+        for current_date in dates:
+            # Check if already cached
+            if current_date in prefetched:
+                stats['ecb_success'] += 1
+            elif self._cached_usd_eur_rate(current_date, now):
+                stats['cache_hits'] += 1
+            else:
+                pending.append(current_date)
+        
+        if pending:
+            # The remaining lookups wait on the network, so run them concurrently
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='rate-preload') as executor:
+                futures = [executor.submit(self.get_usd_eur_rate, pending_date) for pending_date in pending]
                 
-                # Check if already cached
-                if cache_key in self.rate_cache and self._is_cache_valid(self.rate_cache[cache_key]):
-                    stats['cache_hits'] += 1
-                else:
-                    # Try to get rate
-                    rate = self.get_usd_eur_rate(current_date)
-                    if rate.source.startswith("ECB"):
-                        stats['ecb_success'] += 1
-                    else:
-                        stats['fallback_success'] += 1
-                        
-            except RateNotFoundError as e:
-                stats['failures'] += 1
-                stats['errors'].append(f"{current_date}: {e.message}")
-                self.logger.warning(f"Failed to preload rate for {current_date}: {e}")
-            except Exception as e:
-                stats['failures'] += 1
-                stats['errors'].append(f"{current_date}: {str(e)}")
-                self.logger.error(f"Error preloading rate for {current_date}: {e}")
-            
-            current_date += timedelta(days=1)
+                for pending_date, future in zip(pending, futures):
+                    try:
+                        rate = future.result()
+                        if rate.source.startswith("ECB"):
+                            stats['ecb_success'] += 1
+                        else:
+                            stats['fallback_success'] += 1
+                            
+                    except RateNotFoundError as e:
+                        stats['failures'] += 1
+                        stats['errors'].append(f"{pending_date}: {e.message}")
+                        self.logger.warning("Failed to preload rate for %s: %s", pending_date, e)
+                    except Exception as e:
+                        stats['failures'] += 1
+                        stats['errors'].append(f"{pending_date}: {str(e)}")
+                        self.logger.error("Error preloading rate for %s: %s", pending_date, e)
         
-        self.logger.info(f"Preloading complete: {stats['ecb_success']} ECB, {stats['fallback_success']} fallback, {stats['cache_hits']} cached, {stats['failures']} failed")
+        self.flush()
+        self.logger.info(
+            "Preloading complete: %d ECB, %d fallback, %d cached, %d failed",
+            stats['ecb_success'], stats['fallback_success'], stats['cache_hits'], stats['failures']
+        )
         return stats
     
     def get_manual_rate_input(self, target_date: date, currency_pair: str = "USD/EUR") -> Optional[ExchangeRate]:
@@ -1040,21 +1782,26 @@ class ExchangeRateService:
             True if rate seems reasonable
         """
         try:
-            # Get recent rates for comparison
-            recent_rates = []
-            check_date = rate.date
-            
-            for i in range(1, 8):  # Check last 7 days
-                check_date = rate.date - timedelta(days=i)
-                cache_key = f"{rate.currency_pair}_{check_date.isoformat()}"
-                
-                if cache_key in self.rate_cache:
-                    cached_rate = self.rate_cache[cache_key]
-                    if self._is_cache_valid(cached_rate):
-                        recent_rates.append(cached_rate.rate)
-                
-                if len(recent_rates) >= 3:  # Enough data points
-                    break
+            # Get recent rates for comparison, from the latest rates index
+            # when it holds three valid ones within the last 7 days
+            now = time.time()
+            latest = self.rate_cache.latest_before(rate.currency_pair, rate.date)[-3:]
+            if (len(latest) == 3 and latest[0][0] >= rate.date - timedelta(days=7)
+                    and all(self._is_cache_valid(cached_rate, now) for _, cached_rate in latest)):
+                recent_rates = [cached_rate.rate for _, cached_rate in latest]
+            else:
+                recent_rates = []
+                for i in range(1, 8):  # Check last 7 days
+                    check_date = rate.date - timedelta(days=i)
+                    cache_key = f"{rate.currency_pair}_{check_date.isoformat()}"
+                    
+                    if cache_key in self.rate_cache:
+                        cached_rate = self.rate_cache[cache_key]
+                        if self._is_cache_valid(cached_rate, now):
+                            recent_rates.append(cached_rate.rate)
+                    
+                    if len(recent_rates) >= 3:  # Enough data points
+                        break
             
             if not recent_rates:
                 # No recent data, assume reasonable
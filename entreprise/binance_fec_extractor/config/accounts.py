@@ -5,7 +5,10 @@ This module defines the mapping between cryptocurrencies and French FEC account
 as well as system accounts used for different transaction types.
 """
 
-from typing import Dict, Optional, Tuple
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 from enum import Enum
 
 
@@ -75,6 +78,8 @@ CRYPTO_ACCOUNTS: Dict[str, Tuple[str, str]] = {
     "SEI": ("5220012289", "Jetons detenus en Sei (SEI) du compte VOXOMA"),
 }
 
+_CRYPTO_ACCOUNTS_VIEW = MappingProxyType(CRYPTO_ACCOUNTS)
+
 # Default account for unknown cryptocurrencies
 DEFAULT_CRYPTO_ACCOUNT = ("5220012999", "Jetons detenus en crypto-monnaie du compte VOXOMA")
 
@@ -85,6 +90,43 @@ ACCOUNT_RANGES = {
     "altcoins": (5220012000, 5220012999),
 }
 
+_STABLECOINS = frozenset({"USDC", "USDT", "BUSD", "DAI", "TUSD", "FDUSD", "USDP"})
+_MAJOR_CRYPTOS = frozenset({"BTC", "ETH", "BNB"})
+
+# Account category of every non-altcoin symbol
+_CATEGORIES = {
+    **{symbol: "major_crypto" for symbol in _MAJOR_CRYPTOS},
+    **{symbol: "stablecoins" for symbol in _STABLECOINS},
+}
+
+# Full names of common cryptocurrencies, for account descriptions
+_FULL_NAMES = {
+    "BTC": "Bitcoin",
+    "ETH": "Ethereum",
+    "BNB": "Binance Coin",
+    "USDC": "Usd Coin",
+    "USDT": "Tether",
+    "BUSD": "Binance USD",
+    "DAI": "Dai",
+    "ADA": "Cardano",
+    "DOT": "Polkadot",
+    "LINK": "Chainlink",
+    "LTC": "Litecoin",
+    "XRP": "Ripple",
+    "SOL": "Solana",
+    "MATIC": "Polygon",
+    "AVAX": "Avalanche",
+    "ATOM": "Cosmos",
+    "UNI": "Uniswap",
+    "AAVE": "Aave",
+    "SEI": "Sei",
+}
+
+@lru_cache(maxsize=1024)
+def _canonical_symbol(symbol: str) -> str:
+    """Normalize a cryptocurrency symbol, memoizing recent spellings."""
+    return sys.intern(symbol.upper().strip())
+
 
 def get_crypto_account(symbol: str) -> Tuple[str, str]:
     """
@@ -96,7 +138,7 @@ def get_crypto_account(symbol: str) -> Tuple[str, str]:
     Returns:
         Tuple of (account_number, account_description)
     """
-    symbol = symbol.upper().strip()
+    symbol = _canonical_symbol(symbol)
     
     if symbol in CRYPTO_ACCOUNTS:
         return CRYPTO_ACCOUNTS[symbol]
@@ -130,8 +172,7 @@ def is_stablecoin(symbol: str) -> bool:
     Returns:
         True if the symbol is a known stablecoin
     """
-    stablecoins = {"USDC", "USDT", "BUSD", "DAI", "TUSD", "FDUSD", "USDP"}
-    return symbol.upper().strip() in stablecoins
+    return _canonical_symbol(symbol) in _STABLECOINS
 
 
 def is_major_cryptocurrency(symbol: str) -> bool:
@@ -144,8 +185,7 @@ def is_major_cryptocurrency(symbol: str) -> bool:
     Returns:
         True if the symbol is a major cryptocurrency
     """
-    major_cryptos = {"BTC", "ETH", "BNB"}
-    return symbol.upper().strip() in major_cryptos
+    return _canonical_symbol(symbol) in _MAJOR_CRYPTOS
 
 
 def get_account_category(symbol: str) -> str:
@@ -158,12 +198,7 @@ def get_account_category(symbol: str) -> str:
     Returns:
         Account category ('stablecoins', 'major_crypto', or 'altcoins')
     """
-    if is_stablecoin(symbol):
-        return "stablecoins"
-    elif is_major_cryptocurrency(symbol):
-        return "major_crypto"
-    else:
-        return "altcoins"
+    return _CATEGORIES.get(_canonical_symbol(symbol), "altcoins")
 
 
 def add_crypto_account(symbol: str, account_number: str, description: str) -> None:
@@ -175,31 +210,31 @@ def add_crypto_account(symbol: str, account_number: str, description: str) -> No
         account_number: FEC account number
         description: Account description
     """
-    symbol = symbol.upper().strip()
+    symbol = _canonical_symbol(symbol)
     CRYPTO_ACCOUNTS[symbol] = (account_number, description)
 
 
-def get_all_crypto_accounts() -> Dict[str, Tuple[str, str]]:
+def get_all_crypto_accounts() -> Mapping[str, Tuple[str, str]]:
     """
     Get all cryptocurrency account mappings.
     
+    The mapping is a read-only live view of CRYPTO_ACCOUNTS; add accounts
+    with add_crypto_account, and copy it with dict() for a snapshot.
+    
     Returns:
-        Dictionary of symbol -> (account_number, description) mappings
+        Mapping of symbol -> (account_number, description) mappings
     """
-    return CRYPTO_ACCOUNTS.copy()
+    return _CRYPTO_ACCOUNTS_VIEW
 
 
-def get_all_system_accounts() -> Dict[str, Tuple[str, str]]:
+def get_all_system_accounts() -> Mapping[str, Tuple[str, str]]:
     """
     Get all system account mappings.
     
     Returns:
-        Dictionary of account_type -> (account_number, description) mappings
+        Read-only mapping of account_type -> (account_number, description) mappings
     """
-    return {
-        account.name: (account.account_number, account.description)
-        for account in SystemAccount
-    }
+    return _SYSTEM_ACCOUNTS
 
 
 def validate_account_number(account_number: str) -> bool:
@@ -218,17 +253,12 @@ def validate_account_number(account_number: str) -> bool:
     # Remove any whitespace
     account_number = account_number.strip()
     
-    # Check if it's numeric and has appropriate length
-    if not account_number.isdigit():
-        return False
-    
-    # French account numbers are typically 3-10 digits
-    if len(account_number) < 3 or len(account_number) > 10:
-        return False
-    
-    return True
+    # French account numbers are typically 3-10 ASCII digits; isdigit() alone
+    # would also accept digits from other scripts
+    return 3 <= len(account_number) <= 10 and account_number.isascii() and account_number.isdigit()
 
 
+@lru_cache(maxsize=256)
 def format_account_description(symbol: str, account_name: str = "VOXOMA") -> str:
     """
     Format account description for a cryptocurrency.
@@ -240,35 +270,20 @@ def format_account_description(symbol: str, account_name: str = "VOXOMA") -> str
     Returns:
         Formatted account description
     """
-    symbol = symbol.upper().strip()
+    symbol = _canonical_symbol(symbol)
     
-    # Get full name mapping for common cryptocurrencies
-    full_names = {
-        "BTC": "Bitcoin",
-        "ETH": "Ethereum",
-        "BNB": "Binance Coin",
-        "USDC": "Usd Coin",
-        "USDT": "Tether",
-        "BUSD": "Binance USD",
-        "DAI": "Dai",
-        "ADA": "Cardano",
-        "DOT": "Polkadot",
-        "LINK": "Chainlink",
-        "LTC": "Litecoin",
-        "XRP": "Ripple",
-        "SOL": "Solana",
-        "MATIC": "Polygon",
-        "AVAX": "Avalanche",
-        "ATOM": "Cosmos",
-        "UNI": "Uniswap",
-        "AAVE": "Aave",
-        "SEI": "Sei",
-    }
-    
-    full_name = full_names.get(symbol, symbol)
+    full_name = _FULL_NAMES.get(symbol, symbol)
     return f"Jetons detenus en {full_name} ({symbol}) du compte {account_name}"
 
 
+_SYSTEM_ACCOUNTS = MappingProxyType({
+    account.name: (account.account_number, account.description)
+    for account in SystemAccount
+})
+_CONVERSION_GAINS_ACCOUNT = get_system_account(SystemAccount.CONVERSION_GAINS)
+_CONVERSION_LOSSES_ACCOUNT = get_system_account(SystemAccount.CONVERSION_LOSSES)
+
+
 def get_conversion_account(is_gain: bool) -> Tuple[str, str]:
     """
     Get the appropriate conversion account for gains or losses.
@@ -279,7 +294,4 @@ def get_conversion_account(is_gain: bool) -> Tuple[str, str]:
     Returns:
         Tuple of (account_number, account_description)
     """
-    if is_gain:
-        return get_system_account(SystemAccount.CONVERSION_GAINS)
-    else:
-        return get_system_account(SystemAccount.CONVERSION_LOSSES)
\ No newline at end of file
+    return _CONVERSION_GAINS_ACCOUNT if is_gain else _CONVERSION_LOSSES_ACCOUNT
\ No newline at end of file
@@ -6,52 +6,116 @@ and configuration validation.
 """
 
 import os
+import sys
+import copy
+import hashlib
 import json
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Dict, Any, Mapping, Tuple
+from dataclasses import asdict, dataclass, fields, replace
 from pathlib import Path
+from types import MappingProxyType
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
 
-@dataclass
+
+# Slotted settings dataclasses where supported (Python 3.10+)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Environment variables read by Config.load_from_environment
+_ENV_KEYS = (
+    'BINANCE_API_KEY', 'BINANCE_SECRET_KEY', 'START_DATE', 'END_DATE',
+    'OUTPUT_DIR', 'LOG_LEVEL', 'EXCHANGE_RATE_SOURCE', 'MAX_RETRIES', 'RATE_LIMIT_DELAY',
+)
+
+# Optional environment overrides: variable, config section, setting, conversion.
+# Values that fail to convert keep the current setting.
+_ENV_OVERRIDES = (
+    ('OUTPUT_DIR', 'output', 'directory', str),
+    ('EXCHANGE_RATE_SOURCE', 'exchange_rates', 'primary_source', str),
+    ('MAX_RETRIES', 'api', 'max_retries', int),
+    ('RATE_LIMIT_DELAY', 'api', 'rate_limit_delay', float),
+)
+
+# Exchange rate sources accepted as primary or fallback source
+_VALID_SOURCES = frozenset(("ecb", "coingecko", "coinbase"))
+
+# Default fallback order; immutable so every ExchangeRateConfig can share it
+_DEFAULT_FALLBACKS: Tuple[str, ...] = ("exchangerate-api", "freecurrency-api", "coinbase")
+
+# Credential values left over from the example configuration
+_PLACEHOLDER_PREFIXES = ('your_api_key', 'your_secret_key')
+_PLACEHOLDER_VALUES = frozenset(('REPLACE_ME',))
+
+# Config file -> ((file mtime and size, environment digest), loaded Config).
+# Only the latest load of each file is kept.
+_CONFIG_CACHE: Dict[Optional[str], Tuple[Tuple[Any, ...], 'Config']] = {}
+
+# Frozen copy of the Config environment variables, see snapshot_environment()
+_ENV_SNAPSHOT: Optional[Mapping[str, str]] = None
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class APIConfig:
     """API configuration settings."""
     base_url: str = "https://api.binance.com"
     timeout: int = 30
     max_retries: int = 3
     rate_limit_delay: float = 0.1
+    max_concurrent: int = 10
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class OutputConfig:
     """Output configuration settings."""
     directory: str = "./output"
     filename_template: str = "binance_fec_{start_date}_{end_date}.txt"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ExchangeRateConfig:
     """Exchange rate service configuration."""
     primary_source: str = "ecb"
-    fallback_sources: list = None
+    fallback_sources: Tuple[str, ...] = _DEFAULT_FALLBACKS
     cache_duration: int = 3600
-    
-    def __post_init__(self):
-        if self.fallback_sources is None:
-            self.fallback_sources = ["exchangerate-api", "freecurrency-api", "coinbase"]
+
+
+_API_FIELDS = frozenset(field.name for field in fields(APIConfig))
+_OUTPUT_FIELDS = frozenset(field.name for field in fields(OutputConfig))
+_EXCHANGE_RATE_FIELDS = frozenset(field.name for field in fields(ExchangeRateConfig))
+
+
+def _section_updates(section: Dict[str, Any], names: frozenset) -> Dict[str, Any]:
+    """Pick the known settings of a configuration file section."""
+    return {name: value for name, value in section.items() if name in names}
 
 
 class Config:
     """Main configuration class for the Binance FEC Extractor application."""
     
-    def __init__(self, config_file: Optional[str] = None):
+    def __init__(self, config_file: Optional[str] = None, skip_validation: bool = False,
+                 env: Optional[Mapping[str, str]] = None):
         """
         Initialize configuration.
         
         Args:
             config_file: Optional path to configuration file
+            skip_validation: Skip the structural checks, for inputs already known to be valid
+            env: Environment variables to read instead of os.environ
+        
+        Credentials and the output directory are checked on first use by
+        get_credentials() and ensure_output_directory(); call validate()
+        to check everything up front.
         """
         self.api = APIConfig()
         self.output = OutputConfig()
+        # (directory, Path) last created by ensure_output_directory
+        self._ensured_output: Optional[Tuple[str, Path]] = None
+        # (api_key, secret_key) last accepted by get_credentials
+        self._validated_credentials: Optional[Tuple[str, str]] = None
         self.exchange_rates = ExchangeRateConfig()
         
         # Load configuration from file if provided
@@ -59,10 +123,11 @@ class Config:
             self.load_from_file(config_file)
         
         # Load environment variables (overrides file config)
-        self.load_from_environment()
+        self.load_from_environment(env)
         
-        # Validate configuration
-        self.validate()
+        # Validate configuration structure; the rest is checked on first use
+        if not skip_validation:
+            self._validate_structure()
     
     def load_from_file(self, config_file: str) -> None:
         """
@@ -75,71 +140,68 @@ class Config:
             FileNotFoundError: If config file doesn't exist
             json.JSONDecodeError: If config file is invalid JSON
         """
-        config_path = Path(config_file)
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_file}")
-        
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            
-            # Update API configuration
-            if 'api' in config_data:
-                api_config = config_data['api']
-                self.api.base_url = api_config.get('base_url', self.api.base_url)
-                self.api.timeout = api_config.get('timeout', self.api.timeout)
-                self.api.max_retries = api_config.get('max_retries', self.api.max_retries)
-                self.api.rate_limit_delay = api_config.get('rate_limit_delay', self.api.rate_limit_delay)
-            
-            # Update output configuration
-            if 'output' in config_data:
-                output_config = config_data['output']
-                self.output.directory = output_config.get('directory', self.output.directory)
-                self.output.filename_template = output_config.get('filename_template', self.output.filename_template)
-            
-            # Update exchange rate configuration
-            if 'exchange_rates' in config_data:
-                er_config = config_data['exchange_rates']
-                self.exchange_rates.primary_source = er_config.get('primary_source', self.exchange_rates.primary_source)
-                self.exchange_rates.fallback_sources = er_config.get('fallback_sources', self.exchange_rates.fallback_sources)
-                self.exchange_rates.cache_duration = er_config.get('cache_duration', self.exchange_rates.cache_duration)
-                
+            config_data = _json_loads(Path(config_file).read_bytes())
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Configuration file not found: {config_file}") from e
         except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {e}")
+            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {e.msg}", e.doc, e.pos) from e
+        
+        # Update API, output and exchange rate configuration
+        if 'api' in config_data:
+            self.api = replace(self.api, **_section_updates(config_data['api'], _API_FIELDS))
+        
+        if 'output' in config_data:
+            self.output = replace(self.output, **_section_updates(config_data['output'], _OUTPUT_FIELDS))
+        
+        if 'exchange_rates' in config_data:
+            self.exchange_rates = replace(
+                self.exchange_rates,
+                **_section_updates(config_data['exchange_rates'], _EXCHANGE_RATE_FIELDS)
+            )
     
-    def load_from_environment(self) -> None:
-        """Load configuration from environment variables."""
+    @classmethod
+    def from_env_snapshot(cls, env: Mapping[str, str], config_file: Optional[str] = None) -> 'Config':
+        """
+        Build a configuration from a snapshot of the environment.
+        
+        Args:
+            env: Environment variables, e.g. from snapshot_environment()
+            config_file: Optional path to configuration file
+            
+        Returns:
+            Configured Config instance
+        """
+        return cls(config_file, env=env)
+    
+    def load_from_environment(self, env: Optional[Mapping[str, str]] = None) -> None:
+        """
+        Load configuration from environment variables.
+        
+        Args:
+            env: Environment variables to read; defaults to os.environ
+        """
+        if env is None:
+            env = os.environ
+        
         # API credentials (required)
-        self.binance_api_key = os.getenv('BINANCE_API_KEY')
-        self.binance_secret_key = os.getenv('BINANCE_SECRET_KEY')
+        self.binance_api_key = env.get('BINANCE_API_KEY')
+        self.binance_secret_key = env.get('BINANCE_SECRET_KEY')
         
         # Date range (optional, can be provided via CLI)
-        self.start_date = os.getenv('START_DATE')
-        self.end_date = os.getenv('END_DATE')
+        self.start_date = env.get('START_DATE')
+        self.end_date = env.get('END_DATE')
+        
+        self.log_level = env.get('LOG_LEVEL') or 'INFO'
         
         # Optional configuration overrides
-        if os.getenv('OUTPUT_DIR'):
-            self.output.directory = os.getenv('OUTPUT_DIR')
-        
-        if os.getenv('LOG_LEVEL'):
-            self.log_level = os.getenv('LOG_LEVEL')
-        else:
-            self.log_level = 'INFO'
-        
-        if os.getenv('EXCHANGE_RATE_SOURCE'):
-            self.exchange_rates.primary_source = os.getenv('EXCHANGE_RATE_SOURCE')
-        
-        if os.getenv('MAX_RETRIES'):
-            try:
-                self.api.max_retries = int(os.getenv('MAX_RETRIES'))
-            except ValueError:
-                pass  # Keep default value
-        
-        if os.getenv('RATE_LIMIT_DELAY'):
-            try:
-                self.api.rate_limit_delay = float(os.getenv('RATE_LIMIT_DELAY'))
-            except ValueError:
-                pass  # Keep default value
+        for name, section, setting, convert in _ENV_OVERRIDES:
+            value = env.get(name)
+            if value:
+                try:
+                    setattr(getattr(self, section), setting, convert(value))
+                except ValueError:
+                    pass  # Keep default value
     
     def validate(self) -> None:
         """
@@ -154,10 +216,17 @@ class Config:
         
         # Validate output directory
         if self.output.directory:
-            output_path = Path(self.output.directory)
-            if output_path.exists() and not output_path.is_dir():
-                raise ValueError(f"Output path exists but is not a directory: {self.output.directory}")
+            self._validate_output_path(Path(self.output.directory))
+        
+        self._validate_structure()
+    
+    def _validate_structure(self) -> None:
+        """
+        Validate numeric settings and exchange rate sources.
         
+        Raises:
+            ValueError: If configuration is invalid
+        """
         # Validate numeric values
         if self.api.timeout <= 0:
             raise ValueError("API timeout must be positive")
@@ -168,17 +237,29 @@ class Config:
         if self.api.rate_limit_delay < 0:
             raise ValueError("Rate limit delay must be non-negative")
         
+        if self.api.max_concurrent <= 0:
+            raise ValueError("Max concurrent requests must be positive")
+        
         if self.exchange_rates.cache_duration < 0:
             raise ValueError("Exchange rate cache duration must be non-negative")
         
         # Validate exchange rate sources
-        valid_sources = ["ecb", "coingecko", "coinbase"]
-        if self.exchange_rates.primary_source not in valid_sources:
+        if self.exchange_rates.primary_source not in _VALID_SOURCES:
             raise ValueError(f"Invalid primary exchange rate source: {self.exchange_rates.primary_source}")
         
-        for source in self.exchange_rates.fallback_sources:
-            if source not in valid_sources:
-                raise ValueError(f"Invalid fallback exchange rate source: {source}")
+        invalid_sources = set(self.exchange_rates.fallback_sources) - _VALID_SOURCES
+        if invalid_sources:
+            raise ValueError(f"Invalid fallback exchange rate source: {', '.join(sorted(invalid_sources))}")
+    
+    def _validate_output_path(self, output_path: Path) -> None:
+        """
+        Validate that the output path can be used as a directory.
+        
+        Raises:
+            ValueError: If the path exists and is not a directory
+        """
+        if output_path.exists() and not output_path.is_dir():
+            raise ValueError(f"Output path exists but is not a directory: {self.output.directory}")
     
     def validate_api_credentials(self) -> None:
         """
@@ -187,6 +268,14 @@ class Config:
         Raises:
             ValueError: If credentials are invalid
         """
+        api_key, secret_key = self.binance_api_key, self.binance_secret_key
+        if (api_key and len(api_key) >= 10 and not api_key.startswith(_PLACEHOLDER_PREFIXES)
+                and api_key not in _PLACEHOLDER_VALUES
+                and secret_key and len(secret_key) >= 10 and not secret_key.startswith(_PLACEHOLDER_PREFIXES)
+                and secret_key not in _PLACEHOLDER_VALUES):
+            return
+        
+        # Find out which check failed
         if not self.binance_api_key:
             raise ValueError("BINANCE_API_KEY is required")
         
@@ -201,10 +290,10 @@ class Config:
             raise ValueError("BINANCE_SECRET_KEY appears to be too short")
         
         # Check for common mistakes
-        if self.binance_api_key.startswith('your_api_key') or self.binance_api_key == 'REPLACE_ME':
+        if self.binance_api_key.startswith(_PLACEHOLDER_PREFIXES) or self.binance_api_key in _PLACEHOLDER_VALUES:
             raise ValueError("BINANCE_API_KEY appears to be a placeholder value")
         
-        if self.binance_secret_key.startswith('your_secret_key') or self.binance_secret_key == 'REPLACE_ME':
+        if self.binance_secret_key.startswith(_PLACEHOLDER_PREFIXES) or self.binance_secret_key in _PLACEHOLDER_VALUES:
             raise ValueError("BINANCE_SECRET_KEY appears to be a placeholder value")
     
     def get_credentials(self) -> tuple[str, str]:
@@ -215,22 +304,38 @@ class Config:
             Tuple of (api_key, secret_key)
             
         Raises:
-            ValueError: If credentials are not configured
+            ValueError: If credentials are not configured or invalid
         """
         if not self.binance_api_key or not self.binance_secret_key:
             raise ValueError("API credentials not configured. Set BINANCE_API_KEY and BINANCE_SECRET_KEY environment variables.")
         
-        return self.binance_api_key, self.binance_secret_key
+        credentials = (self.binance_api_key, self.binance_secret_key)
+        if credentials != self._validated_credentials:
+            self.validate_api_credentials()
+            self._validated_credentials = credentials
+        return credentials
     
     def ensure_output_directory(self) -> Path:
         """
         Ensure output directory exists and return Path object.
         
+        The directory is created once per configured path; later calls
+        return the same Path without touching the filesystem.
+        
         Returns:
             Path object for output directory
+            
+        Raises:
+            ValueError: If the output path exists and is not a directory
         """
-        output_path = Path(self.output.directory)
+        directory = self.output.directory
+        if self._ensured_output is not None and self._ensured_output[0] == directory:
+            return self._ensured_output[1]
+        
+        output_path = Path(directory)
+        self._validate_output_path(output_path)
         output_path.mkdir(parents=True, exist_ok=True)
+        self._ensured_output = (directory, output_path)
         return output_path
     
     def to_dict(self) -> Dict[str, Any]:
@@ -240,37 +345,83 @@ class Config:
         Returns:
             Dictionary representation of configuration
         """
+        api = asdict(self.api)
+        api['credentials_configured'] = bool(self.binance_api_key and self.binance_secret_key)
         return {
-            'api': {
-                'base_url': self.api.base_url,
-                'timeout': self.api.timeout,
-                'max_retries': self.api.max_retries,
-                'rate_limit_delay': self.api.rate_limit_delay,
-                'credentials_configured': bool(self.binance_api_key and self.binance_secret_key)
-            },
-            'output': {
-                'directory': self.output.directory,
-                'filename_template': self.output.filename_template
-            },
-            'exchange_rates': {
-                'primary_source': self.exchange_rates.primary_source,
-                'fallback_sources': self.exchange_rates.fallback_sources,
-                'cache_duration': self.exchange_rates.cache_duration
-            },
+            'api': api,
+            'output': asdict(self.output),
+            'exchange_rates': asdict(self.exchange_rates),
             'log_level': getattr(self, 'log_level', 'INFO'),
             'start_date': getattr(self, 'start_date', None),
             'end_date': getattr(self, 'end_date', None)
         }
 
 
-def load_config(config_file: Optional[str] = None) -> Config:
+def _copy_config(config: Config) -> Config:
+    """Copy a Config deeply enough that changing one section leaves the other intact."""
+    config = copy.copy(config)
+    config.api = copy.copy(config.api)
+    config.output = copy.copy(config.output)
+    config.exchange_rates = copy.copy(config.exchange_rates)
+    # Lists from a config file are copied, the shared default tuple is kept
+    config.exchange_rates.fallback_sources = copy.copy(config.exchange_rates.fallback_sources)
+    return config
+
+
+def _environment_digest(environ: Mapping[str, str]) -> str:
+    """Hash the Config environment variables, so credentials are not kept as cache keys."""
+    values = tuple(environ.get(name) for name in _ENV_KEYS)
+    return hashlib.sha256(repr(values).encode('utf-8')).hexdigest()
+
+
+def snapshot_environment() -> Mapping[str, str]:
+    """
+    Freeze the environment variables Config reads.
+    
+    The snapshot is taken on the first call and returned unchanged
+    afterwards, so worker processes forked after it inherit the parsed
+    values and never scan os.environ themselves.
+    
+    Returns:
+        Read-only mapping of the Config environment variables
+    """
+    global _ENV_SNAPSHOT
+    if _ENV_SNAPSHOT is None:
+        environ = os.environ
+        _ENV_SNAPSHOT = MappingProxyType({name: environ[name] for name in _ENV_KEYS if name in environ})
+    return _ENV_SNAPSHOT
+
+
+def load_config(config_file: Optional[str] = None, env: Optional[Mapping[str, str]] = None) -> Config:
     """
     Load application configuration.
     
+    The latest configuration of each config file is memoized with the
+    file's modification time and size and a digest of the environment
+    variables Config reads, so repeated calls skip parsing and validation
+    until one of them changes. Returned
+    copies of a validated configuration are not validated again.
+    
     Args:
         config_file: Optional path to configuration file
+        env: Environment variables to read instead of os.environ,
+            e.g. from snapshot_environment()
         
     Returns:
         Configured Config instance
     """
-    return Config(config_file)
\ No newline at end of file
+    file_key = None
+    if config_file:
+        try:
+            stat = os.stat(config_file)
+        except OSError:
+            return Config(config_file, env=env)  # Raises the not found error
+        file_key = (stat.st_mtime_ns, stat.st_size)
+    
+    environ = os.environ if env is None else env
+    path = os.path.abspath(config_file) if config_file else None
+    fingerprint = (file_key, _environment_digest(environ))
+    entry = _CONFIG_CACHE.get(path)
+    if entry is None or entry[0] != fingerprint:
+        entry = _CONFIG_CACHE[path] = (fingerprint, Config(config_file, env=env))
+    return _copy_config(entry[1])
\ No newline at end of file
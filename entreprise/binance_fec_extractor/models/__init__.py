@@ -2,25 +2,42 @@
 Models package for the Binance FEC Extractor.
 
 This package contains all SQLAlchemy models and database configuration.
+Names are imported from their submodules on first access, so importing the
+package does not load SQLAlchemy.
 """
 
-from .database import Base, DatabaseManager, init_database, get_session, close_session, create_tables
-from .transaction import Transaction, Trade, Deposit, Withdrawal, Fee, Transfer
-from .fec_entry import FECEntry, FECEntryBuilder
-
-__all__ = [
-    'Base',
-    'DatabaseManager',
-    'init_database',
-    'get_session',
-    'close_session',
-    'create_tables',
-    'Transaction',
-    'Trade',
-    'Deposit',
-    'Withdrawal',
-    'Fee',
-    'Transfer',
-    'FECEntry',
-    'FECEntryBuilder'
-]
\ No newline at end of file
+import importlib
+
+# Exported name -> submodule defining it
+_LAZY = {
+    'Base': 'database',
+    'DatabaseManager': 'database',
+    'init_database': 'database',
+    'get_session': 'database',
+    'close_session': 'database',
+    'create_tables': 'database',
+    'Transaction': 'transaction',
+    'Trade': 'transaction',
+    'Deposit': 'transaction',
+    'Withdrawal': 'transaction',
+    'Fee': 'transaction',
+    'Transfer': 'transaction',
+    'FECEntry': 'fec_entry',
+    'FECEntryBuilder': 'fec_entry',
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
\ No newline at end of file
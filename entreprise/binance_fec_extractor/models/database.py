@@ -7,16 +7,53 @@ and session handling for the application.
 
 import os
 import logging
+from functools import lru_cache
 from typing import Optional
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker, Session, declarative_base
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import sessionmaker, scoped_session, Session, declarative_base
+from sqlalchemy.pool import QueuePool, StaticPool
 
 logger = logging.getLogger(__name__)
 
-# Create the declarative base for all models
-Base = declarative_base()
+# Create the declarative base for all models, once: reloading this module
+# must not orphan the mappers registered on it
+if 'Base' not in globals():
+    Base = declarative_base()
+_BASE_METADATA = Base.metadata
+
+# Statement used to check the database is reachable
+_PING_STATEMENT = text("SELECT 1")
+
+# Compiled SQL statements kept per engine; room for every statement shape of
+# the models, including the polymorphic transaction variants
+_QUERY_CACHE_SIZE = 1200
+
+# Applied to every new SQLite connection: write-ahead logging lets readers
+# run alongside the writer, and bulk inserts skip most fsyncs
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MiB
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Tune a new SQLite connection for bulk writes."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in _SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+@lru_cache(maxsize=None)
+def _default_sqlite_url() -> str:
+    """SQLite URL in the working directory at first use; the process does not chdir."""
+    return f"sqlite:///{os.path.join(os.getcwd(), 'binance_fec.db')}"
 
 
 class DatabaseManager:
@@ -37,6 +74,12 @@ class DatabaseManager:
         self.database_url = database_url or self._get_default_database_url()
         self.engine: Optional[Engine] = None
         self.SessionLocal: Optional[sessionmaker] = None
+        # One session per thread, for workers sharing the manager
+        self.ScopedSession: Optional[scoped_session] = None
+        # Engine the tables were last created on
+        self._tables_engine: Optional[Engine] = None
+        # Whether the engine's pool pings connections on checkout
+        self._pre_ping = False
         
     def _get_default_database_url(self) -> str:
         """
@@ -45,14 +88,9 @@ class DatabaseManager:
         Returns:
             Database connection URL string.
         """
-        # Check for environment variable first
-        db_url = os.getenv('DATABASE_URL')
-        if db_url:
-            return db_url
-            
-        # Default to SQLite database in the project root
-        db_path = os.path.join(os.getcwd(), 'binance_fec.db')
-        return f'sqlite:///{db_path}'
+        # Check for environment variable first, else default to SQLite
+        # database in the project root
+        return os.environ.get('DATABASE_URL') or _default_sqlite_url()
     
     def init_database(self) -> None:
         """
@@ -64,16 +102,25 @@ class DatabaseManager:
         try:
             # Configure engine based on database type
             if self.database_url.startswith('sqlite'):
-                # SQLite specific configuration
+                # SQLite specific configuration. An in-memory database only
+                # exists on its one connection; files get a pool of
+                # connections, which WAL lets read while another writes.
+                if ':memory:' in self.database_url or self.database_url.rstrip('/') == 'sqlite:':
+                    pool_options = {'poolclass': StaticPool}
+                else:
+                    pool_options = {'poolclass': QueuePool, 'pool_size': 5, 'max_overflow': 10}
                 self.engine = create_engine(
                     self.database_url,
-                    poolclass=StaticPool,
+                    **pool_options,
                     connect_args={
                         'check_same_thread': False,
                         'timeout': 30
                     },
+                    query_cache_size=_QUERY_CACHE_SIZE,
                     echo=False  # Set to True for SQL debugging
                 )
+                self._pre_ping = False
+                event.listen(self.engine, "connect", _set_sqlite_pragmas)
             else:
                 # PostgreSQL or other database configuration
                 self.engine = create_engine(
@@ -81,8 +128,10 @@ class DatabaseManager:
                     pool_size=10,
                     max_overflow=20,
                     pool_pre_ping=True,
+                    query_cache_size=_QUERY_CACHE_SIZE,
                     echo=False  # Set to True for SQL debugging
                 )
+                self._pre_ping = True
             
             # Create session factory
             self.SessionLocal = sessionmaker(
@@ -90,6 +139,7 @@ class DatabaseManager:
                 autoflush=False,
                 bind=self.engine
             )
+            self.ScopedSession = scoped_session(self.SessionLocal)
             
             logger.info(f"Database initialized successfully: {self.database_url}")
             
@@ -102,17 +152,22 @@ class DatabaseManager:
         Create all database tables based on the defined models.
         
         This method should be called after all models are imported
-        to ensure all tables are created.
+        to ensure all tables are created. Repeated calls on the same engine
+        return immediately.
         """
         try:
             if not self.engine:
                 raise RuntimeError("Database not initialized. Call init_database() first.")
             
+            if self._tables_engine is self.engine:
+                return
+            
             # Import all models to ensure they're registered with Base
             from . import transaction, fec_entry
             
             # Create all tables
-            Base.metadata.create_all(bind=self.engine)
+            _BASE_METADATA.create_all(bind=self.engine)
+            self._tables_engine = self.engine
             logger.info("Database tables created successfully")
             
         except Exception as e:
@@ -134,6 +189,21 @@ class DatabaseManager:
         
         return self.SessionLocal()
     
+    def get_thread_session(self) -> Session:
+        """
+        Return the calling thread's database session, creating it on first use.
+        
+        Returns:
+            SQLAlchemy Session instance, the same for every call from a thread.
+            
+        Raises:
+            RuntimeError: If database is not initialized.
+        """
+        if not self.ScopedSession:
+            raise RuntimeError("Database not initialized. Call init_database() first.")
+        
+        return self.ScopedSession()
+    
     def close_session(self, session: Session) -> None:
         """
         Close a database session.
@@ -161,10 +231,17 @@ class DatabaseManager:
         
         return self.engine
     
-    def test_connection(self) -> bool:
+    def test_connection(self, force: bool = False) -> bool:
         """
         Test the database connection.
         
+        Every call checks out a connection. On engines whose pool pings
+        connections on checkout, that checkout is the test and the explicit
+        query is skipped.
+        
+        Args:
+            force: Run the test query even if the checkout already pinged.
+        
         Returns:
             True if connection is successful, False otherwise.
         """
@@ -173,7 +250,8 @@ class DatabaseManager:
                 self.init_database()
             
             with self.engine.connect() as connection:
-                connection.execute("SELECT 1")
+                if force or not self._pre_ping:
+                    connection.execute(_PING_STATEMENT)
             
             logger.info("Database connection test successful")
             return True
@@ -189,6 +267,8 @@ class DatabaseManager:
         Closes all connections and disposes of the engine.
         """
         try:
+            if self.ScopedSession:
+                self.ScopedSession.remove()
             if self.engine:
                 self.engine.dispose()
                 logger.info("Database resources cleaned up")
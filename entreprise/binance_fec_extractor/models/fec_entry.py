@@ -5,16 +5,77 @@ This module defines the FECEntry model that represents French FEC
 (Fichier des Écritures Comptables) accounting entries with all required columns.
 """
 
+import csv
+import re
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence, Union
 from sqlalchemy import (
     Column, Integer, String, DateTime, Numeric, ForeignKey, 
-    Index, CheckConstraint, Text
+    Index, CheckConstraint, Text, select
 )
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy.orm import Session, relationship, validates
 from .database import Base
 
+# Rows sent per executemany by FECEntry.bulk_insert
+_BULK_INSERT_CHUNK = 10000
+
+# Rows fetched per round trip by FECEntry.export_to_tsv
+_EXPORT_BATCH = 10000
+
+# FEC export columns in file order: (header, model attribute)
+_FEC_EXPORT_COLUMNS = (
+    ('JournalCode', 'journal_code'),
+    ('JournalLib', 'journal_lib'),
+    ('EcritureNum', 'ecriture_num'),
+    ('EcritureDate', 'ecriture_date'),
+    ('CompteNum', 'compte_num'),
+    ('CompteLib', 'compte_lib'),
+    ('CompAuxNum', 'comp_aux_num'),
+    ('CompAuxLib', 'comp_aux_lib'),
+    ('PieceRef', 'piece_ref'),
+    ('PieceDate', 'piece_date'),
+    ('EcritureLib', 'ecriture_lib'),
+    ('Debit', 'debit'),
+    ('Credit', 'credit'),
+    ('EcritureLet', 'ecriture_let'),
+    ('DateLet', 'date_let'),
+    ('ValidDate', 'valid_date'),
+    ('Montantdevise', 'montant_devise'),
+    ('Idevise', 'idevise'),
+    ('NomPlateformeBlockchain', 'nom_plateforme_blockchain'),
+    ('CUMP', 'cump'),
+    ('TauxDeChange', 'taux_de_change'),
+    ('DeviseEcartConvertion', 'devise_ecart_convertion'),
+    ('AdresseSource', 'adresse_source'),
+    ('AdresseDestination', 'adresse_destination'),
+    ('IdTransactionComptacrypto', 'id_transaction_comptacrypto'),
+)
+
+# Field formats, matched with fullmatch
+_DATE_RE = re.compile(r'\d{8}')  # YYYYMMDD
+_AMOUNT_RE = re.compile(r'\d+(?:[.,]\d+)?')
+
+# Fields checked by FECEntry.validate_batch
+_DATE_FIELDS = ('ecriture_date', 'piece_date', 'date_let', 'valid_date')
+_AMOUNT_FIELDS = ('debit', 'credit')
+# (field, label, maximum length) of the required text fields
+_REQUIRED_TEXT_FIELDS = (
+    ('compte_num', 'Account number', 20),
+    ('compte_lib', 'Account label', 200),
+    ('piece_ref', 'Piece reference', 50),
+    ('ecriture_lib', 'Entry description', 200),
+)
+
+
+def _check_amount(field: str, amount: str) -> None:
+    """Raise ValueError unless amount is a plain non-negative decimal such as "100,50"."""
+    if not _AMOUNT_RE.fullmatch(amount):
+        if amount.startswith('-') and _AMOUNT_RE.fullmatch(amount, 1):
+            raise ValueError(f"{field} amount cannot be negative")
+        raise ValueError(f"Invalid {field} amount format: {amount}")
+
 
 class FECEntry(Base):
     """
@@ -83,9 +144,8 @@ class FECEntry(Base):
     @validates('ecriture_date', 'piece_date', 'date_let', 'valid_date')
     def validate_date_format(self, key, date_value):
         """Validate date format is YYYYMMDD."""
-        if date_value and date_value != "":
-            if len(date_value) != 8 or not date_value.isdigit():
-                raise ValueError(f"{key} must be in YYYYMMDD format")
+        if date_value and not _DATE_RE.fullmatch(date_value):
+            raise ValueError(f"{key} must be in YYYYMMDD format")
         return date_value or ""
     
     @validates('ecriture_num')
@@ -134,16 +194,82 @@ class FECEntry(Base):
     @validates('debit', 'credit')
     def validate_amounts(self, key, amount):
         """Validate debit/credit amounts."""
-        if amount and amount != "":
-            try:
-                # Try to parse as decimal to validate format
-                decimal_amount = Decimal(amount.replace(',', '.'))
-                if decimal_amount < 0:
-                    raise ValueError(f"{key} amount cannot be negative")
-            except (ValueError, TypeError):
-                raise ValueError(f"Invalid {key} amount format: {amount}")
+        if amount:
+            _check_amount(key, amount)
         return amount or ""
     
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: Sequence[Dict[str, Any]],
+                    chunk_size: int = _BULK_INSERT_CHUNK) -> int:
+        """
+        Insert many FEC entries with Core executemany statements.
+        
+        Rows bypass the ORM identity map and the @validates hooks, so they
+        should come from FECEntryBuilder.to_dict() or have passed
+        validate_batch(). The inserts join the session's transaction; the
+        caller commits.
+        
+        Args:
+            session: Session to execute the inserts in.
+            rows: Column values for each entry, all with the same keys.
+            chunk_size: Number of rows per INSERT statement.
+            
+        Returns:
+            Number of rows inserted.
+        """
+        statement = cls.__table__.insert()
+        for start in range(0, len(rows), chunk_size):
+            session.execute(statement, rows[start:start + chunk_size])
+        return len(rows)
+    
+    @staticmethod
+    def validate_batch(rows: Iterable[Dict[str, Any]]) -> None:
+        """
+        Validate plain row dictionaries for bulk_insert() in one pass.
+        
+        Applies the attribute validators' checks without building model
+        instances, and fills the same defaults in place: journal code
+        "BIN" and empty dates and amounts.
+        
+        Args:
+            rows: Column values for each entry.
+            
+        Raises:
+            ValueError: If a row is invalid, naming its index.
+        """
+        date_match = _DATE_RE.fullmatch
+        for index, row in enumerate(rows):
+            try:
+                journal_code = row.get('journal_code')
+                if journal_code and len(journal_code) > 10:
+                    raise ValueError("Journal code cannot exceed 10 characters")
+                row['journal_code'] = journal_code or "BIN"
+                
+                for field in _DATE_FIELDS:
+                    value = row.get(field)
+                    if value and not date_match(value):
+                        raise ValueError(f"{field} must be in YYYYMMDD format")
+                    row[field] = value or ""
+                
+                ecriture_num = row.get('ecriture_num')
+                if ecriture_num is not None and ecriture_num <= 0:
+                    raise ValueError("Ecriture number must be positive")
+                
+                for field, label, max_length in _REQUIRED_TEXT_FIELDS:
+                    value = row.get(field)
+                    if not value:
+                        raise ValueError(f"{label} ({field}) is required")
+                    if len(value) > max_length:
+                        raise ValueError(f"{label} cannot exceed {max_length} characters")
+                
+                for field in _AMOUNT_FIELDS:
+                    value = row.get(field)
+                    if value:
+                        _check_amount(field, value)
+                    row[field] = value or ""
+            except ValueError as e:
+                raise ValueError(f"Row {index}: {e}") from e
+    
     def is_debit_entry(self) -> bool:
         """Check if this is a debit entry."""
         return bool(self.debit and self.debit.strip())
@@ -164,36 +290,46 @@ class FECEntry(Base):
         """
         Format the FEC entry for export to tab-separated file.
         
+        Use export_to_tsv() to write many entries.
+        
         Returns:
             Dictionary with all FEC columns formatted for export.
         """
-        return {
-            'JournalCode': self.journal_code,
-            'JournalLib': self.journal_lib,
-            'EcritureNum': str(self.ecriture_num),
-            'EcritureDate': self.ecriture_date,
-            'CompteNum': self.compte_num,
-            'CompteLib': self.compte_lib,
-            'CompAuxNum': self.comp_aux_num,
-            'CompAuxLib': self.comp_aux_lib,
-            'PieceRef': self.piece_ref,
-            'PieceDate': self.piece_date,
-            'EcritureLib': self.ecriture_lib,
-            'Debit': self.debit,
-            'Credit': self.credit,
-            'EcritureLet': self.ecriture_let,
-            'DateLet': self.date_let,
-            'ValidDate': self.valid_date,
-            'Montantdevise': self.montant_devise,
-            'Idevise': self.idevise,
-            'NomPlateformeBlockchain': self.nom_plateforme_blockchain,
-            'CUMP': self.cump,
-            'TauxDeChange': self.taux_de_change,
-            'DeviseEcartConvertion': self.devise_ecart_convertion,
-            'AdresseSource': self.adresse_source,
-            'AdresseDestination': self.adresse_destination,
-            'IdTransactionComptacrypto': self.id_transaction_comptacrypto
-        }
+        values = {header: getattr(self, name) for header, name in _FEC_EXPORT_COLUMNS}
+        values['EcritureNum'] = str(self.ecriture_num)
+        return values
+    
+    @classmethod
+    def export_to_tsv(cls, session: Session, path: Union[str, Path]) -> int:
+        """
+        Write all FEC entries to a tab-separated file.
+        
+        Rows are streamed from a Core select ordered by date and entry
+        number and written in batches, without loading model instances
+        or building a dictionary per entry.
+        
+        Args:
+            session: Session to read the entries with.
+            path: Destination file, overwritten if it exists.
+            
+        Returns:
+            Number of entries written.
+        """
+        table = cls.__table__
+        statement = (
+            select(*(table.c[name] for _, name in _FEC_EXPORT_COLUMNS))
+            .order_by(table.c.ecriture_date, table.c.ecriture_num)
+            .execution_options(yield_per=_EXPORT_BATCH)
+        )
+        
+        count = 0
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, delimiter='\t', lineterminator='\r\n')
+            writer.writerow([header for header, _ in _FEC_EXPORT_COLUMNS])
+            for rows in session.execute(statement).partitions():
+                writer.writerows(rows)
+                count += len(rows)
+        return count
     
     def __repr__(self):
         return (f"<FECEntry(id={self.id}, ecriture_num={self.ecriture_num}, "
@@ -281,4 +417,25 @@ class FECEntryBuilder:
         Returns:
             Configured FECEntry instance.
         """
-        return self.entry
\ No newline at end of file
+        return self.entry
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the entry as column values for FECEntry.bulk_insert().
+        
+        Unset columns take their column default, so every row has the
+        same keys; id and the timestamps are left to the database.
+        
+        Returns:
+            Dictionary of column values for the validated entry.
+        """
+        values = self.entry.__dict__
+        return {key: values.get(key, default) for key, default in _BULK_COLUMNS}
+
+
+# (column, default) for the columns FECEntryBuilder.to_dict() fills in
+_BULK_COLUMNS = tuple(
+    (column.key, column.default.arg if column.default is not None and column.default.is_scalar else None)
+    for column in FECEntry.__table__.columns
+    if column.key not in ('id', 'created_at', 'updated_at')
+)
\ No newline at end of file
@@ -4,7 +4,11 @@ Unit tests for Binance API client.
 
 import pytest
 import time
-from unittest.mock import Mock, patch, MagicMock
+import asyncio
+import json
+import hmac
+import hashlib
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import requests
 from datetime import datetime
 
@@ -25,10 +29,12 @@ class TestBinanceClient:
         """Set up test environment."""
         # Create mock config
         self.mock_config = Mock(spec=Config)
+        self.mock_config.api = Mock()
         self.mock_config.api.base_url = "https://api.binance.com"
         self.mock_config.api.timeout = 30
         self.mock_config.api.max_retries = 3
         self.mock_config.api.rate_limit_delay = 0.1
+        self.mock_config.api.max_concurrent = 10
         self.mock_config.get_credentials.return_value = ("test_api_key", "test_secret_key")
     
     def test_initialization_success(self):
@@ -43,6 +49,18 @@ class TestBinanceClient:
         assert client.secret_key == "test_secret_key"
         assert 'X-MBX-APIKEY' in client.session.headers
     
+    def test_initialization_connection_pool(self):
+        """Test the session connection pool is sized for concurrent requests."""
+        client = BinanceClient(self.mock_config)
+        
+        adapter = client.session.get_adapter("https://api.binance.com")
+        
+        assert adapter._pool_connections == 1
+        assert adapter._pool_maxsize == 10
+        assert client.session.get_adapter("http://localhost") is adapter
+        assert adapter.max_retries.total == 0
+        assert client.session.headers['Connection'] == 'keep-alive'
+    
     def test_initialization_missing_credentials(self):
         """Test initialization with missing credentials."""
         self.mock_config.get_credentials.side_effect = ValueError("API credentials not configured")
@@ -62,6 +80,11 @@ class TestBinanceClient:
         # Signature should be a 64-character hex string
         assert len(signature) == 64
         assert all(c in '0123456789abcdef' for c in signature)
+        
+        # Reusing the keyed prototype must match a fresh HMAC every time
+        expected = hmac.new(b"test_secret_key", query_string.encode('utf-8'), hashlib.sha256).hexdigest()
+        assert signature == expected
+        assert client._generate_signature(query_string) == expected
     
     @patch('time.sleep')
     def test_rate_limiting(self, mock_sleep):
@@ -80,13 +103,58 @@ class TestBinanceClient:
         sleep_time = mock_sleep.call_args[0][0]
         assert 0 < sleep_time <= client.rate_limit_delay
     
+    @patch('binance_fec_extractor.api.binance_client.time.monotonic')
+    @patch('time.sleep')
+    def test_rate_limiting_skips_negligible_sleep(self, mock_sleep, mock_monotonic):
+        """Test rate limiting does not sleep for sub-millisecond waits."""
+        client = BinanceClient(self.mock_config)
+        
+        mock_monotonic.return_value = 1000.0
+        client._apply_rate_limit()
+        
+        mock_monotonic.return_value = 1000.0 + client.rate_limit_delay - 0.0005
+        client._apply_rate_limit()
+        
+        mock_sleep.assert_not_called()
+    
+    @patch('binance_fec_extractor.api.binance_client.time.monotonic')
+    @patch('time.sleep')
+    def test_rate_limiting_weight_budget(self, mock_sleep, mock_monotonic):
+        """Test requests wait for the weight window once the budget is spent."""
+        client = BinanceClient(self.mock_config)
+        client.rate_limit_delay = 0
+        
+        mock_monotonic.return_value = 1000.0
+        for _ in range(60):
+            client._apply_rate_limit(20)
+        mock_sleep.assert_not_called()
+        
+        # Budget exhausted: wait until the first slot leaves the window
+        mock_monotonic.return_value = 1010.0
+        client._apply_rate_limit(20)
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(50.0)
+    
+    def test_handle_response_reconciles_reported_weight(self):
+        """Test weight reported by Binance is added to the local budget."""
+        client = BinanceClient(self.mock_config)
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({}).encode()
+        mock_response.headers = {'X-MBX-USED-WEIGHT-1M': '500'}
+        
+        client._handle_response(mock_response)
+        
+        assert client.get_rate_limit_status()['weight_budget_remaining'] == 700
+    
     def test_handle_response_success(self):
         """Test successful response handling."""
         client = BinanceClient(self.mock_config)
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {'X-MBX-USED-WEIGHT-1M': '10'}
         
         result = client._handle_response(mock_response)
@@ -100,7 +168,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 401
-        mock_response.json.return_value = {"code": -2014, "msg": "API-key format invalid."}
+        mock_response.content = json.dumps({"code": -2014, "msg": "API-key format invalid."}).encode()
         mock_response.headers = {}
         
         with pytest.raises(AuthenticationError) as exc_info:
@@ -115,7 +183,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 403
-        mock_response.json.return_value = {"code": -2015, "msg": "Invalid API-key, IP, or permissions for action."}
+        mock_response.content = json.dumps({"code": -2015, "msg": "Invalid API-key, IP, or permissions for action."}).encode()
         mock_response.headers = {}
         
         with pytest.raises(InsufficientPermissionsError) as exc_info:
@@ -130,7 +198,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 429
-        mock_response.json.return_value = {"code": -1003, "msg": "Too many requests."}
+        mock_response.content = json.dumps({"code": -1003, "msg": "Too many requests."}).encode()
         mock_response.headers = {'Retry-After': '60'}
         
         with pytest.raises(RateLimitError) as exc_info:
@@ -145,7 +213,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {"code": -1000, "msg": "Unknown error occurred."}
+        mock_response.content = json.dumps({"code": -1000, "msg": "Unknown error occurred."}).encode()
         mock_response.headers = {}
         
         with pytest.raises(APIError) as exc_info:
@@ -166,7 +234,7 @@ class TestBinanceClient:
         # Mock successful response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -174,6 +242,7 @@ class TestBinanceClient:
         
         assert result == {"success": True}
         mock_request.assert_called_once()
+        assert mock_request.call_args[0][1] == "https://api.binance.com/api/v3/ping"
     
     @patch('binance_fec_extractor.api.binance_client.time.time')
     @patch('requests.Session.request')
@@ -187,7 +256,7 @@ class TestBinanceClient:
         # Mock successful response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"success": True}
+        mock_response.content = json.dumps({"success": True}).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -205,16 +274,17 @@ class TestBinanceClient:
     def test_make_request_retry_logic(self, mock_request, mock_sleep):
         """Test retry logic for failed requests."""
         client = BinanceClient(self.mock_config)
+        client.rate_limit_delay = 0  # Only the retry backoff sleeps
         
         # Mock failed responses followed by success
         mock_response_fail = Mock()
         mock_response_fail.status_code = 500
-        mock_response_fail.json.return_value = {"code": -1000, "msg": "Internal error"}
+        mock_response_fail.content = json.dumps({"code": -1000, "msg": "Internal error"}).encode()
         mock_response_fail.headers = {}
         
         mock_response_success = Mock()
         mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {"success": True}
+        mock_response_success.content = json.dumps({"success": True}).encode()
         mock_response_success.headers = {}
         
         mock_request.side_effect = [
@@ -228,6 +298,23 @@ class TestBinanceClient:
         assert mock_request.call_count == 2
         mock_sleep.assert_called_once()
     
+    @patch('binance_fec_extractor.api.binance_client.time.sleep')
+    @patch('requests.Session.request')
+    def test_make_request_retry_exhausted(self, mock_request, mock_sleep):
+        """Test that retries stop after max_retries and re-sign each attempt."""
+        client = BinanceClient(self.mock_config)
+        
+        mock_request.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        params = {"symbol": "BTCUSDT"}
+        
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client._make_request('GET', '/api/v3/myTrades', params=params, signed=True)
+        
+        assert mock_request.call_count == client.max_retries + 1
+        assert params == {"symbol": "BTCUSDT"}
+        for call in mock_request.call_args_list:
+            assert 'signature=' in call[0][1]
+    
     @patch('requests.Session.request')
     def test_authenticate_success(self, mock_request):
         """Test successful authentication."""
@@ -235,7 +322,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "makerCommission": 15,
             "takerCommission": 15,
             "buyerCommission": 0,
@@ -246,7 +333,7 @@ class TestBinanceClient:
             "updateTime": 123456789,
             "accountType": "SPOT",
             "balances": []
-        }
+        }).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -262,7 +349,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 401
-        mock_response.json.return_value = {"code": -2014, "msg": "API-key format invalid."}
+        mock_response.content = json.dumps({"code": -2014, "msg": "API-key format invalid."}).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -276,10 +363,10 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "permissions": ["SPOT", "MARGIN"],
             "canTrade": True
-        }
+        }).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -295,10 +382,10 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "permissions": ["MARGIN"],  # Missing SPOT
             "canTrade": True
-        }
+        }).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -314,7 +401,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {}
+        mock_response.content = json.dumps({}).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -340,7 +427,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"serverTime": 1499827319559}
+        mock_response.content = json.dumps({"serverTime": 1499827319559}).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -356,11 +443,11 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "timezone": "UTC",
             "serverTime": 1499827319559,
             "symbols": []
-        }
+        }).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -369,6 +456,27 @@ class TestBinanceClient:
         assert exchange_info["timezone"] == "UTC"
         assert "symbols" in exchange_info
     
+    @patch('binance_fec_extractor.api.binance_client.time.monotonic')
+    @patch('requests.Session.request')
+    def test_get_exchange_info_cached(self, mock_request, mock_monotonic):
+        """Test exchange information is cached until the TTL expires."""
+        client = BinanceClient(self.mock_config)
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"timezone": "UTC", "symbols": []}).encode()
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+        
+        mock_monotonic.return_value = 1000.0
+        client.get_exchange_info()
+        client.get_exchange_info()
+        assert mock_request.call_count == 1
+        
+        mock_monotonic.return_value = 1000.0 + client._exchange_info_ttl
+        client.get_exchange_info()
+        assert mock_request.call_count == 2
+    
     def test_get_rate_limit_status(self):
         """Test getting rate limit status."""
         client = BinanceClient(self.mock_config)
@@ -407,7 +515,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {
                 "symbol": "BTCUSDT",
                 "id": 28457,
@@ -421,7 +529,7 @@ class TestBinanceClient:
                 "isMaker": False,
                 "isBestMatch": True
             }
-        ]
+        ]).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -431,6 +539,92 @@ class TestBinanceClient:
         assert trades[0]["symbol"] == "BTCUSDT"
         assert trades[0]["price"] == "4000.00000000"
     
+    @patch('requests.Session.request')
+    def test_get_trades_for_symbol_deduplicated(self, mock_request):
+        """Test identical trade page requests within the TTL hit the network once."""
+        client = BinanceClient(self.mock_config)
+        
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps([{"symbol": "BTCUSDT", "id": 1, "time": 1}]).encode()
+        mock_response.headers = {}
+        mock_request.return_value = mock_response
+        
+        first = client.get_trades(symbol="BTCUSDT", start_time=1, end_time=2, limit=100)
+        second = client.get_trades(symbol="BTCUSDT", start_time=1, end_time=2, limit=100)
+        client.get_trades(symbol="BTCUSDT", start_time=2, end_time=3, limit=100)
+        
+        assert first == second
+        assert mock_request.call_count == 2
+        
+        # Callers get their own copies of the cached trades
+        first.append({"symbol": "BTCUSDT", "id": 2, "time": 2})
+        second[0]["id"] = 99
+        assert client.get_trades(symbol="BTCUSDT", start_time=1, end_time=2, limit=100) == [
+            {"symbol": "BTCUSDT", "id": 1, "time": 1}
+        ]
+        
+        # Expired entries are refetched
+        for key, (expires_at, data) in list(client._response_cache.items()):
+            client._response_cache[key] = (time.monotonic() - 1, data)
+        client.get_trades(symbol="BTCUSDT", start_time=1, end_time=2, limit=100)
+        assert mock_request.call_count == 3
+    
+    @patch.object(BinanceClient, '_get_trades_for_symbol')
+    @patch.object(BinanceClient, 'get_exchange_info')
+    @patch.object(BinanceClient, 'get_account_info')
+    def test_get_all_trades_concurrent(self, mock_account, mock_exchange, mock_symbol_trades):
+        """Test getting trades for all symbols through the worker pool."""
+        from binance_fec_extractor.api.binance_client import InvalidSymbolError
+        client = BinanceClient(self.mock_config)
+        
+        mock_account.return_value = {"balances": [{"asset": "BTC", "free": "1.0", "locked": "0.0"}]}
+        mock_exchange.return_value = {"symbols": [
+            {"symbol": "BTCUSDT", "baseAsset": "BTC", "quoteAsset": "USDT", "status": "TRADING"},
+            {"symbol": "ETHBTC", "baseAsset": "ETH", "quoteAsset": "BTC", "status": "TRADING"},
+            {"symbol": "OLDBTC", "baseAsset": "OLD", "quoteAsset": "BTC", "status": "TRADING"},
+            {"symbol": "ETHUSDT", "baseAsset": "ETH", "quoteAsset": "USDT", "status": "TRADING"},
+            {"symbol": "BNBBTC", "baseAsset": "BNB", "quoteAsset": "BTC", "status": "BREAK"},
+        ]}
+        
+        def symbol_trades(symbol, start_time, end_time, limit):
+            if symbol == "OLDBTC":
+                raise InvalidSymbolError(code=-1121, message="Invalid symbol")
+            return {
+                "BTCUSDT": [{"symbol": "BTCUSDT", "time": 2}],
+                "ETHBTC": [{"symbol": "ETHBTC", "time": 1}],
+            }[symbol]
+        
+        mock_symbol_trades.side_effect = symbol_trades
+        
+        trades = client.get_trades(limit=100)
+        client.close()
+        
+        assert mock_symbol_trades.call_count == 3
+        assert [trade["symbol"] for trade in trades] == ["ETHBTC", "BTCUSDT"]
+    
+    @patch.object(BinanceClient, '_get_trades_for_symbol')
+    @patch.object(BinanceClient, 'get_exchange_info')
+    @patch.object(BinanceClient, 'get_account_info')
+    def test_get_all_trades_merged_by_time(self, mock_account, mock_exchange, mock_symbol_trades):
+        """Test per-symbol trades are merged in time order and limited."""
+        client = BinanceClient(self.mock_config)
+        
+        mock_account.return_value = {"balances": [{"asset": "USDT", "free": "10.0", "locked": "0.0"}]}
+        mock_exchange.return_value = {"symbols": [
+            {"symbol": "BTCUSDT", "baseAsset": "BTC", "quoteAsset": "USDT", "status": "TRADING"},
+            {"symbol": "ETHUSDT", "baseAsset": "ETH", "quoteAsset": "USDT", "status": "TRADING"},
+        ]}
+        mock_symbol_trades.side_effect = lambda symbol, *args: {
+            "BTCUSDT": [{"id": 1, "time": 1}, {"id": 3, "time": 3}, {"id": 5, "time": 5}],
+            "ETHUSDT": [{"id": 2, "time": 2}, {"id": 4, "time": 4}],
+        }[symbol]
+        
+        trades = client.get_trades(limit=4)
+        client.close()
+        
+        assert [trade["id"] for trade in trades] == [1, 2, 3, 4]
+    
     @patch('requests.Session.request')
     def test_get_deposits(self, mock_request):
         """Test getting deposit history."""
@@ -438,7 +632,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {
                 "amount": "0.00999800",
                 "coin": "PAXG",
@@ -451,7 +645,7 @@ class TestBinanceClient:
                 "transferType": 0,
                 "confirmTimes": "12/12"
             }
-        ]
+        ]).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -461,6 +655,73 @@ class TestBinanceClient:
         assert deposits[0]["coin"] == "PAXG"
         assert deposits[0]["amount"] == "0.00999800"
     
+    @patch.object(BinanceClient, '_make_request')
+    def test_iter_deposits_paginates(self, mock_request):
+        """Test deposit history is streamed page by page until a short page."""
+        client = BinanceClient(self.mock_config)
+        
+        pages = [
+            [{"id": 1}, {"id": 2}],
+            [{"id": 3}, {"id": 4}],
+            [{"id": 5}],
+        ]
+        offsets = []
+        
+        def page_for(method, endpoint, params=None, signed=False):
+            offsets.append(params.get('offset'))
+            return pages[len(offsets) - 1]
+        
+        mock_request.side_effect = page_for
+        
+        deposits = client.iter_deposits(start_time=1000, page_size=2, prefetch=False)
+        
+        assert next(deposits) == {"id": 1}
+        assert mock_request.call_count == 1
+        assert [deposit["id"] for deposit in deposits] == [2, 3, 4, 5]
+        assert offsets == [None, 2, 4]
+        
+        # With prefetch the next page is requested before the current one is consumed
+        offsets.clear()
+        deposits = client.iter_deposits(start_time=1000, page_size=2)
+        
+        assert next(deposits) == {"id": 1}
+        deadline = time.monotonic() + 5
+        while len(offsets) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert offsets == [None, 2]
+        assert [deposit["id"] for deposit in deposits] == [2, 3, 4, 5]
+        assert offsets == [None, 2, 4]
+    
+    @patch.object(BinanceClient, '_make_request')
+    def test_iter_asset_dividend_record_narrows_end_time(self, mock_request):
+        """Test dividend pages walk back in time from the oldest record seen."""
+        client = BinanceClient(self.mock_config)
+        
+        mock_request.side_effect = [
+            {"rows": [{"divTime": 300}, {"divTime": 200}], "total": 3},
+            {"rows": [{"divTime": 100}], "total": 3},
+        ]
+        
+        dividends = list(client.iter_asset_dividend_record(page_size=2))
+        
+        assert [dividend["divTime"] for dividend in dividends] == [300, 200, 100]
+        assert mock_request.call_args_list[1].kwargs['params']['endTime'] == 200
+        
+        # Records sharing the boundary divTime are neither skipped nor repeated
+        a, b, c = ({"id": name, "divTime": 200} for name in "abc")
+        mock_request.reset_mock()
+        mock_request.side_effect = [
+            {"rows": [{"id": "new", "divTime": 300}, a, b], "total": 7},
+            {"rows": [b, a, c], "total": 7},
+            {"rows": [{"id": "e", "divTime": 100}, {"id": "f", "divTime": 100}, {"id": "g", "divTime": 50}], "total": 7},
+            {"rows": [{"id": "g", "divTime": 50}], "total": 7},
+        ]
+        
+        dividends = list(client.iter_asset_dividend_record(page_size=3, prefetch=False))
+        
+        assert [dividend["id"] for dividend in dividends] == ["new", "a", "b", "c", "e", "f", "g"]
+        assert [call.kwargs['params']['endTime'] for call in mock_request.call_args_list[1:]] == [200, 199, 50]
+    
     @patch('requests.Session.request')
     def test_get_withdrawals(self, mock_request):
         """Test getting withdrawal history."""
@@ -468,7 +729,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {
                 "address": "0x94df8b352de7f46f64b01d3666bf6e936e44ce60",
                 "amount": "8.91000000",
@@ -481,7 +742,7 @@ class TestBinanceClient:
                 "status": 6,
                 "txId": "0xb5ef8c13b968a406cc62a93a8bd80f9e9a906ef1b3fcf20a2e48573c17659268"
             }
-        ]
+        ]).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -498,7 +759,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "total": 8,
             "userAssetDribblets": [
                 {
@@ -518,7 +779,7 @@ class TestBinanceClient:
                     ]
                 }
             ]
-        }
+        }).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -534,7 +795,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "rows": [
                 {
                     "amount": "10.00000000",
@@ -545,7 +806,7 @@ class TestBinanceClient:
                 }
             ],
             "total": 1
-        }
+        }).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -562,7 +823,7 @@ class TestBinanceClient:
         
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "total": 1,
             "rows": [
                 {
@@ -574,7 +835,7 @@ class TestBinanceClient:
                     "timestamp": 1544433325000
                 }
             ]
-        }
+        }).encode()
         mock_response.headers = {}
         mock_request.return_value = mock_response
         
@@ -613,6 +874,121 @@ class TestBinanceClient:
         assert len(transactions['dividends']) == 1
         assert len(transactions['transfers']) == 1
     
+    @patch.object(BinanceClient, 'get_trades')
+    @patch.object(BinanceClient, 'get_deposits')
+    @patch.object(BinanceClient, 'get_withdrawals')
+    @patch.object(BinanceClient, 'get_dust_log')
+    @patch.object(BinanceClient, 'get_asset_dividend_record')
+    @patch.object(BinanceClient, 'get_universal_transfer_history')
+    def test_get_all_transactions_cached(self, mock_transfers, mock_dividends, mock_dust,
+                                         mock_withdrawals, mock_deposits, mock_trades):
+        """Test repeated ranges are served from the cache as independent copies."""
+        client = BinanceClient(self.mock_config)
+        
+        for mock_fetch in (mock_trades, mock_deposits, mock_withdrawals, mock_dust, mock_dividends, mock_transfers):
+            mock_fetch.return_value = [{"type": "record"}]
+        
+        first = client.get_all_transactions(start_time=1, end_time=2)
+        first['trades'].append({"type": "local"})
+        second = client.get_all_transactions(start_time=1, end_time=2)
+        client.get_all_transactions(start_time=1, end_time=3)
+        
+        assert second['trades'] == [{"type": "record"}]
+        assert mock_trades.call_count == 2
+        assert client.get_cache_stats() == {'cached_ranges': 2, 'hits': 1, 'misses': 2}
+    
+    @patch.object(BinanceClient, '_get_trades_for_symbol')
+    @patch.object(BinanceClient, 'get_exchange_info')
+    @patch.object(BinanceClient, 'get_account_info')
+    @patch.object(BinanceClient, 'get_deposits', return_value=[])
+    @patch.object(BinanceClient, 'get_withdrawals', return_value=[])
+    @patch.object(BinanceClient, 'get_dust_log', return_value=[])
+    @patch.object(BinanceClient, 'get_asset_dividend_record', return_value=[])
+    @patch.object(BinanceClient, 'get_universal_transfer_history', return_value=[])
+    def test_get_all_transactions_not_cached_after_symbol_failure(self, mock_transfers, mock_dividends, mock_dust,
+                                                                   mock_withdrawals, mock_deposits, mock_account,
+                                                                   mock_exchange, mock_symbol_trades):
+        """Test trades missing a failed symbol are not cached as the complete range."""
+        from binance_fec_extractor.api.binance_client import ServerError
+        client = BinanceClient(self.mock_config)
+        
+        mock_account.return_value = {"balances": [{"asset": "USDT", "free": "10.0", "locked": "0.0"}]}
+        mock_exchange.return_value = {"symbols": [
+            {"symbol": "BTCUSDT", "baseAsset": "BTC", "quoteAsset": "USDT", "status": "TRADING"},
+            {"symbol": "ETHUSDT", "baseAsset": "ETH", "quoteAsset": "USDT", "status": "TRADING"},
+        ]}
+        eth_failures = [ServerError(code=500, message="Internal server error")]
+        
+        def symbol_trades(symbol, *args):
+            if symbol == "ETHUSDT" and eth_failures:
+                raise eth_failures.pop()
+            return [{"symbol": symbol, "time": 1 if symbol == "BTCUSDT" else 2}]
+        mock_symbol_trades.side_effect = symbol_trades
+        
+        partial = client.get_all_transactions(start_time=1, end_time=2)
+        complete = client.get_all_transactions(start_time=1, end_time=2)
+        cached = client.get_all_transactions(start_time=1, end_time=2)
+        client.close()
+        
+        assert [trade["symbol"] for trade in partial['trades']] == ["BTCUSDT"]
+        assert [trade["symbol"] for trade in complete['trades']] == ["BTCUSDT", "ETHUSDT"]
+        assert cached == complete
+        assert mock_symbol_trades.call_count == 4
+        assert client.get_cache_stats() == {'cached_ranges': 1, 'hits': 1, 'misses': 2}
+    
+    @patch.object(BinanceClient, 'get_trades')
+    @patch.object(BinanceClient, 'get_deposits')
+    @patch.object(BinanceClient, 'get_withdrawals')
+    @patch.object(BinanceClient, 'get_dust_log')
+    @patch.object(BinanceClient, 'get_asset_dividend_record')
+    @patch.object(BinanceClient, 'get_universal_transfer_history')
+    def test_get_all_transactions_async_partial_failure(self, mock_transfers, mock_dividends, mock_dust,
+                                                        mock_withdrawals, mock_deposits, mock_trades):
+        """Test a failing transaction type is reported without losing the others."""
+        client = BinanceClient(self.mock_config)
+        
+        mock_trades.return_value = [{"type": "trade"}]
+        mock_deposits.side_effect = APIError(code=-1000, message="Unknown error")
+        mock_withdrawals.return_value = []
+        mock_dust.return_value = []
+        mock_dividends.return_value = [{"type": "dividend"}]
+        mock_transfers.return_value = []
+        
+        transactions = asyncio.run(client.get_all_transactions_async(start_time=1, end_time=2))
+        
+        assert list(transactions) == ['trades', 'deposits', 'withdrawals', 'dust_conversions', 'dividends', 'transfers']
+        assert transactions['deposits'] == []
+        assert transactions['trades'] == [{"type": "trade"}]
+        mock_trades.assert_called_once_with(start_time=1, end_time=2, limit=1000)
+        
+        # All types failing raises a summary error
+        for mock_fetch in (mock_trades, mock_withdrawals, mock_dust, mock_dividends, mock_transfers):
+            mock_fetch.side_effect = ValueError("boom")
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(client.get_all_transactions_async(start_time=3, end_time=4))
+        assert exc_info.value.code == -1000
+        assert "Failed to retrieve deposits: Unknown error" in exc_info.value.message
+        assert "Failed to retrieve trades: boom" in exc_info.value.message
+        for mock_fetch in (mock_trades, mock_withdrawals, mock_dust, mock_dividends, mock_transfers):
+            mock_fetch.side_effect = None
+        
+        # Incomplete results are not cached
+        asyncio.run(client.get_all_transactions_async(start_time=1, end_time=2))
+        assert mock_trades.call_count == 3
+    
+    @patch.object(BinanceClient, 'get_trades')
+    def test_get_all_transactions_empty_range(self, mock_trades):
+        """Test an inverted range returns empty lists without any request."""
+        client = BinanceClient(self.mock_config)
+        
+        transactions = client.get_all_transactions(start_time=2000, end_time=1000)
+        
+        assert transactions == {
+            'trades': [], 'deposits': [], 'withdrawals': [],
+            'dust_conversions': [], 'dividends': [], 'transfers': []
+        }
+        mock_trades.assert_not_called()
+    
     @patch.object(BinanceClient, 'get_all_transactions')
     def test_get_transactions_by_date_range(self, mock_get_all):
         """Test getting transactions by date range."""
@@ -634,6 +1010,151 @@ class TestBinanceClient:
         assert 'end_time' in call_args
 
 
+class TestAsyncBinanceClient:
+    """Test AsyncBinanceClient class."""
+    
+    def setup_method(self):
+        """Set up test environment."""
+        pytest.importorskip("aiohttp")
+        self.mock_config = Mock(spec=Config)
+        self.mock_config.api = Mock()
+        self.mock_config.api.base_url = "https://api.binance.com"
+        self.mock_config.api.timeout = 30
+        self.mock_config.api.max_retries = 3
+        self.mock_config.api.rate_limit_delay = 0
+        self.mock_config.api.max_concurrent = 10
+        self.mock_config.get_credentials.return_value = ("test_api_key", "test_secret_key")
+    
+    @staticmethod
+    def _mock_response(status, payload, headers=None):
+        """Build an async context manager mimicking an aiohttp response."""
+        response = MagicMock()
+        response.status = status
+        response.headers = headers or {}
+        response.read = AsyncMock(return_value=json.dumps(payload).encode())
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=response)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return context
+    
+    def test_make_request_async_signed(self):
+        """Test signed async requests are sent with timestamp and signature."""
+        from binance_fec_extractor.api.binance_client import AsyncBinanceClient
+        
+        async def run():
+            async with AsyncBinanceClient(self.mock_config) as client:
+                session = client._get_async_session()
+                with patch.object(session, 'request',
+                                  return_value=self._mock_response(200, {"ok": True}, {'X-MBX-USED-WEIGHT-1M': '20'})) as mock_request:
+                    result = await client._make_request_async('GET', '/api/v3/account', signed=True)
+                return client, result, mock_request
+        
+        client, result, mock_request = asyncio.run(run())
+        
+        assert result == {"ok": True}
+        assert client.weight_used == 20
+        url = mock_request.call_args[0][1]
+        assert url.startswith("https://api.binance.com/api/v3/account?timestamp=")
+        assert "&signature=" in url
+    
+    @patch('time.sleep')
+    def test_make_request_async_retries_server_error(self, mock_sleep):
+        """Test async requests back off without blocking and retry server errors."""
+        from binance_fec_extractor.api.binance_client import AsyncBinanceClient
+        
+        async def run():
+            async with AsyncBinanceClient(self.mock_config) as client:
+                session = client._get_async_session()
+                responses = [
+                    self._mock_response(503, {"code": -1001, "msg": "Internal error"}),
+                    self._mock_response(200, {}),
+                ]
+                with patch.object(session, 'request', side_effect=responses), \
+                        patch('asyncio.sleep', new_callable=AsyncMock) as mock_async_sleep:
+                    result = await client._make_request_async('GET', '/api/v3/ping')
+                return result, mock_async_sleep
+        
+        result, mock_async_sleep = asyncio.run(run())
+        
+        assert result == {}
+        assert mock_async_sleep.await_count >= 1
+        mock_sleep.assert_not_called()
+    
+    def test_get_all_trades_async(self):
+        """Test trades for all relevant symbols are gathered and merged."""
+        from binance_fec_extractor.api.binance_client import AsyncBinanceClient, InvalidSymbolError
+        
+        async def fake_request(method, endpoint, params=None, signed=False):
+            if endpoint == '/api/v3/account':
+                return {"balances": [{"asset": "BTC", "free": "1.0", "locked": "0.0"}]}
+            if endpoint == '/api/v3/exchangeInfo':
+                return {"symbols": [
+                    {"symbol": "BTCUSDT", "baseAsset": "BTC", "quoteAsset": "USDT", "status": "TRADING"},
+                    {"symbol": "ETHBTC", "baseAsset": "ETH", "quoteAsset": "BTC", "status": "TRADING"},
+                    {"symbol": "OLDBTC", "baseAsset": "OLD", "quoteAsset": "BTC", "status": "TRADING"},
+                    {"symbol": "ETHUSDT", "baseAsset": "ETH", "quoteAsset": "USDT", "status": "TRADING"},
+                ]}
+            if params['symbol'] == "OLDBTC":
+                raise InvalidSymbolError(code=-1121, message="Invalid symbol")
+            return {
+                "BTCUSDT": [{"symbol": "BTCUSDT", "time": 2}],
+                "ETHBTC": [{"symbol": "ETHBTC", "time": 1}],
+            }[params['symbol']]
+        
+        async def run():
+            async with AsyncBinanceClient(self.mock_config) as client:
+                with patch.object(client, '_make_request_async', side_effect=fake_request) as mock_request:
+                    trades = await client.get_trades_async(limit=100)
+                return trades, mock_request
+        
+        trades, mock_request = asyncio.run(run())
+        
+        assert mock_request.call_count == 5
+        assert [trade["symbol"] for trade in trades] == ["ETHBTC", "BTCUSDT"]
+
+
+class TestHelpers:
+    """Test module-level request helpers."""
+    
+    def test_build_query_string_matches_urlencode(self):
+        """Test the fast path produces the same output as urlencode."""
+        from urllib.parse import urlencode
+        from binance_fec_extractor.api.binance_client import _build_query_string
+        
+        cases = [
+            {"symbol": "BTCUSDT", "limit": 1000, "timestamp": 1499827319559},
+            {"type": "MAIN_SPOT", "size": 100},
+            {"coin": "BTC", "note": "needs escaping & more"},
+            {"amount": 1.5e+20},
+            {"symbol": "BTC\n"},
+            {"symbol\n": "BTC"},
+            {},
+        ]
+        
+        for params in cases:
+            assert _build_query_string(params) == urlencode(params)
+    
+    def test_nonzero_balance(self):
+        """Test balance strings are classified without float parsing."""
+        from binance_fec_extractor.api.binance_client import _nonzero_balance
+        
+        assert _nonzero_balance("0.00000000") is False
+        assert _nonzero_balance("0") is False
+        assert _nonzero_balance("0.00000001") is True
+        assert _nonzero_balance("10.00000000") is True
+    
+    def test_to_milliseconds(self):
+        """Test datetimes convert to exact epoch milliseconds."""
+        from datetime import timezone
+        from binance_fec_extractor.api.binance_client import _to_milliseconds
+        
+        assert _to_milliseconds(datetime(2023, 1, 1, tzinfo=timezone.utc)) == 1672531200000
+        assert _to_milliseconds(datetime(2023, 1, 1, 0, 0, 0, 999999, tzinfo=timezone.utc)) == 1672531200999
+        
+        naive = datetime(2023, 6, 15, 12, 30, 45, 123000)
+        assert _to_milliseconds(naive) == round(naive.timestamp() * 1000)
+
+
 class TestAPIExceptions:
     """Test custom API exception classes."""
     
@@ -652,6 +1173,20 @@ class TestAPIExceptions:
         assert error.code == -1003
         assert error.message == "Too many requests"
         assert error.retry_after == 60
+        assert repr(error) == "RateLimitError(-1003, 'Too many requests')"
+    
+    def test_exceptions_picklable(self):
+        """Test exceptions survive pickling (needed across worker boundaries)."""
+        import pickle
+        error = pickle.loads(pickle.dumps(APIError(code=-1000, message="Unknown error")))
+        
+        assert error.code == -1000
+        assert str(error) == "Binance API Error -1000: Unknown error"
+        
+        error = pickle.loads(pickle.dumps(RateLimitError(code=-1003, message="Too many requests", retry_after=60)))
+        
+        assert isinstance(error, RateLimitError)
+        assert error.retry_after == 60
     
     def test_authentication_error(self):
         """Test AuthenticationError exception."""
@@ -726,10 +1261,12 @@ class TestErrorHandling:
     def setup_method(self):
         """Set up test environment."""
         self.mock_config = Mock(spec=Config)
+        self.mock_config.api = Mock()
         self.mock_config.api.base_url = "https://api.binance.com"
         self.mock_config.api.timeout = 30
         self.mock_config.api.max_retries = 3
         self.mock_config.api.rate_limit_delay = 0.1
+        self.mock_config.api.max_concurrent = 10
         self.mock_config.get_credentials.return_value = ("test_api_key", "test_secret_key")
     
     def test_should_retry_error_network_errors(self):
@@ -800,7 +1337,7 @@ class TestErrorHandling:
         # Test server error
         mock_response = Mock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {"code": -1000, "msg": "Unknown error"}
+        mock_response.content = json.dumps({"code": -1000, "msg": "Unknown error"}).encode()
         mock_response.headers = {}
         
         with pytest.raises(ServerError) as exc_info:
@@ -808,25 +1345,41 @@ class TestErrorHandling:
         assert exc_info.value.code == -1000
         
         # Test invalid parameter error
-        mock_response.json.return_value = {"code": -1102, "msg": "Mandatory parameter missing"}
+        mock_response.content = json.dumps({"code": -1102, "msg": "Mandatory parameter missing"}).encode()
         with pytest.raises(InvalidParameterError) as exc_info:
             client._handle_response(mock_response)
         assert exc_info.value.code == -1102
         
         # Test invalid symbol error
-        mock_response.json.return_value = {"code": -1120, "msg": "Invalid symbol"}
+        mock_response.content = json.dumps({"code": -1120, "msg": "Invalid symbol"}).encode()
         with pytest.raises(InvalidSymbolError) as exc_info:
             client._handle_response(mock_response)
         assert exc_info.value.code == -1120
         
         # Test order not found error
-        mock_response.json.return_value = {"code": -2013, "msg": "Order does not exist"}
+        mock_response.content = json.dumps({"code": -2013, "msg": "Order does not exist"}).encode()
         with pytest.raises(OrderNotFoundError) as exc_info:
             client._handle_response(mock_response)
         assert exc_info.value.code == -2013
         
         # Test insufficient balance error
-        mock_response.json.return_value = {"code": -2018, "msg": "Balance insufficient"}
+        mock_response.content = json.dumps({"code": -2018, "msg": "Balance insufficient"}).encode()
         with pytest.raises(InsufficientBalanceError) as exc_info:
             client._handle_response(mock_response)
-        assert exc_info.value.code == -2018
\ No newline at end of file
+        assert exc_info.value.code == -2018
+        
+        # Test rate limit error from error code carries Retry-After
+        mock_response.content = json.dumps({"code": -1003, "msg": "Too many requests"}).encode()
+        mock_response.headers = {'Retry-After': '30'}
+        with pytest.raises(RateLimitError) as exc_info:
+            client._handle_response(mock_response)
+        assert exc_info.value.code == -1003
+        assert exc_info.value.retry_after == 30
+        
+        # Test unmapped error code falls back to generic APIError
+        mock_response.content = json.dumps({"code": -9999, "msg": "Something new"}).encode()
+        mock_response.headers = {}
+        with pytest.raises(APIError) as exc_info:
+            client._handle_response(mock_response)
+        assert type(exc_info.value) is APIError
+        assert exc_info.value.code == -9999
\ No newline at end of file
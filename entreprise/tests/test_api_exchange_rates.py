@@ -40,6 +40,19 @@ class TestExchangeRate:
         assert rate.source == "ECB"
         assert rate.currency_pair == "USD/EUR"
     
+    def test_exchange_rate_slots(self):
+        """Test ExchangeRate stores fields in slots and compares by value."""
+        timestamp = datetime(2023, 12, 15, 10, 30)
+        rate = ExchangeRate(date(2023, 12, 15), 0.92, "ECB", "USD/EUR", timestamp)
+        
+        assert not hasattr(rate, '__dict__')
+        assert rate == ExchangeRate(date(2023, 12, 15), 0.92, "ECB", "USD/EUR", timestamp)
+        assert rate != ExchangeRate(date(2023, 12, 15), 0.93, "ECB", "USD/EUR", timestamp)
+        assert "rate=0.92" in repr(rate)
+        
+        rate.timestamp = datetime(2023, 12, 16, 10, 30)
+        assert rate._epoch == datetime(2023, 12, 16, 10, 30).timestamp()
+    
     def test_exchange_rate_to_dict(self):
         """Test ExchangeRate serialization."""
         test_date = date(2023, 12, 15)
@@ -92,7 +105,7 @@ class TestECBClient:
         # Mock ECB XML response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = '''<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = b'''<?xml version="1.0" encoding="UTF-8"?>
         <message:GenericData xmlns:message="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message"
                            xmlns:generic="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic">
             <message:DataSet>
@@ -121,7 +134,7 @@ class TestECBClient:
         # Mock empty ECB XML response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = '''<?xml version="1.0" encoding="UTF-8"?>
+        mock_response.content = b'''<?xml version="1.0" encoding="UTF-8"?>
         <message:GenericData xmlns:message="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message">
             <message:DataSet>
             </message:DataSet>
@@ -133,6 +146,69 @@ class TestECBClient:
         
         assert rate is None
     
+    @patch('requests.Session.get')
+    def test_get_usd_eur_rate_weekend_skips_request(self, mock_get):
+        """Test weekend dates are answered without an ECB request."""
+        assert self.client.get_usd_eur_rate(date(2023, 12, 17)) is None
+        mock_get.assert_not_called()
+    
+    def test_parse_ecb_xml_response_multiple_observations(self):
+        """Test the observation for the target date is picked from a multi-day series."""
+        xml_content = b'''<?xml version="1.0" encoding="UTF-8"?>
+        <message:GenericData xmlns:message="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message"
+                           xmlns:generic="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic">
+            <message:DataSet>
+                <generic:Series>
+                    <generic:Obs>
+                        <generic:ObsDimension id="TIME_PERIOD" value="2023-12-14"/>
+                        <generic:ObsValue value="0.9150"/>
+                    </generic:Obs>
+                    <generic:Obs>
+                        <generic:ObsDimension id="TIME_PERIOD" value="2023-12-15"/>
+                        <generic:ObsValue value="0.9234"/>
+                    </generic:Obs>
+                </generic:Series>
+            </message:DataSet>
+        </message:GenericData>'''
+        
+        rate = self.client._parse_ecb_xml_response(xml_content, date(2023, 12, 15))
+        
+        assert rate.rate == 0.9234
+        assert self.client._parse_ecb_xml_response(xml_content, date(2023, 12, 13)) is None
+        assert self.client._parse_ecb_xml_response(b"<not-xml", date(2023, 12, 15)) is None
+    
+    @patch('requests.Session.get')
+    def test_get_usd_eur_rates_range(self, mock_get):
+        """Test a date range is fetched in one request and parsed into rates by date."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b'''<?xml version="1.0" encoding="UTF-8"?>
+        <message:GenericData xmlns:message="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/message"
+                           xmlns:generic="http://www.sdmx.org/resources/sdmxml/schemas/v2_1/data/generic">
+            <message:DataSet>
+                <generic:Series>
+                    <generic:Obs>
+                        <generic:ObsDimension id="TIME_PERIOD" value="2023-12-14"/>
+                        <generic:ObsValue value="0.9150"/>
+                    </generic:Obs>
+                    <generic:Obs>
+                        <generic:ObsDimension id="TIME_PERIOD" value="2023-12-15"/>
+                        <generic:ObsValue value="0.9234"/>
+                    </generic:Obs>
+                </generic:Series>
+            </message:DataSet>
+        </message:GenericData>'''
+        mock_get.return_value = mock_response
+        
+        rates = self.client.get_usd_eur_rates_range(date(2023, 12, 14), date(2023, 12, 17))
+        
+        assert {rate_date: rate.rate for rate_date, rate in rates.items()} == {
+            date(2023, 12, 14): 0.9150,
+            date(2023, 12, 15): 0.9234,
+        }
+        mock_get.assert_called_once()
+        assert "startPeriod=2023-12-14&endPeriod=2023-12-17" in mock_get.call_args[0][0]
+    
     @patch('requests.Session.get')
     def test_get_usd_eur_rate_api_error(self, mock_get):
         """Test ECB API error handling."""
@@ -176,13 +252,13 @@ class TestCoinbaseClient:
         """Test successful Coinbase rate retrieval."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "data": {
                 "rates": {
                     "EUR": "0.92"  # EUR per USD
                 }
             }
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         test_date = date.today()  # Recent date
@@ -215,14 +291,14 @@ class TestCoinGeckoClient:
         """Test successful CoinGecko rate retrieval."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "market_data": {
                 "current_price": {
                     "usd": 1.0,
                     "eur": 0.92
                 }
             }
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         test_date = date(2023, 12, 15)
@@ -238,13 +314,13 @@ class TestCoinGeckoClient:
         """Test successful crypto price retrieval."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "market_data": {
                 "current_price": {
                     "usd": 42000.0
                 }
             }
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         test_date = date(2023, 12, 15)
@@ -257,11 +333,11 @@ class TestCoinGeckoClient:
         """Test crypto price not found."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "market_data": {
                 "current_price": {}
             }
-        }
+        }).encode()
         mock_get.return_value = mock_response
         
         test_date = date(2023, 12, 15)
@@ -277,7 +353,11 @@ class TestExchangeRateService:
         """Set up test environment."""
         # Create mock config
         self.mock_config = Mock(spec=Config)
+        self.mock_config.api = Mock()
+        self.mock_config.output = Mock()
+        self.mock_config.exchange_rates = Mock()
         self.mock_config.exchange_rates.cache_duration = 3600
+        self.mock_config.exchange_rates.max_rate_age_days = 5
         self.mock_config.exchange_rates.fallback_sources = ["coingecko"]
         self.mock_config.api.timeout = 30
         
@@ -290,6 +370,7 @@ class TestExchangeRateService:
     def teardown_method(self):
         """Clean up test environment."""
         import shutil
+        self.service.close()
         shutil.rmtree(self.temp_dir, ignore_errors=True)
     
     @patch.object(ECBClient, 'get_usd_eur_rate')
@@ -377,6 +458,128 @@ class TestExchangeRateService:
         assert "No USD/EUR rate found" in str(exc_info.value)
         assert exc_info.value.date == test_date.isoformat()
     
+    @patch.object(ECBClient, 'get_usd_eur_rate')
+    @patch.object(ECBClient, 'get_usd_eur_rates_range')
+    @patch.object(CoinGeckoClient, 'get_usd_eur_rate')
+    def test_get_usd_eur_rate_remembers_misses(self, mock_coingecko_get, mock_get_range, mock_ecb_get):
+        """Test sources that had no rate for a date are not asked again."""
+        self.service.max_rate_age_days = 1
+        test_date = date(2023, 12, 13)
+        mock_ecb_get.return_value = None
+        mock_get_range.side_effect = ECBAPIError("ECB unavailable", source="ECB")
+        mock_coingecko_get.return_value = None
+        free_clients = [
+            self.service.exchangerate_api_client,
+            self.service.freecurrency_api_client,
+            self.service.coinbase_client,
+        ]
+        for client in free_clients:
+            client.get_usd_eur_rate = Mock(return_value=None)
+        # Let the recent-only sources take the 2023 date
+        self.service.coinbase_client.max_age_days = None
+        self.service.coingecko_client.max_age_days = None
+        
+        for _ in range(2):
+            with pytest.raises(RateNotFoundError):
+                self.service.get_usd_eur_rate(test_date)
+        
+        # Target date plus the day before and after, each asked once
+        assert mock_ecb_get.call_count == 3
+        assert mock_coingecko_get.call_count == 1
+        for client in free_clients:
+            client.get_usd_eur_rate.assert_called_once_with(test_date)
+        
+        # Misses are persisted with the cache
+        self.service.flush()
+        new_service = ExchangeRateService(self.mock_config)
+        assert new_service._is_known_miss('ecb', test_date)
+        assert not new_service._is_known_miss('ecb', date(2023, 12, 18))
+    
+    @patch.object(ECBClient, 'get_usd_eur_rate')
+    @patch.object(ECBClient, 'get_usd_eur_rates_range')
+    def test_find_closest_ecb_rate_uses_range_request(self, mock_get_range, mock_ecb_get):
+        """Test the closest-rate scan fetches all candidate dates in one request."""
+        self.service.max_rate_age_days = 3
+        target_date = date(2023, 12, 13)  # Wednesday
+        thursday = date(2023, 12, 14)
+        mock_get_range.return_value = {
+            thursday: ExchangeRate(
+                date=thursday,
+                rate=0.91,
+                source="ECB",
+                currency_pair="USD/EUR",
+                timestamp=datetime.now()
+            )
+        }
+        
+        rate = self.service._find_closest_ecb_rate(target_date)
+        
+        assert rate.date == thursday
+        mock_get_range.assert_called_once_with(date(2023, 12, 11), date(2023, 12, 15))
+        mock_ecb_get.assert_not_called()
+        assert f"USD/EUR_{thursday.isoformat()}" in self.service.rate_cache
+    
+    @patch.object(ECBClient, 'get_usd_eur_rate')
+    @patch.object(ExchangeRateService, '_find_closest_ecb_rate')
+    @patch.object(CoinGeckoClient, 'get_usd_eur_rate')
+    def test_get_usd_eur_rate_skips_failing_fallbacks(self, mock_coingecko_get, mock_find_closest, mock_ecb_get):
+        """Test fallback sources are disabled after repeated failures."""
+        mock_ecb_get.return_value = None
+        mock_find_closest.return_value = None
+        mock_coingecko_get.side_effect = Exception("Service unavailable")
+        coinbase = self.service.coinbase_client
+        coinbase.get_usd_eur_rate = Mock(return_value=None)
+        self.service.exchangerate_api_client.get_usd_eur_rate = Mock(return_value=None)
+        self.service.freecurrency_api_client.get_usd_eur_rate = Mock(return_value=None)
+        
+        # Dates older than Coinbase and CoinGecko serve are refused without
+        # a request and leave the breaker closed
+        for day in range(11, 15):
+            with pytest.raises(RateNotFoundError):
+                self.service.get_usd_eur_rate(date(2023, 12, day))
+        coinbase.get_usd_eur_rate.assert_not_called()
+        mock_coingecko_get.assert_not_called()
+        assert not self.service._breaker_open('coinbase')
+        
+        for days_ago in range(4):
+            with pytest.raises(RateNotFoundError):
+                self.service.get_usd_eur_rate(date.today() - timedelta(days=days_ago))
+        
+        # The fourth date no longer reaches the failing sources
+        assert coinbase.get_usd_eur_rate.call_count == 3
+        assert mock_coingecko_get.call_count == 3
+        assert self.service._breaker_open('coingecko')
+        
+        # A success closes the breaker again
+        self.service._record_fallback_result('coinbase', True)
+        assert not self.service._breaker_open('coinbase')
+    
+    @patch.object(ECBClient, 'get_usd_eur_rate')
+    @patch.object(ECBClient, 'get_usd_eur_rates_range')
+    def test_find_closest_ecb_rate_prefers_nearest_earlier(self, mock_get_range, mock_ecb_get):
+        """Test the closest-rate scan picks the nearest date, earlier first."""
+        self.service.max_rate_age_days = 3
+        target_date = date(2023, 12, 13)  # Wednesday
+        mock_get_range.side_effect = ECBAPIError("ECB unavailable", source="ECB")
+        
+        def ecb_rate(check_date):
+            if check_date == date(2023, 12, 12):
+                raise ECBAPIError("ECB unavailable", source="ECB")
+            return ExchangeRate(
+                date=check_date,
+                rate=0.9,
+                source="ECB",
+                currency_pair="USD/EUR",
+                timestamp=datetime.now()
+            )
+        mock_ecb_get.side_effect = ecb_rate
+        
+        rate = self.service._find_closest_ecb_rate(target_date)
+        
+        assert rate.date == date(2023, 12, 14)
+        assert mock_ecb_get.call_count == 4  # Weekend days are not requested
+        assert self.service._is_known_miss('ecb', date(2023, 12, 12))
+    
     def test_convert_crypto_to_usd_stablecoin(self):
         """Test converting stablecoin to USD."""
         amount = 100.0
@@ -405,6 +608,18 @@ class TestExchangeRateService:
         with pytest.raises(RateNotFoundError):
             self.service.convert_crypto_to_usd(100.0, 'UNKNOWN', date.today())
     
+    @patch.object(CoinGeckoClient, 'get_crypto_usd_price')
+    def test_convert_crypto_to_usd_missing_price_resolver(self, mock_get_price):
+        """Test the installed resolver supplies prices no source has."""
+        mock_get_price.return_value = None
+        self.service.missing_price_resolver = Mock(return_value=2.5)
+        
+        usd_amount, crypto_price = self.service.convert_crypto_to_usd(100.0, 'UNKNOWN', date(2023, 12, 15))
+        
+        assert usd_amount == 250.0
+        assert crypto_price == 2.5
+        self.service.missing_price_resolver.assert_called_once_with('UNKNOWN', date(2023, 12, 15))
+    
     @patch.object(ExchangeRateService, 'get_usd_eur_rate')
     def test_convert_usd_to_eur(self, mock_get_rate):
         """Test converting USD to EUR."""
@@ -449,6 +664,48 @@ class TestExchangeRateService:
         assert usd_amount == 21000.0
         assert rate == exchange_rate
     
+    def test_clients_share_session(self):
+        """Test all rate clients reuse the service's pooled session."""
+        clients = [
+            self.service.ecb_client,
+            self.service.exchangerate_api_client,
+            self.service.freecurrency_api_client,
+            self.service.coinbase_client,
+            self.service.coingecko_client,
+        ]
+        
+        assert all(client.session is self.service.session for client in clients)
+        assert self.service.session.get_adapter('https://api.coinbase.com')._pool_maxsize == 50
+    
+    @patch.object(ECBClient, 'get_usd_eur_rates_range')
+    @patch.object(CoinGeckoClient, 'get_crypto_usd_price')
+    def test_convert_crypto_to_eur_batch(self, mock_get_price, mock_get_range):
+        """Test batch conversion resolves each distinct rate and price once."""
+        thursday, friday = date(2023, 12, 14), date(2023, 12, 15)
+        mock_get_range.return_value = {
+            rate_date: ExchangeRate(
+                date=rate_date,
+                rate=value,
+                source="ECB",
+                currency_pair="USD/EUR",
+                timestamp=datetime.now()
+            )
+            for rate_date, value in ((thursday, 0.9), (friday, 0.8))
+        }
+        mock_get_price.return_value = 10.0
+        
+        eur_amounts, usd_amounts, rates = self.service.convert_crypto_to_eur_batch(
+            [1.0, 2.0, 3.0, 4.0],
+            ['DOT', 'DOT', 'USDT', 'DOT'],
+            [thursday, thursday, friday, friday]
+        )
+        
+        assert usd_amounts == [10.0, 20.0, 3.0, 40.0]
+        assert eur_amounts == pytest.approx([9.0, 18.0, 2.4, 32.0])
+        assert [rate.date for rate in rates] == [thursday, thursday, friday, friday]
+        mock_get_range.assert_called_once_with(thursday, friday)
+        assert mock_get_price.call_count == 2  # DOT on each date
+    
     def test_cache_functionality(self):
         """Test exchange rate caching."""
         test_date = date(2023, 12, 15)
@@ -485,6 +742,7 @@ class TestExchangeRateService:
         # Cache and save
         cache_key = f"USD/EUR_{test_date.isoformat()}"
         self.service._cache_rate(cache_key, rate)
+        self.service.flush()
         
         # Create new service instance (should load cache)
         new_service = ExchangeRateService(self.mock_config)
@@ -495,6 +753,78 @@ class TestExchangeRateService:
         assert loaded_rate.date == rate.date
         assert loaded_rate.rate == rate.rate
         assert loaded_rate.source == rate.source
+        assert loaded_rate.timestamp == rate.timestamp
+    
+    def test_close_persists_unflushed_rates(self):
+        """Test rates cached below the flush threshold are saved on close."""
+        test_date = date(2023, 12, 15)
+        cache_key = f"USD/EUR_{test_date.isoformat()}"
+        self.service._cache_rate(cache_key, ExchangeRate(
+            date=test_date,
+            rate=0.92,
+            source="ECB",
+            currency_pair="USD/EUR",
+            timestamp=datetime.now()
+        ))
+        
+        self.service.close()
+        
+        with ExchangeRateService(self.mock_config) as new_service:
+            assert new_service.rate_cache[cache_key].rate == 0.92
+    
+    def test_save_cache_skips_expired_rates(self):
+        """Test save_cache persists only valid rates."""
+        valid_key = "USD/EUR_2023-12-15"
+        expired_key = "USD/EUR_2023-12-14"
+        self.service.rate_cache[valid_key] = ExchangeRate(
+            date(2023, 12, 15), 0.92, "ECB", "USD/EUR", datetime.now()
+        )
+        self.service.rate_cache[expired_key] = ExchangeRate(
+            date(2023, 12, 14), 0.91, "ECB", "USD/EUR", datetime.now() - timedelta(hours=2)
+        )
+        
+        self.service.save_cache()
+        new_service = ExchangeRateService(self.mock_config)
+        
+        assert valid_key in new_service.rate_cache
+        assert expired_key not in new_service.rate_cache
+    
+    def test_cache_rate_upserts_single_row(self):
+        """Test cached rates are written as single rows, on flush."""
+        import sqlite3
+        test_date = date(2023, 12, 15)
+        cache_key = f"USD/EUR_{test_date.isoformat()}"
+        for value in (0.91, 0.92):
+            self.service._cache_rate(cache_key, ExchangeRate(
+                date=test_date,
+                rate=value,
+                source="ECB",
+                currency_pair="USD/EUR",
+                timestamp=datetime.now()
+            ))
+        
+        # Nothing is written until the flush
+        assert not self.service.cache_file.exists()
+        self.service.flush()
+        
+        with sqlite3.connect(str(self.service.cache_file)) as db:
+            rows = db.execute("SELECT key, rate FROM rates").fetchall()
+        
+        assert rows == [(cache_key, 0.92)]
+    
+    def test_load_cache_drops_other_layouts(self):
+        """Test a cache database written with another layout version is discarded."""
+        import sqlite3
+        self.service.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with sqlite3.connect(str(self.service.cache_file)) as db:
+            db.execute("CREATE TABLE rates (key TEXT PRIMARY KEY, date TEXT, rate REAL, "
+                       "source TEXT, pair TEXT, ts TEXT, expires REAL)")
+            db.execute("INSERT INTO rates VALUES ('USD/EUR_2023-12-15', '2023-12-15', 0.92, "
+                       "'ECB', 'USD/EUR', '2023-12-15T10:00:00', 1e12)")
+        
+        new_service = ExchangeRateService(self.mock_config)
+        
+        assert new_service.rate_cache == {}
     
     def test_clear_cache(self):
         """Test cache clearing."""
@@ -578,6 +908,28 @@ class TestExchangeRateService:
         assert cache_key not in self.service.rate_cache
         assert valid_key in self.service.rate_cache
     
+    def test_cleanup_expired_cache_skips_refreshed_entries(self):
+        """Test that an expired rate replaced by a fresh one survives cleanup."""
+        test_date = date(2023, 12, 15)
+        cache_key = f"USD/EUR_{test_date.isoformat()}"
+        self.service.rate_cache[cache_key] = ExchangeRate(
+            date=test_date, rate=0.92, source="ECB", currency_pair="USD/EUR",
+            timestamp=datetime.now() - timedelta(hours=2)
+        )
+        
+        stats = self.service.get_cache_stats()
+        assert stats['expired_entries'] == 1
+        assert cache_key in self.service.rate_cache
+        
+        self.service.rate_cache[cache_key] = ExchangeRate(
+            date=test_date, rate=0.93, source="ECB", currency_pair="USD/EUR",
+            timestamp=datetime.now()
+        )
+        
+        assert self.service.cleanup_expired_cache() == 0
+        assert self.service.rate_cache[cache_key].rate == 0.93
+        assert self.service.get_cache_stats()['valid_entries'] == 1
+    
     def test_validate_rate_reasonableness(self):
         """Test rate reasonableness validation."""
         test_date = date(2023, 12, 15)
@@ -615,8 +967,51 @@ class TestExchangeRateService:
         )
         assert self.service.validate_rate_reasonableness(unreasonable_rate) is False
     
+    def test_rate_cache_dated_lookup(self):
+        """Test rates are found by date and forgotten with their key."""
+        test_date = date(2023, 12, 15)
+        cache_key = f"USD/EUR_{test_date.isoformat()}"
+        rate = ExchangeRate(test_date, 0.92, "ECB", "USD/EUR", datetime.now())
+        self.service._cache_rate(cache_key, rate)
+        
+        assert self.service.rate_cache.get_dated("USD/EUR", test_date) is rate
+        assert self.service._cached_usd_eur_rate(test_date) is rate
+        
+        del self.service.rate_cache[cache_key]
+        assert self.service.rate_cache.get_dated("USD/EUR", test_date) is None
+    
+    def test_validate_rate_reasonableness_latest_rates_index(self):
+        """Test the latest rates index never skips a cached date."""
+        test_date = date(2023, 12, 15)
+        
+        def cache(days_before, value):
+            rate_date = test_date - timedelta(days=days_before)
+            self.service._cache_rate(
+                f"USD/EUR_{rate_date.isoformat()}",
+                ExchangeRate(rate_date, value, "ECB", "USD/EUR", datetime.now())
+            )
+        
+        for days_before in (5, 3, 1):
+            cache(days_before, 0.92)
+        indexed = self.service.rate_cache.latest_before("USD/EUR", test_date)
+        assert [entry_date for entry_date, _ in indexed] == [
+            date(2023, 12, 10), date(2023, 12, 12), date(2023, 12, 14)
+        ]
+        
+        # A date between indexed ones empties the index; the scan sees it
+        cache(2, 1.4)
+        assert self.service.rate_cache.latest_before("USD/EUR", test_date) == []
+        rate = ExchangeRate(test_date, 1.2, "ECB", "USD/EUR", datetime.now())
+        assert self.service.validate_rate_reasonableness(rate) is True
+        
+        # Later dates are indexed again
+        cache(0, 0.92)
+        tomorrow = test_date + timedelta(days=1)
+        assert len(self.service.rate_cache.latest_before("USD/EUR", tomorrow)) == 1
+    
+    @patch.object(ECBClient, 'get_usd_eur_rates_range', return_value={})
     @patch.object(ExchangeRateService, 'get_usd_eur_rate')
-    def test_preload_rates_for_date_range(self, mock_get_rate):
+    def test_preload_rates_for_date_range(self, mock_get_rate, mock_get_range):
         """Test preloading rates for date range."""
         start_date = date(2023, 12, 15)
         end_date = date(2023, 12, 17)
@@ -639,7 +1034,82 @@ class TestExchangeRateService:
         assert stats['ecb_success'] == 3
         assert stats['failures'] == 0
         assert mock_get_rate.call_count == 3
+    
+    @patch.object(ECBClient, 'get_usd_eur_rates_range', return_value={})
+    @patch.object(ExchangeRateService, 'get_usd_eur_rate')
+    def test_preload_rates_for_date_range_concurrent(self, mock_get_rate, mock_get_range):
+        """Test preloading looks dates up concurrently."""
+        import threading
+        # Only released once all three lookups are in flight together
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def mock_rate_side_effect(target_date):
+            barrier.wait()
+            return ExchangeRate(
+                date=target_date,
+                rate=0.92,
+                source="Coinbase",
+                currency_pair="USD/EUR",
+                timestamp=datetime.now()
+            )
+        mock_get_rate.side_effect = mock_rate_side_effect
+        
+        stats = self.service.preload_rates_for_date_range(date(2023, 12, 15), date(2023, 12, 17), max_workers=3)
+        
+        assert stats['fallback_success'] == 3
+        assert stats['failures'] == 0
+    
+    @patch.object(ECBClient, 'get_usd_eur_rate')
+    @patch.object(ECBClient, 'get_usd_eur_rates_range')
+    def test_prefetch_serves_later_lookups(self, mock_get_range, mock_ecb_get):
+        """Test a prefetched ECB series answers exact and closest-date lookups."""
+        self.service.max_rate_age_days = 3
+        friday = date(2023, 12, 15)
+        mock_get_range.return_value = {
+            friday: ExchangeRate(
+                date=friday,
+                rate=0.92,
+                source="ECB",
+                currency_pair="USD/EUR",
+                timestamp=datetime.now()
+            )
+        }
+        mock_ecb_get.return_value = None
+        
+        stats = self.service.preload_rates_for_date_range(date(2023, 12, 14), friday)
+        
+        assert stats['ecb_success'] >= 1
+        assert self.service.get_usd_eur_rate(friday).rate == 0.92
+        assert self.service._find_closest_ecb_rate(date(2023, 12, 16)).date == friday
+        mock_get_range.assert_called_once_with(date(2023, 12, 14), friday)
 
+    
+    @patch.object(ECBClient, 'get_usd_eur_rate')
+    @patch.object(ECBClient, 'get_usd_eur_rates_range')
+    def test_prefetch_range_async_serves_waiting_lookups(self, mock_get_range, mock_ecb_get):
+        """Test lookups in a range being prefetched wait for the prefetch."""
+        import time
+        friday = date(2023, 12, 15)
+        
+        def slow_range(start_date, end_date):
+            time.sleep(0.05)
+            return {
+                friday: ExchangeRate(
+                    date=friday,
+                    rate=0.92,
+                    source="ECB",
+                    currency_pair="USD/EUR",
+                    timestamp=datetime.now()
+                )
+            }
+        mock_get_range.side_effect = slow_range
+        
+        thread = self.service.prefetch_range_async(date(2023, 12, 11), friday)
+        rate = self.service.get_usd_eur_rate(friday)
+        thread.join()
+        
+        assert rate.rate == 0.92
+        mock_ecb_get.assert_not_called()
 
 class TestExceptions:
     """Test custom exception classes."""
@@ -667,6 +1137,20 @@ class TestExceptions:
             currency_pair="USD/EUR"
         )
         
+        assert error.message == "Rate not found"
+        assert error.date == "2023-12-15"
+        assert error.currency_pair == "USD/EUR"
+
+    
+    def test_exceptions_picklable(self):
+        """Test exceptions keep their fields through pickling."""
+        import pickle
+        error = pickle.loads(pickle.dumps(RateNotFoundError(
+            "Rate not found",
+            date="2023-12-15",
+            currency_pair="USD/EUR"
+        )))
+        
         assert error.message == "Rate not found"
         assert error.date == "2023-12-15"
         assert error.currency_pair == "USD/EUR"
\ No newline at end of file
@@ -3,6 +3,7 @@ Unit tests for FEC account mapping system.
 """
 
 import pytest
+from collections.abc import Mapping
 from binance_fec_extractor.config.accounts import (
     SystemAccount,
     CRYPTO_ACCOUNTS,
@@ -19,6 +20,7 @@ from binance_fec_extractor.config.accounts import (
     format_account_description,
     get_conversion_account
 )
+from binance_fec_extractor.config import accounts
 
 
 class TestSystemAccount:
@@ -112,6 +114,13 @@ class TestGetCryptoAccount:
         """Test handling of empty symbol."""
         account_num, description = get_crypto_account("")
         assert account_num == DEFAULT_CRYPTO_ACCOUNT[0]
+    
+    def test_symbol_memo_is_bounded(self):
+        """Test arbitrary caller spellings do not grow the symbol memo unbounded."""
+        maxsize = accounts._canonical_symbol.cache_info().maxsize
+        for index in range(maxsize + 10):
+            get_crypto_account(f"tok{index}")
+        assert accounts._canonical_symbol.cache_info().currsize == maxsize
 
 
 class TestGetSystemAccount:
@@ -196,7 +205,7 @@ class TestAccountManagement:
     
     def test_add_crypto_account(self):
         """Test adding new cryptocurrency account."""
-        original_accounts = get_all_crypto_accounts()
+        original_accounts = dict(get_all_crypto_accounts())
         
         # Add new account
         add_crypto_account("TEST", "5220099999", "Test Token")
@@ -212,7 +221,7 @@ class TestAccountManagement:
     
     def test_add_crypto_account_case_handling(self):
         """Test adding cryptocurrency account with case handling."""
-        original_accounts = get_all_crypto_accounts()
+        original_accounts = dict(get_all_crypto_accounts())
         
         # Add account with lowercase symbol
         add_crypto_account("test", "5220099999", "Test Token")
@@ -232,21 +241,22 @@ class TestAccountManagement:
         """Test getting all cryptocurrency accounts."""
         all_accounts = get_all_crypto_accounts()
         
-        assert isinstance(all_accounts, dict)
+        assert isinstance(all_accounts, Mapping)
         assert "BTC" in all_accounts
         assert "USDC" in all_accounts
         assert len(all_accounts) > 0
         
-        # Verify it's a copy (modifying it doesn't affect original)
+        # Verify it's read-only (modifying it raises, the original is unchanged)
         original_count = len(CRYPTO_ACCOUNTS)
-        all_accounts["NEW_TOKEN"] = ("123", "New Token")
+        with pytest.raises(TypeError):
+            all_accounts["NEW_TOKEN"] = ("123", "New Token")
         assert len(CRYPTO_ACCOUNTS) == original_count
     
     def test_get_all_system_accounts(self):
         """Test getting all system accounts."""
         all_accounts = get_all_system_accounts()
         
-        assert isinstance(all_accounts, dict)
+        assert isinstance(all_accounts, Mapping)
         assert "INTERNAL_TRANSFER" in all_accounts
         assert "COMMISSIONS" in all_accounts
         assert "CONVERSION_GAINS" in all_accounts
@@ -276,6 +286,7 @@ class TestAccountValidation:
         assert validate_account_number("ABC123") is False  # Non-numeric
         assert validate_account_number("123.45") is False  # Contains decimal
         assert validate_account_number("123 456") is False  # Contains space
+        assert validate_account_number("\u0665\u0668\u0660") is False  # Non-ASCII digits
     
     def test_validate_account_number_whitespace(self):
         """Test validation handles whitespace."""
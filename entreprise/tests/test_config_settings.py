@@ -9,6 +9,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch
 
+from binance_fec_extractor.config import settings
 from binance_fec_extractor.config.settings import Config, load_config, APIConfig, OutputConfig, ExchangeRateConfig
 
 
@@ -22,6 +23,7 @@ class TestAPIConfig:
         assert config.timeout == 30
         assert config.max_retries == 3
         assert config.rate_limit_delay == 0.1
+        assert config.max_concurrent == 10
     
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -215,6 +217,16 @@ class TestConfig:
         with pytest.raises(ValueError, match="BINANCE_API_KEY appears to be a placeholder value"):
             config.validate_api_credentials()
     
+    @patch.dict(os.environ, {
+        'BINANCE_API_KEY': 'test_api_key_12345',
+        'BINANCE_SECRET_KEY': 'your_api_key_here'
+    })
+    def test_validate_api_credentials_shared_placeholders(self):
+        """Test that either placeholder prefix is rejected for both keys."""
+        config = Config(skip_validation=True)
+        with pytest.raises(ValueError, match="BINANCE_SECRET_KEY appears to be a placeholder value"):
+            config.validate_api_credentials()
+    
     @patch.dict(os.environ, {
         'BINANCE_API_KEY': 'test_api_key_12345',
         'BINANCE_SECRET_KEY': 'test_secret_key_12345'
@@ -232,6 +244,22 @@ class TestConfig:
         with pytest.raises(ValueError, match="API credentials not configured"):
             config.get_credentials()
     
+    @patch.dict(os.environ, {
+        'BINANCE_API_KEY': 'short',
+        'BINANCE_SECRET_KEY': 'test_secret_key_12345'
+    })
+    def test_get_credentials_validates_lazily(self):
+        """Test credential format is checked on first use, not at construction."""
+        config = Config(skip_validation=True)
+        with pytest.raises(ValueError, match="BINANCE_API_KEY appears to be too short"):
+            config.get_credentials()
+        
+        config.binance_api_key = 'test_api_key_12345'
+        with patch.object(config, 'validate_api_credentials', wraps=config.validate_api_credentials) as mock_validate:
+            assert config.get_credentials() == ('test_api_key_12345', 'test_secret_key_12345')
+            assert config.get_credentials() == ('test_api_key_12345', 'test_secret_key_12345')
+            mock_validate.assert_called_once()
+    
     def test_validation_negative_timeout(self):
         """Test validation of negative timeout."""
         config = Config()
@@ -260,6 +288,14 @@ class TestConfig:
         with pytest.raises(ValueError, match="Invalid fallback exchange rate source"):
             config.validate()
     
+    @patch.dict(os.environ, {'EXCHANGE_RATE_SOURCE': 'invalid_source'})
+    def test_skip_validation(self):
+        """Test validation can be skipped for known-valid inputs."""
+        config = Config(skip_validation=True)
+        assert config.exchange_rates.primary_source == 'invalid_source'
+        with pytest.raises(ValueError, match="Invalid primary exchange rate source"):
+            config.validate()
+    
     def test_ensure_output_directory(self):
         """Test ensuring output directory exists."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -270,6 +306,28 @@ class TestConfig:
             assert output_path.exists()
             assert output_path.is_dir()
     
+    def test_ensure_output_directory_cached(self):
+        """Test the output directory is only created once per path."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = Config(skip_validation=True)
+            config.output.directory = os.path.join(temp_dir, "first")
+            first = config.ensure_output_directory()
+            
+            with patch.object(Path, 'mkdir') as mock_mkdir:
+                assert config.ensure_output_directory() is first
+                mock_mkdir.assert_not_called()
+            
+            config.output.directory = os.path.join(temp_dir, "second")
+            assert config.ensure_output_directory().is_dir()
+    
+    def test_ensure_output_directory_not_a_directory(self):
+        """Test the output path is checked when the directory is first ensured."""
+        with tempfile.NamedTemporaryFile() as temp_file:
+            config = Config(skip_validation=True)
+            config.output.directory = temp_file.name
+            with pytest.raises(ValueError, match="Output path exists but is not a directory"):
+                config.ensure_output_directory()
+    
     @patch.dict(os.environ, {
         'BINANCE_API_KEY': 'test_api_key_12345',
         'BINANCE_SECRET_KEY': 'test_secret_key_12345',
@@ -317,5 +375,90 @@ class TestLoadConfig:
             config = load_config(config_file=config_file)
             assert isinstance(config, Config)
             assert config.api.base_url == "https://testnet.binance.vision"
+        finally:
+            os.unlink(config_file)
+    
+    def test_load_config_memoized(self):
+        """Test repeated loads reuse the parsed file until it changes."""
+        config_data = {
+            "api": {"timeout": 45},
+            "exchange_rates": {"fallback_sources": ["coinbase"]}
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config_data, f)
+            config_file = f.name
+        
+        try:
+            with patch.object(Config, 'load_from_file', autospec=True,
+                              side_effect=Config.load_from_file) as mock_load:
+                first = load_config(config_file=config_file)
+                second = load_config(config_file=config_file)
+                assert mock_load.call_count == 1
+            
+            # Copies are independent
+            second.api.timeout = 60
+            second.exchange_rates.fallback_sources.append("coingecko")
+            assert first.api.timeout == 45
+            assert load_config(config_file=config_file).exchange_rates.fallback_sources == ["coinbase"]
+            
+            # A changed file is read again
+            config_data["api"]["timeout"] = 120
+            with open(config_file, 'w') as f:
+                json.dump(config_data, f)
+            assert load_config(config_file=config_file).api.timeout == 120
+        finally:
+            os.unlink(config_file)
+    
+    def test_load_config_cache_bounded(self):
+        """Test only the latest load of a file is kept, without raw credentials."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"exchange_rates": {"fallback_sources": ["coinbase"]}}, f)
+            config_file = f.name
+        
+        try:
+            with patch.dict(settings._CONFIG_CACHE, clear=True):
+                for secret in ('secret_one', 'secret_two', 'secret_three'):
+                    env = {'BINANCE_API_KEY': 'api_key', 'BINANCE_SECRET_KEY': secret}
+                    assert load_config(config_file=config_file, env=env).binance_secret_key == secret
+                
+                assert list(settings._CONFIG_CACHE) == [os.path.abspath(config_file)]
+                fingerprint = settings._CONFIG_CACHE[os.path.abspath(config_file)][0]
+                assert 'secret_three' not in repr(fingerprint)
+                assert 'api_key' not in repr(fingerprint)
+                
+                # Switching back loads the file again
+                env = {'BINANCE_API_KEY': 'api_key', 'BINANCE_SECRET_KEY': 'secret_one'}
+                with patch.object(Config, 'load_from_file', autospec=True,
+                                  side_effect=Config.load_from_file) as mock_load:
+                    assert load_config(config_file=config_file, env=env).binance_secret_key == 'secret_one'
+                    assert mock_load.call_count == 1
+        finally:
+            os.unlink(config_file)
+    
+    @patch.dict(os.environ, {'MAX_RETRIES': '7', 'OUTPUT_DIR': 'env_output'})
+    def test_load_config_from_env_snapshot(self):
+        """Test an environment snapshot is read instead of os.environ."""
+        with patch.object(settings, '_ENV_SNAPSHOT', None):
+            snapshot = settings.snapshot_environment()
+            os.environ['MAX_RETRIES'] = '9'
+            assert settings.snapshot_environment() is snapshot
+        
+        assert snapshot['MAX_RETRIES'] == '7'
+        with pytest.raises(TypeError):
+            snapshot['MAX_RETRIES'] = '8'
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump({"exchange_rates": {"fallback_sources": ["coinbase"]}}, f)
+            config_file = f.name
+        
+        try:
+            config = load_config(config_file=config_file, env=snapshot)
+            assert config.api.max_retries == 7
+            assert config.output.directory == 'env_output'
+            
+            config = Config.from_env_snapshot({'MAX_RETRIES': '5'}, config_file=config_file)
+            assert config.api.max_retries == 5
+            assert config.output.directory == './output'
         finally:
             os.unlink(config_file)
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""
+Unit tests for the DatabaseManager.
+
+Tests engine configuration, connection testing, table creation and
+session handling.
+"""
+
+import threading
+import pytest
+from unittest.mock import patch
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from binance_fec_extractor.models import database
+from binance_fec_extractor.models.database import DatabaseManager
+
+
+@pytest.fixture
+def memory_manager():
+    """Create a DatabaseManager on an in-memory SQLite database."""
+    manager = DatabaseManager('sqlite://')
+    manager.init_database()
+    yield manager
+    manager.cleanup()
+
+
+@pytest.fixture
+def file_manager(tmp_path):
+    """Create a DatabaseManager on a SQLite file database."""
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'test.db'}")
+    manager.init_database()
+    yield manager
+    manager.cleanup()
+
+
+def record_statements(engine):
+    """Collect the SQL statements executed on an engine."""
+    statements = []
+    
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+    
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+class TestEngineConfiguration:
+    """Test cases for engine creation."""
+    
+    def test_memory_database_uses_static_pool(self, memory_manager):
+        """Test that an in-memory database keeps its single connection."""
+        assert isinstance(memory_manager.engine.pool, StaticPool)
+    
+    def test_file_database_uses_queue_pool(self, file_manager):
+        """Test that a file database gets a connection pool."""
+        assert isinstance(file_manager.engine.pool, QueuePool)
+    
+    def test_sqlite_pragmas_applied(self, file_manager):
+        """Test that new SQLite connections are tuned for bulk writes."""
+        with file_manager.engine.connect() as connection:
+            journal_mode = connection.execute(text("PRAGMA journal_mode")).scalar()
+            synchronous = connection.execute(text("PRAGMA synchronous")).scalar()
+        
+        assert journal_mode == 'wal'
+        assert synchronous == 1  # NORMAL
+    
+    def test_query_cache_size(self, memory_manager):
+        """Test that the engine compiled statement cache is sized for the models."""
+        assert memory_manager.engine._compiled_cache.capacity == database._QUERY_CACHE_SIZE
+    
+    def test_sqlite_engine_does_not_pre_ping(self, memory_manager):
+        """Test that SQLite engines are not flagged as pinging on checkout."""
+        assert memory_manager._pre_ping is False
+    
+    def test_default_database_url_from_environment(self):
+        """Test that DATABASE_URL overrides the SQLite default."""
+        with patch.dict('os.environ', {'DATABASE_URL': 'sqlite:///env.db'}):
+            assert DatabaseManager().database_url == 'sqlite:///env.db'
+    
+    def test_default_database_url_is_sqlite(self):
+        """Test that the default database is the SQLite file."""
+        with patch.dict('os.environ', {}, clear=True):
+            url = DatabaseManager().database_url
+        
+        assert url.startswith('sqlite:///')
+        assert url.endswith('binance_fec.db')
+
+
+class TestConnectionTest:
+    """Test cases for DatabaseManager.test_connection."""
+    
+    def test_connection_succeeds(self, memory_manager):
+        """Test that a reachable database passes and is pinged."""
+        statements = record_statements(memory_manager.engine)
+        
+        assert memory_manager.test_connection() is True
+        assert statements == ['SELECT 1']
+    
+    def test_connection_initializes_database(self):
+        """Test that the engine is created on demand."""
+        manager = DatabaseManager('sqlite://')
+        
+        assert manager.test_connection() is True
+        assert manager.engine is not None
+        manager.cleanup()
+    
+    def test_connection_checked_on_every_call(self, memory_manager):
+        """Test that a failure is reported after an earlier success."""
+        assert memory_manager.test_connection() is True
+        
+        error = OperationalError('SELECT 1', {}, Exception('database is gone'))
+        with patch.object(memory_manager.engine, 'connect', side_effect=error):
+            assert memory_manager.test_connection() is False
+        
+        assert memory_manager.test_connection() is True
+    
+    def test_pre_ping_engine_skips_query(self, memory_manager):
+        """Test that the checkout alone tests a pre-ping engine."""
+        memory_manager._pre_ping = True
+        statements = record_statements(memory_manager.engine)
+        
+        with patch.object(memory_manager.engine, 'connect',
+                          wraps=memory_manager.engine.connect) as connect:
+            assert memory_manager.test_connection() is True
+        
+        connect.assert_called_once()
+        assert statements == []
+    
+    def test_forced_test_runs_query(self, memory_manager):
+        """Test that force pings even a pre-ping engine."""
+        memory_manager._pre_ping = True
+        statements = record_statements(memory_manager.engine)
+        
+        with patch.object(memory_manager.engine, 'connect',
+                          wraps=memory_manager.engine.connect) as connect:
+            assert memory_manager.test_connection(force=True) is True
+        
+        connect.assert_called_once()
+        assert statements == ['SELECT 1']
+    
+    def test_forced_test_reports_failure(self, memory_manager):
+        """Test that a forced test fails when the query fails."""
+        statements = record_statements(memory_manager.engine)
+        
+        def fail(conn, cursor, statement, parameters, context, executemany):
+            raise OperationalError(statement, parameters, Exception('disk I/O error'))
+        
+        event.listen(memory_manager.engine, "before_cursor_execute", fail)
+        
+        assert memory_manager.test_connection(force=True) is False
+        assert statements == ['SELECT 1']
+
+
+class TestTablesAndSessions:
+    """Test cases for table creation and sessions."""
+    
+    def test_create_tables_requires_engine(self):
+        """Test that tables cannot be created before initialization."""
+        with pytest.raises(RuntimeError):
+            DatabaseManager('sqlite://').create_tables()
+    
+    def test_create_tables_once_per_engine(self, memory_manager):
+        """Test that repeated calls on the same engine do nothing."""
+        with patch.object(database._BASE_METADATA, 'create_all') as create_all:
+            memory_manager.create_tables()
+            memory_manager.create_tables()
+        
+        create_all.assert_called_once_with(bind=memory_manager.engine)
+    
+    def test_create_tables_again_after_reinit(self, memory_manager):
+        """Test that a new engine gets its tables created."""
+        with patch.object(database._BASE_METADATA, 'create_all') as create_all:
+            memory_manager.create_tables()
+            memory_manager.init_database()
+            memory_manager.create_tables()
+        
+        assert create_all.call_count == 2
+    
+    def test_thread_session_per_thread(self, memory_manager):
+        """Test that each thread gets its own session, reused within it."""
+        session = memory_manager.get_thread_session()
+        other_sessions = []
+        
+        thread = threading.Thread(
+            target=lambda: other_sessions.append(memory_manager.get_thread_session())
+        )
+        thread.start()
+        thread.join()
+        
+        assert memory_manager.get_thread_session() is session
+        assert other_sessions[0] is not session
+    
+    def test_thread_session_requires_engine(self):
+        """Test that thread sessions need an initialized database."""
+        with pytest.raises(RuntimeError):
+            DatabaseManager('sqlite://').get_thread_session()
\ No newline at end of file
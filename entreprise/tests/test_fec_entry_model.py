@@ -354,6 +354,69 @@ class TestFECEntryModel:
         assert export_data['Debit'] == '20007,25'
 
 
+class TestFECEntryBatchValidation:
+    """Test cases for validating plain rows before a bulk insert."""
+    
+    def test_validate_batch_fills_defaults(self, sample_fec_data):
+        """Test valid rows pass and get the validators' defaults."""
+        row = dict(sample_fec_data, journal_code='', credit=None)
+        FECEntry.validate_batch([row])
+        
+        assert row['journal_code'] == 'BIN'
+        assert row['credit'] == ''
+        assert row['date_let'] == ''
+        assert row['debit'] == '20007,25'
+    
+    @pytest.mark.parametrize('field, value, message', [
+        ('ecriture_date', '2023-03-18', 'ecriture_date must be in YYYYMMDD format'),
+        ('ecriture_num', 0, 'Ecriture number must be positive'),
+        ('compte_num', '', r'Account number \(compte_num\) is required'),
+        ('ecriture_lib', 'x' * 201, 'Entry description cannot exceed 200 characters'),
+        ('debit', '-5', 'debit amount cannot be negative'),
+        ('credit', '1e5', 'Invalid credit amount format: 1e5'),
+    ])
+    def test_validate_batch_reports_row(self, sample_fec_data, field, value, message):
+        """Test the first invalid row is reported with its index."""
+        rows = [dict(sample_fec_data), dict(sample_fec_data, **{field: value})]
+        with pytest.raises(ValueError, match=f"Row 1: {message}"):
+            FECEntry.validate_batch(rows)
+    
+    @pytest.mark.parametrize('amount', ['1E5', '.5', '100.', '1 000'])
+    def test_validate_batch_matches_attribute_validator(self, sample_fec_data, amount):
+        """Test amounts rejected in a batch are rejected on the model too."""
+        with pytest.raises(ValueError, match="Invalid debit amount format"):
+            FECEntry.validate_batch([dict(sample_fec_data, debit=amount)])
+        with pytest.raises(ValueError, match="Invalid debit amount format"):
+            FECEntry(debit=amount)
+
+
+class TestFECExport:
+    """Test cases for exporting FEC entries to a file."""
+    
+    def test_export_to_tsv(self, db_session, sample_fec_data, tmp_path):
+        """Test entries are written in date and number order with FEC headers."""
+        rows = [
+            dict(sample_fec_data, transaction_id=1, ecriture_num=num, ecriture_date=date)
+            for num, date in ((3, '20230320'), (2, '20230318'), (1, '20230318'))
+        ]
+        FECEntry.validate_batch(rows)
+        FECEntry.bulk_insert(db_session, rows)
+        db_session.commit()
+        
+        path = tmp_path / 'fec.txt'
+        assert FECEntry.export_to_tsv(db_session, path) == 3
+        
+        lines = path.read_bytes().decode('utf-8').split('\r\n')
+        header = lines[0].split('\t')
+        assert header[:4] == ['JournalCode', 'JournalLib', 'EcritureNum', 'EcritureDate']
+        assert len(header) == 25
+        assert [line.split('\t')[2] for line in lines[1:4]] == ['1', '2', '3']
+        assert lines[4] == ''
+        
+        entry = db_session.query(FECEntry).filter_by(ecriture_num=1).one()
+        assert lines[1].split('\t') == list(entry.format_for_export().values())
+
+
 class TestFECEntryBuilder:
     """Test cases for the FECEntryBuilder."""
     
@@ -423,6 +486,29 @@ class TestFECEntryBuilder:
         assert fec_entry.adresse_source == 'addr1'
         assert fec_entry.adresse_destination == 'addr2'
     
+    def test_bulk_insert_from_builder_rows(self, db_session):
+        """Test builder rows are bulk inserted with column defaults applied."""
+        rows = [
+            (FECEntryBuilder(1)
+             .with_ecriture(num, '20230318', f'Entry {num}')
+             .with_account('5220011005', 'Test Account')
+             .with_piece('TEST', '20230318')
+             .with_debit('10,00')
+             .to_dict())
+            for num in range(1, 6)
+        ]
+        
+        assert FECEntry.bulk_insert(db_session, rows, chunk_size=2) == 5
+        db_session.commit()
+        
+        entries = db_session.query(FECEntry).order_by(FECEntry.ecriture_num).all()
+        assert [entry.ecriture_num for entry in entries] == [1, 2, 3, 4, 5]
+        assert entries[0].journal_code == 'BIN'
+        assert entries[0].nom_plateforme_blockchain == 'binance'
+        assert entries[0].credit == ''
+        assert entries[0].created_at is not None
+        assert entries[0].transaction_id == 1
+    
     def test_repr_method(self, db_session, sample_transaction, sample_fec_data):
         """Test string representation of FEC entry."""
         sample_fec_data['transaction_id'] = sample_transaction.id